@@ -1,4 +1,5 @@
 from sp.core.geometry import BoundBox, GpsPoint, create_grid_points
+from sp.core.geometry.point import gps
 from sp.core.util import random as sp_rnd
 from glob import glob
 from collections import defaultdict
@@ -372,6 +373,7 @@ def gen_grid_bs_network(bbox, distance=2000.0, tol=200.0):
 
     # Set the base station's properties
     json_data = {'nodes': [], 'links': []}
+    bs_distances = gps.calc_distance_matrix(bs_points)
     for (i_1, p_1) in enumerate(bs_points):
         pos = {'lat': p_1.lat, 'lon': p_1.lon}
         bs_node = {'id': i_1, 'position': pos}
@@ -380,7 +382,7 @@ def gen_grid_bs_network(bbox, distance=2000.0, tol=200.0):
         # Connect nearby base stations
         for i_2 in range(i_1 + 1, len(bs_points)):
             p_2 = bs_points[i_2]
-            p_dist = p_1.distance(p_2)
+            p_dist = float(bs_distances[i_1, i_2])
             if p_1 != p_2 and p_dist <= distance + tol:
                 link = {'nodes': (i_1, i_2), 'distance': p_dist}
                 json_data['links'].append(link)
@@ -1,4 +1,4 @@
 from .point import Point, GpsPoint, CartesianPoint
 from .bound_box import BoundBox
 from .grid import create_grid_points
-
+from .spatial_index import SpatialIndex
@@ -1,16 +1,35 @@
 from .point import Point
+import numpy as np
 import warnings
 with warnings.catch_warnings():
     warnings.simplefilter("ignore", category=DeprecationWarning)
     from pygeodesy.ellipsoidalNvector import LatLon
 
+EARTH_RADIUS = LatLon(0.0, 0.0).datum.ellipsoid.R1
+"""Earth's mean radius (in meters) used by :py:meth:`GpsPoint.distance`"""
+
+NVECTOR = "nvector"
+"""Distance method of pygeodesy's n-vector points"""
+
+HAVERSINE = "haversine"
+"""Distance method of the haversine formula. It uses the same spherical earth model of :py:data:`NVECTOR`"""
+
+EQUIRECTANGULAR = "equirectangular"
+"""Distance method of the equirectangular projection. It is the fastest one, but only accurate for short distances"""
+
 
 class GpsPoint(Point):
     """GPS Position
+
+    Attributes:
+        distance_method (str): method used by :py:meth:`distance` and :py:meth:`intermediate`.
+            Possible values are :py:data:`NVECTOR` (default), :py:data:`HAVERSINE` and :py:data:`EQUIRECTANGULAR`.
+            It can be changed for all points by setting the class attribute
     """
 
     LON_INDEX = 0
     LAT_INDEX = 1
+    distance_method = NVECTOR
 
     def __init__(self, lon=0.0, lat=0.0):
         """Initialization
@@ -108,6 +127,8 @@ class GpsPoint(Point):
         """
         if not isinstance(other, GpsPoint):
             raise TypeError
+        if self.distance_method != NVECTOR:
+            return float(calc_distances(self.lon_lat, other.lon_lat, method=self.distance_method))
         s = LatLon(*self.lat_lon)
         d = LatLon(*other.lat_lon)
         return s.distanceTo(d)
@@ -127,6 +148,16 @@ class GpsPoint(Point):
 
         if not isinstance(other, GpsPoint):
             raise TypeError
+        if self.distance_method == EQUIRECTANGULAR:
+            # The longitude follows the shortest arc, as in :py:func:`calc_distances`
+            delta_lon = (other.lon - self.lon + 180.0) % 360.0 - 180.0
+            lon = (self.lon + delta_lon * fraction + 180.0) % 360.0 - 180.0
+            lat = self.lat + (other.lat - self.lat) * fraction
+            return GpsPoint(lon=float(lon), lat=float(lat))
+        elif self.distance_method == HAVERSINE:
+            n_vectors = to_n_vectors([self.lon_lat, other.lon_lat])
+            lon, lat = from_n_vectors(n_vectors[0] + (n_vectors[1] - n_vectors[0]) * fraction)
+            return GpsPoint(lon=float(lon), lat=float(lat))
         s = LatLon(*self.lat_lon)
         d = LatLon(*other.lat_lon)
         inter_p = s.intermediateTo(d, fraction)
@@ -192,5 +223,84 @@ def from_json(json_data):
     return GpsPoint(lon=lon, lat=lat)
 
 
+def to_array(points):
+    """Convert GPS points to an array of positions
+
+    Args:
+        points (list(GpsPoint)): GPS points
+    Returns:
+        numpy.ndarray: positions (points x 2) as (longitude, latitude) in degrees
+    """
+    return np.array([p.lon_lat for p in points], dtype=float).reshape(-1, 2)
 
 
+def to_n_vectors(lon_lat):
+    """Convert positions to n-vectors, i.e., unit vectors normal to the earth's surface
+
+    Args:
+        lon_lat (numpy.ndarray): positions (... x 2) as (longitude, latitude) in degrees
+    Returns:
+        numpy.ndarray: n-vectors (... x 3)
+    """
+    lon_lat = np.radians(np.asarray(lon_lat, dtype=float))
+    lon, lat = lon_lat[..., 0], lon_lat[..., 1]
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def from_n_vectors(n_vectors):
+    """Convert n-vectors to positions. Vectors do not need to be normalized
+
+    Args:
+        n_vectors (numpy.ndarray): n-vectors (... x 3)
+    Returns:
+        numpy.ndarray: positions (... x 2) as (longitude, latitude) in degrees
+    """
+    n_vectors = np.asarray(n_vectors, dtype=float)
+    x, y, z = n_vectors[..., 0], n_vectors[..., 1], n_vectors[..., 2]
+    return np.degrees(np.stack([np.arctan2(y, x), np.arctan2(z, np.hypot(x, y))], axis=-1))
+
+
+def calc_distances(lon_lat_1, lon_lat_2, method=HAVERSINE):
+    """Calculate distances (in meters) between arrays of positions.
+    Arrays are broadcast against each other, e.g., ``lon_lat_1[:, None]`` and ``lon_lat_2[None, :]``
+    give the distance matrix
+
+    Args:
+        lon_lat_1 (numpy.ndarray): positions (... x 2) as (longitude, latitude) in degrees
+        lon_lat_2 (numpy.ndarray): positions (... x 2) as (longitude, latitude) in degrees
+        method (str): :py:data:`HAVERSINE` or :py:data:`EQUIRECTANGULAR`.
+            :py:data:`NVECTOR` is calculated as :py:data:`HAVERSINE`, since both use the same earth model
+    Returns:
+        numpy.ndarray: distances
+    Raises:
+        ValueError: invalid method
+    """
+    lon_lat_1 = np.radians(np.asarray(lon_lat_1, dtype=float))
+    lon_lat_2 = np.radians(np.asarray(lon_lat_2, dtype=float))
+    lon_1, lat_1 = lon_lat_1[..., 0], lon_lat_1[..., 1]
+    lon_2, lat_2 = lon_lat_2[..., 0], lon_lat_2[..., 1]
+    delta_lon = np.remainder(lon_2 - lon_1 + np.pi, 2.0 * np.pi) - np.pi
+
+    if method in (HAVERSINE, NVECTOR):
+        h = np.sin((lat_2 - lat_1) / 2.0) ** 2 + np.cos(lat_1) * np.cos(lat_2) * np.sin(delta_lon / 2.0) ** 2
+        return 2.0 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+    elif method == EQUIRECTANGULAR:
+        x = delta_lon * np.cos((lat_1 + lat_2) / 2.0)
+        return EARTH_RADIUS * np.hypot(x, lat_2 - lat_1)
+    else:
+        raise ValueError("Invalid distance method {}".format(method))
+
+
+def calc_distance_matrix(points_1, points_2=None, method=HAVERSINE):
+    """Calculate the distances (in meters) between all pairs of GPS points
+
+    Args:
+        points_1 (list(GpsPoint)): GPS points
+        points_2 (list(GpsPoint)): GPS points. If None, ``points_1`` is used
+        method (str): distance method, see :py:func:`calc_distances`
+    Returns:
+        numpy.ndarray: distances (len(points_1) x len(points_2))
+    """
+    lon_lat_1 = to_array(points_1)
+    lon_lat_2 = to_array(points_2) if points_2 is not None else lon_lat_1
+    return calc_distances(lon_lat_1[:, np.newaxis], lon_lat_2[np.newaxis, :], method=method)
@@ -0,0 +1,156 @@
+from .point import GpsPoint
+from .point.gps import EARTH_RADIUS, to_array, to_n_vectors
+from scipy.spatial import cKDTree
+import numpy as np
+import math
+
+NEIGHBOR_TOLERANCE = 1e-9
+"""Relative tolerance added to the search radius of the nearest points, so rounding errors do not exclude them"""
+
+
+class SpatialIndex:
+    """Spatial Index of Points
+
+    It answers nearest point queries in logarithmic time with a KD-tree.
+    Cartesian points are indexed by their coordinates.
+    GPS points are indexed by their n-vectors scaled by the earth's mean radius.
+    Since the chord between two n-vectors grows with their angle,
+    nearest points in the tree are also the nearest ones by :py:meth:`GpsPoint.distance`
+
+    Attributes:
+        points (list(Point)): indexed points
+    """
+
+    def __init__(self, points):
+        """Initialization
+
+        Args:
+            points (list(Point)): points of the same coordinate system
+        """
+        self.points = list(points)
+        self._is_gps = len(self.points) > 0 and isinstance(self.points[0], GpsPoint)
+        self._coords = self._to_coordinates(self.points)
+        self._tree = cKDTree(self._coords) if len(self.points) > 0 else None
+
+    def __len__(self):
+        """Number of indexed points
+
+        Returns:
+            int: number of points
+        """
+        return len(self.points)
+
+    def _to_coordinates(self, points):
+        """Convert points to coordinates of the KD-tree
+
+        Args:
+            points (list(Point)): points
+        Returns:
+            numpy.ndarray: coordinates (points x dimensions)
+        """
+        if not self._is_gps:
+            return np.array([p.values for p in points], dtype=float)
+
+        return EARTH_RADIUS * to_n_vectors(to_array(points))
+
+    def _to_distance(self, tree_distance):
+        """Convert distances in the KD-tree to distances between points
+
+        Args:
+            tree_distance (numpy.ndarray): distances in the KD-tree
+        Returns:
+            numpy.ndarray: distances between points
+        """
+        if not self._is_gps:
+            return tree_distance
+        ratio = np.minimum(tree_distance / (2.0 * EARTH_RADIUS), 1.0)
+        return 2.0 * EARTH_RADIUS * np.arcsin(ratio)
+
+    def _to_tree_distance(self, distance):
+        """Convert distances between points to distances in the KD-tree
+
+        Args:
+            distance (numpy.ndarray): distances between points
+        Returns:
+            numpy.ndarray: distances in the KD-tree
+        """
+        if not self._is_gps:
+            return distance
+        angle = np.minimum(distance / EARTH_RADIUS, math.pi)
+        return 2.0 * EARTH_RADIUS * np.sin(angle / 2.0)
+
+    def nearest(self, points, max_distance=math.inf, distance_tolerance=0.0):
+        """Find the nearest indexed point of each point.
+
+        Indexed points are checked in order and the current nearest one is replaced when a point is
+        closer than it plus the distance tolerance, as the linear search of
+        :py:class:`sp.physical_system.coverage.circle.CircleCoverage` does.
+        Only the points that such replacements can reach from the nearest distance are checked
+
+        Args:
+            points (list(Point)): query points. None values are not searched
+            max_distance (float): maximum distance between a point and its nearest indexed point
+            distance_tolerance (float): distance tolerance
+        Returns:
+            list(int): index of the nearest indexed point of each query point, or None if there is none
+        """
+        result = [None] * len(points)
+        queries = [i for (i, p) in enumerate(points) if p is not None]
+        if self._tree is None or len(queries) == 0:
+            return result
+
+        coords = self._to_coordinates([points[i] for i in queries])
+        tree_dist, _ = self._tree.query(coords, k=1)
+        min_dist = self._to_distance(tree_dist)
+        found = min_dist <= max_distance + distance_tolerance
+        if not np.any(found):
+            return result
+
+        max_radius = max_distance + distance_tolerance
+        queries = np.asarray(queries)[found]
+        coords = coords[found]
+        radius = np.minimum(min_dist[found] + distance_tolerance, max_radius)
+        neighbors = self._tree.query_ball_point(coords, self._to_search_radius(radius))
+        for (query_index, coord, r, candidates) in zip(queries, coords, radius, neighbors):
+            nearest, reach = self._search_in_order(coord, candidates, max_distance, distance_tolerance)
+            # Replacements may reach points outside the searched radius, so it is enlarged until they do not
+            while reach > r and r < max_radius:
+                r = min(reach, max_radius)
+                candidates = self._tree.query_ball_point(coord, self._to_search_radius(r))
+                nearest, reach = self._search_in_order(coord, candidates, max_distance, distance_tolerance)
+            result[query_index] = nearest
+        return result
+
+    def _to_search_radius(self, distance):
+        """Convert distances between points to search radius in the KD-tree, including rounding errors
+
+        Args:
+            distance (numpy.ndarray): distances between points
+        Returns:
+            numpy.ndarray: search radius
+        """
+        return self._to_tree_distance(distance) * (1.0 + NEIGHBOR_TOLERANCE) + NEIGHBOR_TOLERANCE
+
+    def _search_in_order(self, coord, candidates, max_distance, distance_tolerance):
+        """Linear search of the nearest point among candidates in their index order
+
+        Args:
+            coord (numpy.ndarray): coordinates of the query point
+            candidates (list(int)): indexes of the candidate points
+            max_distance (float): maximum distance
+            distance_tolerance (float): distance tolerance
+        Returns:
+            tuple: index of the nearest point (or None) and the maximum distance that a next point
+                needs to replace a selected point
+        """
+        candidates = sorted(candidates)
+        dist = self._to_distance(np.linalg.norm(self._coords[candidates] - coord, axis=1))
+        nearest = None
+        nearest_dist = math.inf
+        reach = 0.0
+        for (index, value) in zip(candidates, dist):
+            if value < nearest_dist + distance_tolerance and value <= max_distance + distance_tolerance:
+                nearest = index
+                nearest_dist = value
+                reach = max(reach, value + distance_tolerance)
+        return nearest, reach
@@ -1,32 +1,28 @@
+from sp.core.util.worker_pool import WorkerPool
+from sp.core.util.lru_cache import LRUCache
 import random
 from collections import UserList
 from abc import ABC, abstractmethod
-import multiprocessing as mp
+import hashlib
+import numpy as np
 import time
 
-_brkga = None
+CACHE_KEY_DECIMALS = 9
+"""Number of decimals of the genes used to identify duplicated chromosomes in the fitness cache"""
 
 
-def _init_pool(genetic_algo):
-    """Initialize a sub-process to calculate an individual fitness
-
-    Args:
-        genetic_algo (BRKGA): a genetic algorithm object
-    """
-    global _brkga
-    _brkga = genetic_algo
-
-
-def _evaluate(indiv):
-    """Evaluate an individual and obtain its fitness
+def _evaluate(operator, indiv):
+    """Evaluate an individual and obtain its fitness in a worker process
 
     Args:
+        operator (GAOperator): genetic operator
         indiv (GAIndividual): individual
     Returns:
         object: fitness value
     """
-    global _brkga
-    return _brkga.evaluate(indiv)
+    if indiv.is_fitness_valid():
+        return indiv.fitness
+    return operator.evaluate(indiv)
 
 
 class BRKGA:
@@ -43,6 +39,14 @@ class BRKGA:
         elite_probability (float): probability of a elite gene to be selected during crossover
         timeout (float): timeout in seconds to stop the execution of the genetic algorithm
         pool_size (int): number of processes for parallelisms
+        pool (WorkerPool): persistent worker pool borrowed by the genetic algorithm.
+            If None, a pool with ``pool_size`` processes is created for each execution
+        cache_size (int): maximum number of fitness values cached during an execution.
+            Individuals with the same key (see :py:meth:`GAOperator.cache_key`) are evaluated only once.
+            If zero, the fitness is not cached
+        vectorized (bool): whether the random keys of mutants and the offspring of a generation are generated
+            at once with NumPy arrays (see :py:meth:`GAOperator.rand_population` and
+            :py:meth:`GAOperator.crossover_population`) or individual by individual
 
     """
 
@@ -54,7 +58,10 @@ class BRKGA:
                  mutant_proportion,
                  elite_probability=None,
                  timeout=None,
-                 pool_size=0):
+                 pool_size=0,
+                 pool=None,
+                 cache_size=0,
+                 vectorized=False):
         """Initialization
         """
 
@@ -78,9 +85,13 @@ class BRKGA:
         self._last_perf_count = None
 
         self.pool_size = pool_size
+        self.pool = pool
         self._pool = None
-        self._map_func = None
-        self._evaluate_func = None
+        self._pool_key = None
+
+        self.cache_size = cache_size
+        self._cache = None
+        self.vectorized = vectorized
 
     def __del__(self):
         """Finalizer
@@ -97,45 +108,40 @@ class BRKGA:
         self._mutant_size = int(round(self.mutant_proportion * self.population_size))
         self._elapsed_time = 0.0
         self._last_perf_count = time.perf_counter()
-        self._init_pool()
         self.current_population = list()
+        self._cache = LRUCache(self.cache_size) if self.cache_size > 0 else None
         self.operator.init_params()
+        self._init_pool()
 
     def clear_params(self):
         """Clear parameters after the execution of the genetic algorithm
         """
         self._last_perf_count = None
+        self._cache = None
         self._clear_pool()
 
     def _init_pool(self):
-        """Initialize the multiprocessing pool
+        """Initialize the worker pool and push the genetic operator to its workers
         """
         self._clear_pool()
 
-        self._pool = None
-        self._map_func = map
-        self._evaluate_func = self.evaluate
-        if self.pool_size > 0:
-            try:
-                # Require UNIX fork to work
-                mp_ctx = mp.get_context("fork")
-                self.pool_size = min(self.pool_size, mp_ctx.cpu_count())
-                self._pool = mp_ctx.Pool(processes=self.pool_size,
-                                         initializer=_init_pool,
-                                         initargs=[self])
-                self._map_func = self._pool.map
-                self._evaluate_func = _evaluate
-            except ValueError:
-                pass
+        self._pool = self.pool
+        if self._pool is None and self.pool_size > 0:
+            self._pool = WorkerPool(self.pool_size)
+        if self._pool is not None:
+            self._pool_key = self._pool.set_context(self.operator)
 
     def _clear_pool(self):
-        """Terminate the multiprocessing pool
+        """Release the genetic operator from the worker pool.
+        The pool is terminated only if it is not borrowed
         """
         if self._pool is not None:
-            self._pool.terminate()
-            self._pool = None
-            self._map_func = None
-            self._evaluate_func = None
+            if self._pool_key is not None:
+                self._pool.release_context(self._pool_key)
+            if self._pool is not self.pool:
+                self._pool.close()
+        self._pool = None
+        self._pool_key = None
 
     def should_stop(self, population):
         """Verify whether the GA should stop or not
@@ -176,6 +182,18 @@ class BRKGA:
         """
         return self.operator.rand_individual()
 
+    def rand_population(self, size):
+        """Generate random individuals
+
+        Args:
+            size (int): number of individuals
+        Returns:
+            list(GAIndividual): new random individuals
+        """
+        if self.vectorized:
+            return self.operator.rand_population(size)
+        return [self.rand_individual() for _ in range(size)]
+
     def first_population(self, apply_selection=True):
         """Generate the individuals of the first generation
 
@@ -190,7 +208,7 @@ class BRKGA:
         # Complete the population with random individuals
         rand_size = self.population_size - len(pop)
         if rand_size > 0:
-            pop += [self.rand_individual() for _ in range(rand_size)]
+            pop += self.rand_population(rand_size)
 
         # Apply selection operation if necessary
         if apply_selection:
@@ -221,10 +239,39 @@ class BRKGA:
         Returns:
             list: list of fitness
         """
-        fitnesses = list(self._map_func(self._evaluate_func, population))
-        for (fitness, individual) in zip(fitnesses, population):
+        pending = [indiv for indiv in population if not indiv.is_fitness_valid()]
+        duplicates = None
+        if self._cache is not None:
+            # Look up the cache and keep only one individual per key
+            duplicates = {}
+            unique = []
+            for indiv in pending:
+                key = self.operator.cache_key(indiv)
+                fitness = self._cache.get(key)
+                if fitness is not None:
+                    indiv.fitness = fitness
+                elif key in duplicates:
+                    duplicates[key].append(indiv)
+                else:
+                    duplicates[key] = [indiv]
+                    unique.append(indiv)
+            pending = unique
+
+        if self._pool is not None and self._pool.is_parallel:
+            fitnesses = self._pool.map(_evaluate, pending, self._pool_key)
+        else:
+            fitnesses = list(map(self.evaluate, pending))
+        for (fitness, individual) in zip(fitnesses, pending):
             individual.fitness = fitness
-        return fitnesses
+
+        if duplicates is not None:
+            for (key, individuals) in duplicates.items():
+                fitness = individuals[0].fitness
+                self._cache.put(key, fitness)
+                for indiv in individuals[1:]:
+                    indiv.fitness = fitness
+
+        return [indiv.fitness for indiv in population]
 
     def sort_population(self, population):
         """Sorts individuals by their fitness value
@@ -262,6 +309,33 @@ class BRKGA:
         """
         return self.operator.crossover(indiv_1, indiv_2, prob_1, prob_2)
 
+    def crossover_population(self, elite, non_elite, nb_offspring):
+        """Create offspring by crossover between random pairs of elite and non-elite individuals
+
+        Args:
+            elite (list(GAIndividual)): elite individuals
+            non_elite (list(GAIndividual)): non-elite individuals
+            nb_offspring (int): minimum number of offspring
+        Returns:
+            list(GAIndividual): offspring
+        """
+        nb_pairs = (nb_offspring + 1) // 2
+        if nb_pairs <= 0:
+            return []
+
+        prob_1, prob_2 = self.elite_probability, 1.0 - self.elite_probability
+        if self.vectorized:
+            parents_1 = [elite[i] for i in np.random.randint(len(elite), size=nb_pairs)]
+            parents_2 = [non_elite[i] for i in np.random.randint(len(non_elite), size=nb_pairs)]
+            return self.operator.crossover_population(parents_1, parents_2, prob_1, prob_2)
+
+        offspring = []
+        for _ in range(nb_pairs):
+            indiv_1 = random.choice(elite)
+            indiv_2 = random.choice(non_elite)
+            offspring += self.crossover(indiv_1, indiv_2, prob_1, prob_2)
+        return offspring
+
     def mutate_population(self, population):
         """Mutate individuals in a population
 
@@ -288,20 +362,15 @@ class BRKGA:
         next_population += elite
 
         # Get random mutant individuals
-        mutants = [self.rand_individual() for _ in range(self._mutant_size)]
+        mutants = self.rand_population(self._mutant_size)
         next_population += mutants
 
         # Get individuals by crossover operation
         non_elite = population[self._elite_size:]
         if self._elite_size == 0:
             elite = non_elite
-        while len(next_population) < self.population_size:
-            indiv_1 = random.choice(elite)
-            indiv_2 = random.choice(non_elite)
-            offspring = self.crossover(indiv_1, indiv_2,
-                                       self.elite_probability,
-                                       1.0 - self.elite_probability)
-            next_population += offspring
+        nb_offspring = self.population_size - len(next_population)
+        next_population += self.crossover_population(elite, non_elite, nb_offspring)
 
         # Mutate individuals
         population = self.mutate_population(population)
@@ -426,6 +495,22 @@ class GAOperator(ABC):
         data = [random.random() for _ in range(self.nb_genes)]
         return GAIndividual(data)
 
+    def rand_population(self, size):
+        """Generate random individuals.
+        The random keys of all individuals are generated at once,
+        unless :py:meth:`rand_individual` is overridden
+
+        Args:
+            size (int): number of individuals
+        Returns:
+            list(GAIndividual): new random individuals
+        """
+        if type(self).rand_individual is not GAOperator.rand_individual:
+            return [self.rand_individual() for _ in range(size)]
+
+        keys = np.random.random_sample((size, self.nb_genes))
+        return [GAIndividual(data) for data in keys.tolist()]
+
     def first_population(self):
         """Generate some individuals for the first population.
         It is used to add bootstrap individual
@@ -473,6 +558,41 @@ class GAOperator(ABC):
 
         return [offspring_1, offspring_2]
 
+    def crossover_population(self, parents_1, parents_2, prob_1, prob_2):
+        """Execute the crossover operation for many pairs of individuals.
+        The pairs are crossed at once with NumPy arrays, unless :py:meth:`crossover` is overridden
+
+        Args:
+            parents_1 (list(GAIndividual)): first individual of each pair
+            parents_2 (list(GAIndividual)): second individual of each pair
+            prob_1 (float): value in [0, 1] is the probability of a first individual's gene being chosen
+            prob_2 (float): value in [0, 1] is the probability of a second individual's gene being chosen
+        Returns:
+            list: list of offspring, two for each pair
+        """
+        if type(self).crossover is not GAOperator.crossover:
+            offspring = []
+            for (indiv_1, indiv_2) in zip(parents_1, parents_2):
+                offspring += self.crossover(indiv_1, indiv_2, prob_1, prob_2)
+            return offspring
+
+        nb_pairs = min(len(parents_1), len(parents_2))
+        if nb_pairs == 0:
+            return []
+        if prob_1 < prob_2:
+            parents_1, parents_2 = parents_2, parents_1
+            prob_1, prob_2 = prob_2, prob_1
+
+        genes_1 = np.array([indiv.data for indiv in parents_1[:nb_pairs]])
+        genes_2 = np.array([indiv.data for indiv in parents_2[:nb_pairs]])
+        swap = np.random.random_sample(genes_1.shape) > prob_1
+
+        # Offspring of the same pair are adjacent, as in the serial crossover
+        offspring = np.empty((2 * nb_pairs, genes_1.shape[1]), dtype=np.result_type(genes_1, genes_2))
+        offspring[0::2] = np.where(swap, genes_2, genes_1)
+        offspring[1::2] = np.where(swap, genes_1, genes_2)
+        return [GAIndividual(data) for data in offspring.tolist()]
+
     def should_stop(self, population):
         """Verify whether the GA should stop or not
 
@@ -483,6 +603,18 @@ class GAOperator(ABC):
         """
         return False
 
+    def cache_key(self, individual):
+        """Get the key that identifies an individual in the fitness cache.
+        By default, it is a digest of the chromosome with genes rounded to :py:data:`CACHE_KEY_DECIMALS` decimals
+
+        Args:
+            individual (GAIndividual): individual
+        Returns:
+            bytes: key
+        """
+        genes = np.round(np.asarray(individual.data, dtype=np.float64), CACHE_KEY_DECIMALS)
+        return hashlib.blake2b(genes.tobytes(), digest_size=16).digest()
+
     @abstractmethod
     def evaluate(self, individual):
         """Evaluate an individual and obtain its fitness
@@ -1,10 +1,12 @@
-from functools import cmp_to_key
 from sp.core.heuristic.brkga import BRKGA, GAIndividual, GAOperator
+import numpy as np
 import math
 
 # MAX_CRWD_DIST = 1.0
 MAX_CRWD_DIST = math.inf
 
+_DOMINANCE_MATRIX_FUNCS = {}
+
 
 def pareto_dominates(fitness_1, fitness_2):
     """Check if the first individual dominates the second individual based on their fitness.
@@ -93,19 +95,12 @@ class NSGAII(BRKGA):
             prev_fitnesses = self._previous_nd_fitness
             curr_fitnesses = self._current_nd_fitness
 
-            prev_count = 0
-            curr_count = 0
-            for prev_fit in prev_fitnesses:
-                for curr_fit in curr_fitnesses:
-                    if self.dominance_func(curr_fit, prev_fit):
-                        prev_count += 1
-                        break
-
-            for curr_fit in curr_fitnesses:
-                for prev_fit in prev_fitnesses:
-                    if self.dominance_func(prev_fit, curr_fit):
-                        curr_count += 1
-                        break
+            # Elements (p, q): current individual p dominates previous individual q
+            curr_dominates = dominance_matrix(curr_fitnesses, self.dominance_func, prev_fitnesses)
+            # Elements (p, q): previous individual p dominates current individual q
+            prev_dominates = dominance_matrix(prev_fitnesses, self.dominance_func, curr_fitnesses)
+            prev_count = int(np.count_nonzero(curr_dominates.any(axis=0)))
+            curr_count = int(np.count_nonzero(prev_dominates.any(axis=0)))
 
             mdr = (prev_count / float(len(prev_fitnesses))
                    - curr_count / float(len(curr_fitnesses)))
@@ -132,22 +127,80 @@ class NSGAII(BRKGA):
         self._previous_nd_fitness = self._current_nd_fitness
         self._current_nd_fitness = list(map(lambda i: fitnesses[i], fronts[0]))
 
-        def sort_cmp(indiv_1, indiv_2):
-            index_1 = population.index(indiv_1)
-            index_2 = population.index(indiv_2)
-            if rank[index_1] < rank[index_2]:
-                return -1
-            elif (rank[index_1] == rank[index_2]
-                  and crwd_dist[index_1] > crwd_dist[index_2]):
-                return -1
-            else:
-                return 1
+        order = sort_by_rank_and_crowding(rank, crwd_dist)
+        return [population[i] for i in order]
+
+
+def dominance_matrix_func(dominance_func):
+    """Decorator that registers a vectorized version of a dominance operator.
+    The decorated function receives two NumPy arrays (individuals x objectives) and
+    returns a boolean matrix ``D`` where ``D[p, q]`` is True if
+    individual ``p`` of the first array dominates individual ``q`` of the second array
+
+    Args:
+        dominance_func (function): dominance operator function
+    Returns:
+        function: decorator
+    """
+    def decorator(matrix_func):
+        _DOMINANCE_MATRIX_FUNCS[dominance_func] = matrix_func
+        return matrix_func
+
+    return decorator
+
+
+def dominance_matrix(fitnesses, dominance_func=pareto_dominates, other_fitnesses=None):
+    """Calculate the dominance relation between all pairs of individuals.
+    It uses the vectorized version of the dominance operator if it is registered with
+    :py:func:`dominance_matrix_func`
+
+    Args:
+        fitnesses (list): fitness of each individual in a population
+        dominance_func (function): dominance operator function
+        other_fitnesses (list): fitness of each individual in another population.
+            If None, individuals of the same population are compared
+    Returns:
+        numpy.ndarray: boolean matrix where the element (p, q) is True if individual p dominates individual q
+    """
+    same_population = other_fitnesses is None
+    if same_population:
+        other_fitnesses = fitnesses
+
+    size_p, size_q = len(fitnesses), len(other_fitnesses)
+    matrix_func = _DOMINANCE_MATRIX_FUNCS.get(dominance_func, None)
+    if matrix_func is not None and size_p > 0 and size_q > 0:
+        fit_p = np.asarray(fitnesses, dtype=np.float64)
+        fit_q = fit_p if same_population else np.asarray(other_fitnesses, dtype=np.float64)
+        dominates = matrix_func(fit_p, fit_q)
+    else:
+        dominates = np.zeros((size_p, size_q), dtype=bool)
+        for p in range(size_p):
+            for q in range(size_q):
+                if not same_population or p != q:
+                    dominates[p, q] = dominance_func(fitnesses[p], other_fitnesses[q])
+    if same_population:
+        np.fill_diagonal(dominates, False)
+    return dominates
+
 
-        return sorted(population, key=cmp_to_key(sort_cmp))
+@dominance_matrix_func(pareto_dominates)
+def pareto_dominance_matrix(fitnesses_1, fitnesses_2):
+    """Vectorized version of :py:func:`pareto_dominates`
+
+    Args:
+        fitnesses_1 (numpy.ndarray): fitness of each individual of the first population (individuals x objectives)
+        fitnesses_2 (numpy.ndarray): fitness of each individual of the second population (individuals x objectives)
+    Returns:
+        numpy.ndarray: boolean matrix where the element (p, q) is True if individual p dominates individual q
+    """
+    fit_p = fitnesses_1[:, np.newaxis, :]
+    fit_q = fitnesses_2[np.newaxis, :, :]
+    return ~np.any(fit_p > fit_q, axis=2) & np.any(fit_p < fit_q, axis=2)
 
 
 def fast_non_dominated_sort(fitnesses, dominance_func=pareto_dominates):
-    """Fast non-dominated sorting algorithm
+    """Fast non-dominated sorting algorithm.
+    The fronts are peeled from the dominance matrix (see :py:func:`dominance_matrix`)
 
     Args:
         fitnesses (list): fitness of each individual in a population
@@ -156,45 +209,37 @@ def fast_non_dominated_sort(fitnesses, dominance_func=pareto_dominates):
         (list, list): fronts, rank
     """
     pop_size = len(fitnesses)
-    r_pop_size = list(range(pop_size))
-    S = [[] for _ in r_pop_size]
-    n = [0 for _ in r_pop_size]
-    rank = [0 for _ in r_pop_size]
-    fronts = [[]]
-
-    test = [[] for _ in r_pop_size]
-
-    for p in r_pop_size:
-        S[p] = []
-        n[p] = 0
-        for q in r_pop_size:
-            if dominance_func(fitnesses[p], fitnesses[q]):
-                if q not in S[p]:
-                    S[p].append(q)
-            elif dominance_func(fitnesses[q], fitnesses[p]):
-                n[p] = n[p] + 1
-                if q not in test[p]:
-                    test[p].append(q)
-        if n[p] == 0:
-            rank[p] = 0
-            if p not in fronts[0]:
-                fronts[0].append(p)
-
-    i = 0
-    while len(fronts[i]) > 0:
-        Q = []
-        for p in fronts[i]:
-            for q in S[p]:
-                n[q] = n[q] - 1
-                if n[q] == 0:
-                    rank[q] = i + 1
-                    if q not in Q:
-                        Q.append(q)
-        i = i + 1
-        fronts.append(Q)
-
-    del fronts[len(fronts) - 1]
-    return fronts, rank
+    dominates = dominance_matrix(fitnesses, dominance_func).astype(np.int64)
+
+    # Number of individuals that dominate each individual
+    nb_dominators = dominates.sum(axis=0)
+    rank = np.zeros(pop_size, dtype=np.int64)
+    fronts = []
+
+    front = np.flatnonzero(nb_dominators == 0)
+    while len(front) > 0:
+        rank[front] = len(fronts)
+        fronts.append(front.tolist())
+        # Remove the current front and its individuals from the unsorted ones
+        nb_dominators[front] = -1
+        nb_dominators -= dominates[front].sum(axis=0)
+        front = np.flatnonzero(nb_dominators == 0)
+
+    return fronts, rank.tolist()
+
+
+def sort_by_rank_and_crowding(rank, crwd_dist, descending_crowding=True):
+    """Get the order of the individuals by their ranks and crowding distances
+
+    Args:
+        rank (list): rank of each individual
+        crwd_dist (list): crowding distance of each individual
+        descending_crowding (bool): whether individuals of the same rank are sorted by descending crowding distance
+    Returns:
+        list: individuals' indexes in order
+    """
+    sign = -1.0 if descending_crowding else 1.0
+    return sorted(range(len(rank)), key=lambda i: (rank[i], sign * crwd_dist[i]))
 
 
 def crowding_distance(fitnesses, fronts):
@@ -207,27 +252,34 @@ def crowding_distance(fitnesses, fronts):
     Returns:
         list: crowding distance of each individual
     """
-    nb_obj = len(fitnesses[0])
-    distances = [0.0 for _ in range(len(fitnesses))]
+    fitnesses = np.asarray(fitnesses, dtype=np.float64)
+    nb_obj = fitnesses.shape[1]
+    distances = np.zeros(len(fitnesses))
+
+    members = np.array([p for front in fronts for p in front], dtype=np.int64)
+    if len(members) == 0:
+        return distances.tolist()
+    front_ids = np.repeat(np.arange(len(fronts)), [len(front) for front in fronts])
 
-    normalize = []
-    for m in range(nb_obj):
-        values = [value[m] for value in fitnesses]
-        min_value = min(values)
-        max_value = max(values)
-        normalize.append(float(max_value - min_value))
+    with np.errstate(invalid="ignore"):
+        normalize = fitnesses.max(axis=0) - fitnesses.min(axis=0)
 
-    for front in fronts:
         for m in range(nb_obj):
-            s_front = list(front)
-            s_front.sort(key=lambda p: fitnesses[p][m])
-            distances[s_front[0]] = distances[s_front[-1]] = MAX_CRWD_DIST
+            values = fitnesses[members, m]
+            # Sort each front by the objective value, ties keep the front's order
+            order = np.lexsort((values, front_ids))
+            s_members = members[order]
+            s_values = values[order]
+            s_front_ids = front_ids[order]
+            is_first = np.ones(len(order), dtype=bool)
+            is_first[1:] = s_front_ids[1:] != s_front_ids[:-1]
+            is_last = np.ones(len(order), dtype=bool)
+            is_last[:-1] = s_front_ids[:-1] != s_front_ids[1:]
 
             if normalize[m] > 0.0:
-                for i in range(1, len(s_front) - 1):
-                    value_previous = fitnesses[s_front[i - 1]][m]
-                    value_next = fitnesses[s_front[i + 1]][m]
-                    value_diff = value_next - value_previous
-                    distances[s_front[i]] += value_diff / normalize[m]
+                interior = np.flatnonzero(~is_first & ~is_last)
+                value_diff = s_values[interior + 1] - s_values[interior - 1]
+                distances[s_members[interior]] += value_diff / normalize[m]
+            distances[s_members[is_first | is_last]] = MAX_CRWD_DIST
 
-    return distances
+    return distances.tolist()
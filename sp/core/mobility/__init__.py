@@ -1 +1,2 @@
 from .mobility import Mobility, from_json
+from .trace_store import TraceStore, TraceMobility
@@ -0,0 +1,348 @@
+from .mobility import Mobility
+from sp.core.geometry.point import GpsPoint, CartesianPoint, gps
+import numpy as np
+import math
+import os
+
+GPS = "gps"
+"""GPS coordinate system. Values are (longitude, latitude)"""
+
+CARTESIAN = "cartesian"
+"""Cartesian coordinate system. Values are (x, y)"""
+
+_COLUMNS = ["users_id", "offsets", "times", "values", "coord"]
+
+
+class TraceStore:
+    """Columnar Mobility Trace Store
+
+    It stores the position traces of many users in flat arrays sorted by user and time,
+    instead of a time series of point objects per user.
+    The trace of the user ``users_id[k]`` is ``times[offsets[k]:offsets[k + 1]]`` and
+    ``values[offsets[k]:offsets[k + 1]]``.
+    Positions are obtained as :py:class:`sp.core.mobility.time_series.TimeSeriesMobility` does,
+    i.e., values between two consecutive times are interpolated according to a time tolerance
+
+    Attributes:
+        users_id (numpy.ndarray): ids of the users in increasing order
+        users_index (dict): map of user's id to its index in :py:attr:`users_id`
+        offsets (numpy.ndarray): start and end positions of each user's trace
+        times (numpy.ndarray): times of all traces
+        values (numpy.ndarray): coordinates (positions x 2) of all traces
+        coord (str): coordinate system, :py:data:`GPS` or :py:data:`CARTESIAN`
+    """
+
+    def __init__(self, users_id, offsets, times, values, coord=GPS):
+        """Initialization
+
+        Args:
+            users_id (numpy.ndarray): ids of the users in increasing order
+            offsets (numpy.ndarray): start and end positions of each user's trace
+            times (numpy.ndarray): times of all traces, increasing in each trace
+            values (numpy.ndarray): coordinates (positions x 2) of all traces
+            coord (str): coordinate system
+        """
+        self.users_id = users_id
+        self.users_index = {int(user_id): index for (index, user_id) in enumerate(users_id)}
+        self.offsets = offsets
+        self.times = times
+        self.values = values
+        self.coord = coord
+
+    def __len__(self):
+        """Number of users
+
+        Returns:
+            int: number of users
+        """
+        return len(self.users_id)
+
+    def __contains__(self, user_id):
+        """Check if a user has a trace in the store
+
+        Args:
+            user_id (int): user's id
+        Returns:
+            bool: True if the user has a trace
+        """
+        return user_id in self.users_index
+
+    @classmethod
+    def from_arrays(cls, users_id, times, values, coord=GPS):
+        """Create a store from unsorted positions.
+        If a user has many positions at the same time, the last one is kept
+
+        Args:
+            users_id (numpy.ndarray): user's id of each position
+            times (numpy.ndarray): time of each position
+            values (numpy.ndarray): coordinates (positions x 2) of each position
+            coord (str): coordinate system
+        Returns:
+            TraceStore: trace store
+        """
+        users_id = np.asarray(users_id, dtype=np.int64)
+        times = np.asarray(times, dtype=float)
+        values = np.asarray(values, dtype=float).reshape(-1, 2)
+
+        order = np.lexsort((np.arange(len(times)), times, users_id))
+        users_id, times, values = users_id[order], times[order], values[order]
+        keep = np.ones(len(times), dtype=bool)
+        keep[:-1] = (users_id[:-1] != users_id[1:]) | (times[:-1] != times[1:])
+        users_id, times, values = users_id[keep], times[keep], values[keep]
+
+        unique_users_id, counts = np.unique(users_id, return_counts=True)
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        return cls(unique_users_id, offsets, times, values, coord)
+
+    @classmethod
+    def from_users(cls, users):
+        """Create a store from the time series mobility of users
+
+        Args:
+            users (list(sp.core.model.user.User)): users. Users without a time series mobility are ignored
+        Returns:
+            TraceStore: trace store
+        """
+        users_id, times, values = [], [], []
+        coord = GPS
+        for user in users:
+            items = getattr(user.mobility, "items", None)
+            if items is None:
+                continue
+            for (time, point) in items:
+                coord = GPS if isinstance(point, GpsPoint) else CARTESIAN
+                users_id.append(user.id)
+                times.append(time)
+                values.append(list(point.values)[:2])
+        return cls.from_arrays(users_id, times, values, coord)
+
+    def save(self, filename):
+        """Save the store in a .npz file or, if the file name doesn't end with .npz, in a directory of .npy files.
+        The latter can be memory-mapped by :py:meth:`load`
+
+        Args:
+            filename (str): file or directory name
+        """
+        columns = {"users_id": self.users_id, "offsets": self.offsets, "times": self.times,
+                   "values": self.values, "coord": np.array(self.coord)}
+        if filename.endswith(".npz"):
+            np.savez(filename, **columns)
+        else:
+            os.makedirs(filename, exist_ok=True)
+            for (name, array) in columns.items():
+                np.save(os.path.join(filename, name + ".npy"), array)
+
+    @classmethod
+    def load(cls, filename, mmap_mode=None):
+        """Load a store saved by :py:meth:`save`
+
+        Args:
+            filename (str): file or directory name
+            mmap_mode (str): memory-map mode of the arrays in a directory, see :py:func:`numpy.load`
+        Returns:
+            TraceStore: trace store
+        """
+        if os.path.isdir(filename):
+            columns = {name: np.load(os.path.join(filename, name + ".npy"), mmap_mode=mmap_mode)
+                       for name in _COLUMNS}
+        else:
+            with np.load(filename) as data:
+                columns = {name: data[name] for name in _COLUMNS}
+        return cls(columns["users_id"], columns["offsets"], columns["times"], columns["values"],
+                   str(columns["coord"]))
+
+    def get_mobility(self, user_id):
+        """Get the mobility of a user
+
+        Args:
+            user_id (int): user's id
+        Returns:
+            TraceMobility: user's mobility
+        Raises:
+            KeyError: user not found
+        """
+        if user_id not in self.users_index:
+            raise KeyError(user_id)
+        return TraceMobility(self, user_id)
+
+    def positions(self, time, time_tolerance=None, users_id=None):
+        """Get positions of users at a specific time.
+        See :py:meth:`sp.core.time_series.interpolated.InterpolatedTimeSeries.get_value`
+
+        Args:
+            time (float): time
+            time_tolerance (float): a time tolerance to obtain a interpolated position between two consecutive values.
+                If None, the tolerance is set to infinity
+            users_id (list(int)): users' ids. If None, all users of the store are used
+        Returns:
+            numpy.ndarray: coordinates (users x 2). Rows of undefined positions are NaN
+        Raises:
+            KeyError: user not found
+        """
+        time_tolerance = time_tolerance if time_tolerance is not None else math.inf
+        rows = np.arange(len(self.users_id))
+        if users_id is not None:
+            rows = np.array([self.users_index[user_id] for user_id in users_id], dtype=np.int64)
+
+        starts = self.offsets[rows]
+        ends = self.offsets[rows + 1]
+        last = ends - 1
+        result = np.full((len(rows), 2), np.nan)
+        if len(rows) == 0:
+            return result
+
+        # Index of the last time less than or equal to the specified one (before the start if there is none)
+        prev = self._search(time, starts, ends) - 1
+        has_prev = prev >= starts
+        safe_prev = np.maximum(prev, starts)
+        exact = has_prev & (self.times[safe_prev] == time)
+        result[exact] = self.values[safe_prev[exact]]
+        if time_tolerance <= 0.0:
+            return result
+
+        safe_next = np.minimum(safe_prev + 1, last)
+        prev_time = self.times[safe_prev]
+        next_time = self.times[safe_next]
+        inter = has_prev & ~exact & (prev < last)
+        inter &= (time - prev_time <= time_tolerance) | (next_time - time <= time_tolerance)
+        if np.any(inter):
+            fraction = (time - prev_time[inter]) / (next_time[inter] - prev_time[inter])
+            result[inter] = self._interpolate(self.values[safe_prev[inter]], self.values[safe_next[inter]], fraction)
+
+        if not math.isinf(time_tolerance):
+            missing = ~exact & ~inter
+            first = missing & (np.abs(time - self.times[starts]) <= time_tolerance)
+            result[first] = self.values[starts[first]]
+            missing &= ~first
+            end = missing & (np.abs(time - self.times[last]) <= time_tolerance)
+            result[end] = self.values[last[end]]
+
+        return result
+
+    def get_position(self, user_id, time, time_tolerance=None):
+        """Get position of a user at a specific time
+
+        Args:
+            user_id (int): user's id
+            time (float): time
+            time_tolerance (float): time tolerance
+        Returns:
+            sp.core.geometry.point.point.Point: position or None if position is not found
+        Raises:
+            KeyError: user not found
+        """
+        return self.to_point(self.positions(time, time_tolerance, [user_id])[0])
+
+    def to_point(self, value):
+        """Convert coordinates to a point
+
+        Args:
+            value (numpy.ndarray): coordinates
+        Returns:
+            sp.core.geometry.point.point.Point: point or None if the coordinates are NaN
+        """
+        if np.isnan(value[0]):
+            return None
+        if self.coord == GPS:
+            return GpsPoint(lon=float(value[0]), lat=float(value[1]))
+        return CartesianPoint(float(value[0]), float(value[1]))
+
+    def _search(self, time, starts, ends):
+        """Binary search of a time in many traces at once
+
+        Args:
+            time (float): time
+            starts (numpy.ndarray): start position of each trace
+            ends (numpy.ndarray): end position of each trace
+        Returns:
+            numpy.ndarray: position of the first time greater than the specified one in each trace
+        """
+        low = starts.copy()
+        high = ends.copy()
+        max_index = len(self.times) - 1
+        active = low < high
+        while np.any(active):
+            middle = (low + high) // 2
+            right = active & (self.times[np.minimum(middle, max_index)] <= time)
+            low = np.where(right, middle + 1, low)
+            high = np.where(active & ~right, middle, high)
+            active = low < high
+        return low
+
+    def _interpolate(self, values_1, values_2, fraction):
+        """Interpolate coordinates as the ``intermediate`` method of points does
+
+        Args:
+            values_1 (numpy.ndarray): first coordinates (positions x 2)
+            values_2 (numpy.ndarray): second coordinates (positions x 2)
+            fraction (numpy.ndarray): fraction of each position
+        Returns:
+            numpy.ndarray: interpolated coordinates
+        """
+        fraction = fraction[:, np.newaxis]
+        if self.coord == GPS:
+            n_vectors_1 = gps.to_n_vectors(values_1)
+            n_vectors_2 = gps.to_n_vectors(values_2)
+            return gps.from_n_vectors(n_vectors_1 + (n_vectors_2 - n_vectors_1) * fraction)
+        return values_1 + (values_2 - values_1) * fraction
+
+
+class TraceMobility(Mobility):
+    """Trace Mobility
+
+    Mobility of a user whose trace is in a :py:class:`TraceStore`
+
+    Attributes:
+        store (TraceStore): trace store
+        user_id (int): user's id
+    """
+
+    def __init__(self, store, user_id):
+        """Initialization
+
+        Args:
+            store (TraceStore): trace store
+            user_id (int): user's id
+        """
+        Mobility.__init__(self)
+        self.store = store
+        self.user_id = user_id
+
+    def position(self, time, time_tolerance=None, **kwargs):
+        """Get position at a specific time and with certain time tolerance
+
+        Args:
+            time (float): time
+            time_tolerance (float): time tolerance. If None, the tolerance is set to infinity
+            **kwargs: kwargs
+        Returns:
+            sp.core.geometry.point.point.Point: position or None if position is not found
+        """
+        return self.store.get_position(self.user_id, time, time_tolerance)
+
+
+def get_users_position(users, time, time_tolerance=None):
+    """Get positions of many users at a specific time.
+    Positions of users with a :py:class:`TraceMobility` are obtained at once for each trace store
+
+    Args:
+        users (list(sp.core.model.user.User)): users
+        time (float): time
+        time_tolerance (float): time tolerance
+    Returns:
+        list(sp.core.geometry.point.point.Point): position of each user or None if it is not found
+    """
+    positions = [None] * len(users)
+    stores = {}
+    for (index, user) in enumerate(users):
+        if isinstance(user.mobility, TraceMobility):
+            store = user.mobility.store
+            stores.setdefault(id(store), (store, []))[1].append(index)
+        else:
+            positions[index] = user.get_position(time, time_tolerance=time_tolerance)
+
+    for (store, indexes) in stores.values():
+        values = store.positions(time, time_tolerance, [users[i].mobility.user_id for i in indexes])
+        for (index, value) in zip(indexes, values):
+            positions[index] = store.to_point(value)
+    return positions
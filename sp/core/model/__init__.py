@@ -6,5 +6,9 @@ from .link import Link
 from .network import Network
 from .scenario import Scenario
 from .system import System
+from .user_attachments import UserAttachments
 from .environment_input import EnvironmentInput
+from .net_path_table import NetPathTable
+from .array_environment_input import ArrayEnvironmentInput
+from .load_distribution import LoadDistribution
 from .control_input import ControlInput
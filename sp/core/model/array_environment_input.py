@@ -0,0 +1,182 @@
+from sp.core.util.indexed_array import IndexedArrayView
+from .environment_input import EnvironmentInput
+from .net_path_table import NetPathTable
+import numpy as np
+
+
+class ArrayEnvironmentInput(EnvironmentInput):
+    """Array-backed Environment Input Model Class
+
+    The generated load and network delays are stored in dense NumPy arrays and
+    the dictionary attributes of :py:class:`~sp.core.model.environment_input.EnvironmentInput` are views of them.
+    Network paths are stored in a read-only :py:class:`~sp.core.model.net_path_table.NetPathTable`
+    that is shared between environment inputs, e.g., the predicted inputs of a time window.
+    Assigning a dictionary to ``net_path`` converts it to a table
+
+    Attributes:
+        load (numpy.ndarray): generated load (apps x nodes)
+        delay (numpy.ndarray): network delay (apps x source nodes x destination nodes)
+        path_table (NetPathTable): network paths
+        apps_index (dict): map of application's id to its index
+        nodes_index (dict): map of node's id to its index
+    """
+
+    def __init__(self):
+        """Initialization
+        """
+        self.load = None
+        self.delay = None
+        self.path_table = None
+        self.apps_index = None
+        self.nodes_index = None
+        EnvironmentInput.__init__(self)
+
+    @property
+    def net_path(self):
+        """Network paths
+
+        Returns:
+            NetPathTable: paths table
+        """
+        return self.path_table
+
+    @net_path.setter
+    def net_path(self, value):
+        """Set network paths
+
+        Args:
+            value (Union[NetPathTable, dict]): paths table or nested dictionaries of paths
+        """
+        if value is None or isinstance(value, NetPathTable):
+            self.path_table = value
+        elif len(value) == 0 and self.apps_index is None:
+            self.path_table = None
+        else:
+            self.path_table = NetPathTable.from_dict(value, self.apps_index, self.nodes_index)
+
+    def _bind_views(self):
+        """Bind the dictionary attributes to views of the arrays
+        """
+        apps_index, nodes_index = self.apps_index, self.nodes_index
+        self.generated_load = IndexedArrayView(self.load, [apps_index, nodes_index])
+        self.net_delay = IndexedArrayView(self.delay, [apps_index, nodes_index, nodes_index])
+
+    def __copy__(self):
+        """Shallow copy
+
+        Returns:
+            ArrayEnvironmentInput: the shallow copy
+        """
+        cp = self.__class__()
+        cp.apps_index = self.apps_index
+        cp.nodes_index = self.nodes_index
+        cp.load = self.load
+        cp.delay = self.delay
+        cp.path_table = self.path_table
+        cp.attached_users = self.attached_users
+        cp._bind_views()
+        return cp
+
+    def get_generated_load(self, app_id, node_id):
+        """Get the amount of application requests generated from users attached to a node
+
+        Args:
+            app_id (int): application's id. Get the load from a specified application
+            node_id (int): node's id
+        Returns:
+            float: generated load
+        """
+        return float(self.load[self.apps_index[app_id], self.nodes_index[node_id]])
+
+    def get_net_delay(self, app_id, src_node_id, dst_node_id):
+        """Get the network delay to transmit one request of an application from a source node to a destination node
+
+        Args:
+            app_id (int): application's id
+            src_node_id (int): source node's id
+            dst_node_id (int): destination node's id
+        Returns:
+            float: network delay
+        """
+        nodes_index = self.nodes_index
+        return float(self.delay[self.apps_index[app_id], nodes_index[src_node_id], nodes_index[dst_node_id]])
+
+    def get_net_path(self, app_id, src_node_id, dst_node_id):
+        """Get a network path from a source node to a destination node for a specific application
+
+        Args:
+            app_id (int): application's id
+            src_node_id (int): source node's id
+            dst_node_id (int): destination node's id
+        Returns:
+            list(int): list of node's id in the path from source to destination node
+        """
+        return self.path_table.get_path(app_id, src_node_id, dst_node_id)
+
+    @classmethod
+    def create_empty(cls, system, path_table=None):
+        """Create an empty environment input based on a system's state
+
+        Args:
+            system (sp.core.model.system.System): system's state
+            path_table (NetPathTable): shared network paths. If None, no path is defined
+        Returns:
+            ArrayEnvironmentInput: an empty environment input
+        """
+        env = cls()
+        env.apps_index = system.apps_index
+        env.nodes_index = system.nodes_index
+
+        nb_apps = len(env.apps_index)
+        nb_nodes = len(env.nodes_index)
+        env.load = np.zeros((nb_apps, nb_nodes))
+        env.delay = np.full((nb_apps, nb_nodes, nb_nodes), np.inf)
+        if path_table is None:
+            path_table = NetPathTable.create_empty(env.apps_index, env.nodes_index)
+        env.path_table = path_table
+        env._bind_views()
+
+        return env
+
+    @classmethod
+    def from_environment_input(cls, environment_input, system, path_table=None):
+        """Create an array-backed copy of an environment input
+
+        Args:
+            environment_input (EnvironmentInput): environment input
+            system (sp.core.model.system.System): system's state
+            path_table (NetPathTable): shared network paths.
+                If None, they are obtained from the environment input
+        Returns:
+            ArrayEnvironmentInput: environment input
+        """
+        if path_table is None:
+            path_table = cls.get_path_table(environment_input, system)
+
+        env = cls.create_empty(system, path_table)
+        env.attached_users = environment_input.attached_users
+        for (app_id, a) in env.apps_index.items():
+            for (src_node_id, s) in env.nodes_index.items():
+                env.load[a, s] = environment_input.get_generated_load(app_id, src_node_id)
+                for (dst_node_id, d) in env.nodes_index.items():
+                    env.delay[a, s, d] = environment_input.get_net_delay(app_id, src_node_id, dst_node_id)
+
+        return env
+
+    @staticmethod
+    def get_path_table(environment_input, system):
+        """Get the network paths of an environment input as a table.
+        The table of an array-backed environment input is reused if it matches the system's indexes
+
+        Args:
+            environment_input (EnvironmentInput): environment input
+            system (sp.core.model.system.System): system's state
+        Returns:
+            NetPathTable: network paths
+        """
+        apps_index, nodes_index = system.apps_index, system.nodes_index
+        net_path = environment_input.net_path
+        if isinstance(net_path, NetPathTable) and net_path.apps_index == apps_index \
+                and net_path.nodes_index == nodes_index:
+            return net_path
+        return NetPathTable.from_dict(net_path, apps_index, nodes_index)
@@ -38,6 +38,39 @@ class ControlInput:
         """
         return self.load_distribution[app_id][src_node_id][dst_node_id]
 
+    def get_load_flows(self, app_id):
+        """Get the non-zero load distribution of an application's requests.
+        Only the non-zero values of each source node are stored,
+        see :py:class:`sp.core.model.load_distribution.LoadDistribution`
+
+        Args:
+            app_id (int): application's id
+        Returns:
+            list(tuple): list of (source node's id, destination node's id, load distribution)
+        """
+        flows = []
+        for (src_node_id, dst_ld) in self.load_distribution[app_id].items():
+            for (dst_node_id, ld) in dst_ld.items():
+                if ld != 0.0:
+                    flows.append((src_node_id, dst_node_id, ld))
+        return flows
+
+    def get_load_sources(self, app_id, dst_node_id):
+        """Get the non-zero load distribution of an application's requests to a destination node
+
+        Args:
+            app_id (int): application's id
+            dst_node_id (int): destination node's id
+        Returns:
+            list(tuple): list of (source node's id, load distribution)
+        """
+        sources = []
+        for (src_node_id, dst_ld) in self.load_distribution[app_id].items():
+            ld = dst_ld.get(dst_node_id, 0.0)
+            if ld != 0.0:
+                sources.append((src_node_id, ld))
+        return sources
+
     def get_allocated_resource(self, app_id, node_id, resource_name):
         """Get the amount of allocated resource to an application on a node
 
@@ -1,3 +1,4 @@
+from .user_attachments import UserAttachments
 import math
 
 
@@ -11,7 +12,7 @@ class EnvironmentInput:
         self.generated_load = {}
         self.net_delay = {}
         self.net_path = {}
-        self.attached_users = {}
+        self.attached_users = UserAttachments()
 
     def __copy__(self):
         """Shallow copy
@@ -71,7 +72,8 @@ class EnvironmentInput:
         return self.attached_users.values()
 
     def get_nb_users(self, app_id=None, node_id=None):
-        """Get the number of users from an application and/or attached to a node
+        """Get the number of users from an application and/or attached to a node.
+        Counts of :py:class:`sp.core.model.user_attachments.UserAttachments` are used when available
 
         Args:
             app_id (int, optional): application's id. If specified, it only counts users from the specified application
@@ -79,6 +81,9 @@ class EnvironmentInput:
         Returns:
             int: number of users
         """
+        if isinstance(self.attached_users, UserAttachments):
+            return self.attached_users.get_nb_users(app_id, node_id)
+
         count = 0
         for user in self.get_attached_users():
             app_selected = app_id is None or user.app_id == app_id
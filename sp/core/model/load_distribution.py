@@ -0,0 +1,60 @@
+class LoadDistribution(dict):
+    """Load Distribution Model Class
+
+    It is the load distribution of an application's requests from a source node,
+    i.e., a dictionary of load distribution values indexed by destination node's id.
+    Requests from a source are usually forwarded to a few nodes, so only non-zero values are stored
+    and the value of any other destination is 0.0
+    """
+
+    def __init__(self, values=None):
+        """Initialization
+
+        Args:
+            values (dict): load distribution values indexed by destination node's id
+        """
+        dict.__init__(self)
+        if values is not None:
+            for (dst_node_id, value) in values.items():
+                self[dst_node_id] = value
+
+    def __missing__(self, dst_node_id):
+        """Get the load distribution of a destination node that is not stored
+
+        Args:
+            dst_node_id (int): destination node's id
+        Returns:
+            float: 0.0
+        """
+        return 0.0
+
+    def __setitem__(self, dst_node_id, value):
+        """Set the load distribution of a destination node. Zero values are removed
+
+        Args:
+            dst_node_id (int): destination node's id
+            value (float): load distribution
+        """
+        if value == 0.0:
+            self.pop(dst_node_id, None)
+        else:
+            dict.__setitem__(self, dst_node_id, value)
+
+    def get(self, dst_node_id, default=0.0):
+        """Get the load distribution of a destination node
+
+        Args:
+            dst_node_id (int): destination node's id
+            default (float): value of a destination that is not stored
+        Returns:
+            float: load distribution
+        """
+        return dict.get(self, dst_node_id, default)
+
+    def __reduce__(self):
+        """Get the data to pickle or copy the load distribution
+
+        Returns:
+            tuple: class and initialization arguments
+        """
+        return self.__class__, (dict(self),)
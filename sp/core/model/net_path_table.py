@@ -0,0 +1,241 @@
+from collections.abc import Mapping
+import numpy as np
+
+
+class NetPathTable(Mapping):
+    """Immutable Network Path Table
+
+    It stores the network paths of all applications and pairs of nodes in a compressed (CSR-like) format.
+    The path from node ``src`` to node ``dst`` of application ``app`` is
+    ``indices[indptr[k]:indptr[k + 1]]`` where ``k`` is the flat position of ``(app, src, dst)``
+    in a (apps x nodes x nodes) array. Positions without a path are marked in ``has_path``.
+
+    Since the table is read-only, it can be shared between many environment inputs.
+    It also works as a read-only nested mapping, i.e., ``table[app_id][src_node_id][dst_node_id]``
+
+    Attributes:
+        apps_index (dict): map of application's id to its index
+        nodes_index (dict): map of node's id to its index
+        nodes_id (numpy.ndarray): node's id of each index
+        indptr (numpy.ndarray): start and end positions of each path in the indices array
+        indices (numpy.ndarray): node's indexes of all paths
+        has_path (numpy.ndarray): boolean array (apps x nodes x nodes) indicating if a path is defined
+    """
+
+    def __init__(self, apps_index, nodes_index, indptr, indices, has_path):
+        """Initialization
+
+        Args:
+            apps_index (dict): map of application's id to its index
+            nodes_index (dict): map of node's id to its index
+            indptr (numpy.ndarray): start and end positions of each path in the indices array
+            indices (numpy.ndarray): node's indexes of all paths
+            has_path (numpy.ndarray): boolean array (apps x nodes x nodes) indicating if a path is defined
+        """
+        self.apps_index = apps_index
+        self.nodes_index = nodes_index
+        nodes_id = [None] * len(nodes_index)
+        for (node_id, index) in nodes_index.items():
+            nodes_id[index] = node_id
+        self.nodes_id = np.array(nodes_id)
+        self.indptr = indptr
+        self.indices = indices
+        self.has_path = has_path
+        for array in (self.nodes_id, self.indptr, self.indices, self.has_path):
+            array.flags.writeable = False
+
+    def _flat_index(self, app_index, src_index, dst_index):
+        """Get the position of a path in the flat table
+
+        Args:
+            app_index (int): application's index
+            src_index (int): source node's index
+            dst_index (int): destination node's index
+        Returns:
+            int: position
+        """
+        nb_nodes = len(self.nodes_index)
+        return (app_index * nb_nodes + src_index) * nb_nodes + dst_index
+
+    def get_path_indexes(self, app_index, src_index, dst_index):
+        """Get a network path as node's indexes
+
+        Args:
+            app_index (int): application's index
+            src_index (int): source node's index
+            dst_index (int): destination node's index
+        Returns:
+            numpy.ndarray: read-only array of node's indexes in the path or None if the path is not defined
+        """
+        if not self.has_path[app_index, src_index, dst_index]:
+            return None
+        k = self._flat_index(app_index, src_index, dst_index)
+        return self.indices[self.indptr[k]:self.indptr[k + 1]]
+
+    def sum_link_values(self, app_index, link_values):
+        """Sum a value of the links along all paths of an application
+
+        Args:
+            app_index (int): application's index
+            link_values (numpy.ndarray): value of each link (nodes x nodes) indexed by :py:attr:`nodes_index`
+        Returns:
+            numpy.ndarray: array (source nodes x destination nodes) with the sum of each path.
+                It is zero for undefined paths and paths with less than two nodes
+        """
+        nb_nodes = len(self.nodes_index)
+        nb_paths = nb_nodes * nb_nodes
+        start = app_index * nb_paths
+        indptr = self.indptr[start:start + nb_paths + 1]
+        indices = self.indices[indptr[0]:indptr[-1]]
+        path_ids = np.repeat(np.arange(nb_paths), np.diff(indptr))
+
+        same_path = path_ids[1:] == path_ids[:-1]
+        values = link_values[indices[:-1][same_path], indices[1:][same_path]]
+        sums = np.bincount(path_ids[1:][same_path], weights=values, minlength=nb_paths)
+        return sums.reshape(nb_nodes, nb_nodes)
+
+    def get_path_length(self, app_index):
+        """Get the number of nodes in all paths of an application
+
+        Args:
+            app_index (int): application's index
+        Returns:
+            numpy.ndarray: array (source nodes x destination nodes). It is zero for undefined paths
+        """
+        nb_nodes = len(self.nodes_index)
+        nb_paths = nb_nodes * nb_nodes
+        start = app_index * nb_paths
+        return np.diff(self.indptr[start:start + nb_paths + 1]).reshape(nb_nodes, nb_nodes)
+
+    def get_path(self, app_id, src_node_id, dst_node_id):
+        """Get a network path from a source node to a destination node for a specific application
+
+        Args:
+            app_id (int): application's id
+            src_node_id (int): source node's id
+            dst_node_id (int): destination node's id
+        Returns:
+            list(int): list of node's id in the path from source to destination node or None if not defined
+        """
+        nodes_index = self.nodes_index
+        path = self.get_path_indexes(self.apps_index[app_id], nodes_index[src_node_id], nodes_index[dst_node_id])
+        if path is None:
+            return None
+        return self.nodes_id[path].tolist()
+
+    def __getitem__(self, app_id):
+        """Get the paths of an application
+
+        Args:
+            app_id (int): application's id
+        Returns:
+            Mapping: read-only nested mapping of source and destination node's id to paths
+        Raises:
+            KeyError: id not found
+        """
+        return _NetPathView(self, app_id)
+
+    def __iter__(self):
+        """Iterate over application's ids
+
+        Returns:
+            iterator: ids
+        """
+        return iter(self.apps_index)
+
+    def __len__(self):
+        """Number of applications
+
+        Returns:
+            int: number of applications
+        """
+        return len(self.apps_index)
+
+    @classmethod
+    def create_empty(cls, apps_index, nodes_index):
+        """Create a table without any defined path
+
+        Args:
+            apps_index (dict): map of application's id to its index
+            nodes_index (dict): map of node's id to its index
+        Returns:
+            NetPathTable: table
+        """
+        nb_apps, nb_nodes = len(apps_index), len(nodes_index)
+        indptr = np.zeros(nb_apps * nb_nodes * nb_nodes + 1, dtype=np.int64)
+        indices = np.zeros(0, dtype=np.int64)
+        has_path = np.zeros((nb_apps, nb_nodes, nb_nodes), dtype=bool)
+        return cls(apps_index, nodes_index, indptr, indices, has_path)
+
+    @classmethod
+    def from_dict(cls, paths, apps_index, nodes_index):
+        """Create a table from the nested dictionaries of paths,
+        i.e., ``paths[app_id][src_node_id][dst_node_id]``
+
+        Args:
+            paths (dict): paths for each application and pair of nodes. A path is a list of node's id
+            apps_index (dict): map of application's id to its index
+            nodes_index (dict): map of node's id to its index
+        Returns:
+            NetPathTable: table
+        """
+        nb_apps, nb_nodes = len(apps_index), len(nodes_index)
+        sizes = np.zeros(nb_apps * nb_nodes * nb_nodes, dtype=np.int64)
+        has_path = np.zeros((nb_apps, nb_nodes, nb_nodes), dtype=bool)
+        flat_paths = [None] * (nb_apps * nb_nodes * nb_nodes)
+
+        for (app_id, a) in apps_index.items():
+            app_paths = paths.get(app_id, {})
+            for (src_node_id, s) in nodes_index.items():
+                src_paths = app_paths.get(src_node_id, {})
+                for (dst_node_id, d) in nodes_index.items():
+                    path = src_paths.get(dst_node_id, None)
+                    if path is None:
+                        continue
+                    k = (a * nb_nodes + s) * nb_nodes + d
+                    flat_paths[k] = [nodes_index[node_id] for node_id in path]
+                    sizes[k] = len(path)
+                    has_path[a, s, d] = True
+
+        indptr = np.zeros(len(sizes) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=indptr[1:])
+        indices = np.zeros(indptr[-1], dtype=np.int64)
+        for (k, path) in enumerate(flat_paths):
+            if path:
+                indices[indptr[k]:indptr[k + 1]] = path
+
+        return cls(apps_index, nodes_index, indptr, indices, has_path)
+
+
+class _NetPathView(Mapping):
+    """Read-only nested view of a :py:class:`NetPathTable`
+    """
+
+    __slots__ = ["_table", "_app_id", "_src_node_id"]
+
+    def __init__(self, table, app_id, src_node_id=None):
+        """Initialization
+
+        Args:
+            table (NetPathTable): viewed table
+            app_id (int): application's id
+            src_node_id (int): source node's id. If None, the view maps source nodes
+        Raises:
+            KeyError: id not found
+        """
+        if app_id not in table.apps_index or (src_node_id is not None and src_node_id not in table.nodes_index):
+            raise KeyError(app_id if src_node_id is None else src_node_id)
+        self._table = table
+        self._app_id = app_id
+        self._src_node_id = src_node_id
+
+    def __getitem__(self, node_id):
+        if self._src_node_id is None:
+            return _NetPathView(self._table, self._app_id, node_id)
+        return self._table.get_path(self._app_id, self._src_node_id, node_id)
+
+    def __iter__(self):
+        return iter(self._table.nodes_index)
+
+    def __len__(self):
+        return len(self._table.nodes_index)
@@ -2,6 +2,7 @@ from .node import Node
 from .link import Link
 from sp.core.util import json_util, filter_util
 from sp.core.util.cached_property import cached_property
+import numpy as np
 
 
 class Network:
@@ -31,7 +32,7 @@ class Network:
     def _clear_cache(self):
         """Clear the cached properties
         """
-        keys = ["nodes", "links", "cloud_node"]
+        keys = ["nodes", "nodes_index", "links", "cloud_node", "link_propagation_delay", "link_inverse_bandwidth"]
         for key in keys:
             if key in self.__dict__:
                 del self.__dict__[key]
@@ -47,6 +48,15 @@ class Network:
         data.sort()
         return data
 
+    @cached_property
+    def nodes_index(self):
+        """Position of each node in the :py:attr:`nodes` list
+
+        Returns:
+            dict: map of node's id to its index
+        """
+        return {node.id: index for (index, node) in enumerate(self.nodes)}
+
     @cached_property
     def links(self):
         """List of all links in the network
@@ -69,6 +79,41 @@ class Network:
 
         raise AttributeError("Cloud node not found")
 
+    @cached_property
+    def link_propagation_delay(self):
+        """Propagation delay of each link, indexed by :py:attr:`nodes_index`
+
+        Returns:
+            numpy.ndarray: read-only array (nodes x nodes). It is infinity if there is no link between two nodes
+        """
+        return self._link_matrix(lambda link: link.propagation_delay)
+
+    @cached_property
+    def link_inverse_bandwidth(self):
+        """Inverse of the bandwidth of each link, indexed by :py:attr:`nodes_index`
+
+        Returns:
+            numpy.ndarray: read-only array (nodes x nodes). It is infinity if there is no link between two nodes
+        """
+        return self._link_matrix(lambda link: 1.0 / float(link.bandwidth))
+
+    def _link_matrix(self, value_func):
+        """Create a symmetric matrix with a value of each link
+
+        Args:
+            value_func (function): function that returns the value of a link
+        Returns:
+            numpy.ndarray: read-only array (nodes x nodes)
+        """
+        nodes_index = self.nodes_index
+        matrix = np.full((len(nodes_index), len(nodes_index)), np.inf)
+        for ((node_1_id, node_2_id), link) in self._links.items():
+            if node_1_id in nodes_index and node_2_id in nodes_index:
+                node_1, node_2 = nodes_index[node_1_id], nodes_index[node_2_id]
+                matrix[node_1, node_2] = matrix[node_2, node_1] = value_func(link)
+        matrix.flags.writeable = False
+        return matrix
+
     @property
     def nodes_id(self):
         """List of ids of all nodes
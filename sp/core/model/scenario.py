@@ -5,6 +5,7 @@ from .user import User
 from sp.core.util import json_util, filter_util
 from sp.core.util.cached_property import cached_property
 from sp.core.estimator import load as load_estimator
+from sp.core.mobility import TraceStore
 from collections import defaultdict
 import copy
 
@@ -22,12 +23,12 @@ class Scenario:
         self._apps = {}
         self._users = {}
         self._resources = {}
-        self._load_estimators = defaultdict(lambda: defaultdict(lambda: None))
+        self._load_estimators = defaultdict(dict)
 
     def _clear_cache(self):
         """Clear the cached properties
         """
-        keys = ["apps", "users", "resources"]
+        keys = ["apps", "apps_index", "users", "resources", "resources_index"]
         for key in keys:
             if key in self.__dict__:
                 del self.__dict__[key]
@@ -43,6 +44,15 @@ class Scenario:
         data.sort()
         return data
 
+    @cached_property
+    def apps_index(self):
+        """Position of each application in the :py:attr:`apps` list
+
+        Returns:
+            dict: map of application's id to its index
+        """
+        return {app.id: index for (index, app) in enumerate(self.apps)}
+
     @cached_property
     def users(self):
         """List of all users in the scenario
@@ -61,6 +71,15 @@ class Scenario:
         """
         return list(self._resources.values())
 
+    @cached_property
+    def resources_index(self):
+        """Position of each resource in the :py:attr:`resources` list
+
+        Returns:
+            dict: map of resource's name to its index
+        """
+        return {resource.name: index for (index, resource) in enumerate(self.resources)}
+
     @property
     def network(self):
         """Get network of the scenario
@@ -176,7 +195,7 @@ class Scenario:
         Returns:
             sp.core.estimator.load.LoadEstimator: load estimator
         """
-        return self._load_estimators[app_id][node_id]
+        return self._load_estimators[app_id].get(node_id, None)
 
     def add_load_estimator(self, app_id, node_id, estimator):
         """Add a load estimator in the scenario
@@ -291,6 +310,16 @@ def from_json(json_data):
         }
         scenario = sp.core.model.scenario.from_json(json_data)
 
+        # Positions of users without the 'pos' property in a trace store,
+        # see sp.core.mobility.trace_store.TraceStore.save
+        json_data = {
+            'network': 'path/network.json',
+            'apps': 'path/apps.json',
+            'users': [{'id':  0, 'app_id':  0}, {'id':  1, 'app_id':  1}],
+            'traces': 'path/traces.npz',
+        }
+        scenario = sp.core.model.scenario.from_json(json_data)
+
     Args:
         json_data (dict): data loaded from a json
     Returns:
@@ -324,6 +353,12 @@ def from_json(json_data):
             user = User.from_json(item)
             s.add_user(user)
 
+    if "traces" in json_data:
+        store = TraceStore.load(json_data["traces"], mmap_mode="r")
+        for user in s.users:
+            if user.mobility is None and user.id in store:
+                user.mobility = store.get_mobility(user.id)
+
     if "loads" in json_data:
         for item in json_util.load_key_content(json_data, "loads"):
             app_id = int(item["app_id"])
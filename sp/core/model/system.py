@@ -1,4 +1,7 @@
 from collections import defaultdict
+from functools import partial
+import numpy as np
+import hashlib
 import math
 import copy
 
@@ -25,8 +28,8 @@ class System:
 
         self.time = 0
         self.sampling_time = 1
-        self.app_queue_size = defaultdict(lambda: defaultdict(int))
-        self.processing_delay = defaultdict(lambda: defaultdict(lambda: math.inf))
+        self.app_queue_size = defaultdict(partial(defaultdict, int))
+        self.processing_delay = defaultdict(partial(defaultdict, partial(float, math.inf)))
 
     def __copy__(self):
         """Shallow copy
@@ -70,29 +73,45 @@ class System:
         if other is None or self.time != other.time or self.sampling_time != other.sampling_time:
             return False
 
-        for app in self.apps:
-            for node in self.nodes:
-                queue_size_1 = self.get_app_queue_size(app.id, node.id)
-                queue_size_2 = other.get_app_queue_size(app.id, node.id)
+        state_1 = self.get_state_array()
+        state_2 = other.get_state_array(self.apps, self.nodes)
+        if np.any(np.isinf(state_1) != np.isinf(state_2)):
+            return False
+        with np.errstate(invalid="ignore"):
+            return not np.any(np.abs(state_1 - state_2) > ERROR_TOLERANCE)
 
-                if math.isinf(queue_size_1) and not math.isinf(queue_size_2):
-                    return False
-                elif not math.isinf(queue_size_1) and math.isinf(queue_size_2):
-                    return False
-                elif abs(queue_size_1 - queue_size_2) > ERROR_TOLERANCE:
-                    return False
+    def get_state_array(self, apps=None, nodes=None):
+        """Get the queue sizes and processing delays of the system's state as an array
 
-                proc_1 = self.get_processing_delay(app.id, node.id)
-                proc_2 = other.get_processing_delay(app.id, node.id)
+        Args:
+            apps (list): applications. If None, all applications of the system are considered
+            nodes (list): nodes. If None, all nodes of the system are considered
+        Returns:
+            numpy.ndarray: array (2 x apps x nodes) with the queue sizes and the processing delays
+        """
+        apps = self.apps if apps is None else apps
+        nodes = self.nodes if nodes is None else nodes
+        queue_size = [[self.get_app_queue_size(app.id, node.id) for node in nodes] for app in apps]
+        proc_delay = [[self.get_processing_delay(app.id, node.id) for node in nodes] for app in apps]
+        return np.array([queue_size, proc_delay], dtype=float).reshape(2, len(apps), len(nodes))
 
-                if math.isinf(proc_1) and not math.isinf(proc_2):
-                    return False
-                elif not math.isinf(proc_1) and math.isinf(proc_2):
-                    return False
-                elif abs(proc_1 - proc_2) > ERROR_TOLERANCE:
-                    return False
+    def fingerprint(self, precision=ERROR_TOLERANCE):
+        """Get a fingerprint of the system's state.
+        Queue sizes and processing delays are quantized with the specified precision, so states
+        with the same fingerprint are equal, see :py:meth:`__eq__`
 
-        return True
+        Args:
+            precision (float): quantization step
+        Returns:
+            bytes: fingerprint
+        """
+        state = self.get_state_array()
+        with np.errstate(invalid="ignore"):
+            state = np.where(np.isfinite(state), np.floor(state / precision + 0.5), state) + 0.0
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.array([self.time, self.sampling_time], dtype=float).tobytes())
+        digest.update(np.ascontiguousarray(state).tobytes())
+        return digest.digest()
 
     @property
     def nodes(self):
@@ -112,6 +131,15 @@ class System:
         """
         return self.scenario.network.nodes_id
 
+    @property
+    def nodes_index(self):
+        """Get the position of each node in the :py:attr:`nodes` list
+
+        Returns:
+            dict: map of node's id to its index
+        """
+        return self.scenario.network.nodes_index
+
     @property
     def cloud_node(self):
         """Get the cloud node
@@ -157,6 +185,15 @@ class System:
         """
         return self.scenario.apps_id
 
+    @property
+    def apps_index(self):
+        """Get the position of each application in the :py:attr:`apps` list
+
+        Returns:
+            dict: map of application's id to its index
+        """
+        return self.scenario.apps_index
+
     @property
     def users(self):
         """Get all users of the system's scenario
@@ -193,6 +230,15 @@ class System:
         """
         return self.scenario.resources_name
 
+    @property
+    def resources_index(self):
+        """Get the position of each resource in the :py:attr:`resources` list
+
+        Returns:
+            dict: map of resource's name to its index
+        """
+        return self.scenario.resources_index
+
     def get_node(self, node_id):
         """Get a node by its id
 
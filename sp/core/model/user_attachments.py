@@ -0,0 +1,137 @@
+class UserAttachments(dict):
+    """User Attachments Model Class
+
+    It is a dictionary of attached users indexed by their ids.
+    The number of users per application and node is counted while users are added,
+    so :py:meth:`get_nb_users` does not iterate over all users.
+    Users must not change their application or node after they are added
+    """
+
+    def __init__(self, users=None):
+        """Initialization
+
+        Args:
+            users (list(sp.core.model.user.User)): attached users
+        """
+        dict.__init__(self)
+        self._nb_users = {}
+        if users is not None:
+            for user in users:
+                self[user.id] = user
+
+    def __setitem__(self, user_id, user):
+        """Add an attached user
+
+        Args:
+            user_id (int): user's id
+            user (sp.core.model.user.User): attached user
+        """
+        if user_id in self:
+            self._count(self[user_id], -1)
+        dict.__setitem__(self, user_id, user)
+        self._count(user, 1)
+
+    def __delitem__(self, user_id):
+        """Remove an attached user
+
+        Args:
+            user_id (int): user's id
+        """
+        self._count(self[user_id], -1)
+        dict.__delitem__(self, user_id)
+
+    def update(self, *args, **kwargs):
+        """Add many attached users
+
+        Args:
+            *args: a dictionary or an iterable of (user's id, user) pairs
+            **kwargs: attached users indexed by their ids
+        """
+        for (user_id, user) in dict(*args, **kwargs).items():
+            self[user_id] = user
+
+    def setdefault(self, user_id, user=None):
+        """Add an attached user if its id is not found
+
+        Args:
+            user_id (int): user's id
+            user (sp.core.model.user.User): attached user
+        Returns:
+            sp.core.model.user.User: attached user with the specified id
+        """
+        if user_id not in self:
+            self[user_id] = user
+        return self[user_id]
+
+    def pop(self, user_id, *default):
+        """Remove an attached user
+
+        Args:
+            user_id (int): user's id
+            *default: value returned if the user is not found
+        Returns:
+            sp.core.model.user.User: removed user
+        Raises:
+            KeyError: user not found and no default value
+        """
+        if user_id not in self:
+            return dict.pop(self, user_id, *default)
+        user = self[user_id]
+        del self[user_id]
+        return user
+
+    def popitem(self):
+        """Remove the last attached user
+
+        Returns:
+            tuple: user's id and removed user
+        Raises:
+            KeyError: there are no users
+        """
+        user_id, user = dict.popitem(self)
+        self._count(user, -1)
+        return user_id, user
+
+    def clear(self):
+        """Remove all attached users
+        """
+        dict.clear(self)
+        self._nb_users.clear()
+
+    def __reduce__(self):
+        """Get the data to pickle or copy the attachments
+
+        Returns:
+            tuple: class and initialization arguments
+        """
+        return self.__class__, (list(self.values()),)
+
+    def _count(self, user, value):
+        """Change the number of users of an user's application and node
+
+        Args:
+            user (sp.core.model.user.User): user
+            value (int): value added to the number of users
+        """
+        node_id = getattr(user, "node_id", None)
+        app_counts = self._nb_users.setdefault(user.app_id, {})
+        app_counts[node_id] = app_counts.get(node_id, 0) + value
+
+    def get_nb_users(self, app_id=None, node_id=None):
+        """Get the number of users from an application and/or attached to a node
+
+        Args:
+            app_id (int, optional): application's id. If specified, it only counts users from the specified application
+            node_id (int, optional): node's id. If specified, it only counts users attached to the specified node
+        Returns:
+            int: number of users
+        """
+        if app_id is not None:
+            app_counts = self._nb_users.get(app_id, {})
+            if node_id is not None:
+                return app_counts.get(node_id, 0)
+            return sum(app_counts.values())
+
+        if node_id is not None:
+            return sum(app_counts.get(node_id, 0) for app_counts in self._nb_users.values())
+        return len(self)
@@ -1,13 +1,36 @@
 from .time_series import TimeSeries
+import numpy as np
 import math
 
 
 class InterpolatedTimeSeries(TimeSeries):
     """Interpolate Time Series
 
-    It is possible to interpolate values for times not defined in the series
+    It is possible to interpolate values for times not defined in the series.
+    Items are indexed by a sorted array of times, built when the series is queried after it changes.
+    Intervals between consecutive times are found by binary search, and a cursor on the last found interval
+    makes lookups of monotonically advancing times, e.g. along a simulation, constant time
     """
 
+    def __init__(self):
+        """Initialization
+        """
+        TimeSeries.__init__(self)
+        self._times = None
+        self._sorted_keys = None
+        self._cursor = 0
+
+    def set_value(self, time, value):
+        """Set value of an item at the specified time
+
+        Args:
+            time (float): time
+            value (object): item's value
+        """
+        TimeSeries.set_value(self, time, value)
+        self._times = None
+        self._sorted_keys = None
+
     def get_value(self, time, time_tolerance=None, **kwargs):
         """Get item's value at the specified time
 
@@ -44,8 +67,9 @@ class InterpolatedTimeSeries(TimeSeries):
         Raises:
             KeyError: no interpolated value found for the specified time
         """
-        time_list = list(self._items.keys())
-        time_list.sort()
+        if self._times is None:
+            self._build_index()
+        time_list = self._sorted_keys
         series_len = len(time_list)
         value = None
 
@@ -55,12 +79,10 @@ class InterpolatedTimeSeries(TimeSeries):
             first_time = time_list[0]
             last_time = time_list[-1]
 
-            for i in range(series_len):
-                next_i = min(i + 1, series_len - 1)
-                if time_list[i] <= time <= time_list[next_i]:
-                    prev_time = time_list[i]
-                    next_time = time_list[next_i]
-                    break
+            i = self._find_interval(time)
+            if i is not None:
+                prev_time = time_list[i]
+                next_time = time_list[i + 1]
 
             interpolate = prev_time is not None and next_time is not None
             interpolate = interpolate and (time - prev_time <= time_tolerance or next_time - time <= time_tolerance)
@@ -79,6 +101,35 @@ class InterpolatedTimeSeries(TimeSeries):
 
         return value
 
+    def _build_index(self):
+        """Sort the times of the series
+        """
+        self._sorted_keys = sorted(self._items.keys())
+        self._times = np.array(self._sorted_keys, dtype=float)
+        self._cursor = 0
+
+    def _find_interval(self, time):
+        """Find the interval of consecutive times [t1, t2) that contains a time.
+        The interval of the cursor and its next one are checked before the binary search
+
+        Args:
+            time (float): time
+        Returns:
+            int: index of t1 in the sorted times, or None if the time is outside the series
+        """
+        times = self._times
+        last_index = len(times) - 1
+        for i in (self._cursor, self._cursor + 1):
+            if i < last_index and times[i] <= time < times[i + 1]:
+                self._cursor = i
+                return i
+
+        i = int(np.searchsorted(times, time, side="right")) - 1
+        if 0 <= i < last_index:
+            self._cursor = i
+            return i
+        return None
+
     @staticmethod
     def interpolate(time_1, value_1, time_2, value_2, time):
         """Interpolate a value between two others.
@@ -0,0 +1,100 @@
+from collections.abc import MutableMapping
+
+
+class IndexedArrayView(MutableMapping):
+    """Dictionary-like view of a NumPy array indexed by ids
+
+    It maps nested id lookups, e.g. ``view[app_id][node_id]``, to positions of a dense array.
+    Each level of the array has a map of ids to indexes.
+    The last level returns (and assigns) plain python values, so the view can be used in place
+    of the nested dictionaries of the model classes
+
+    E.g.:
+
+    .. code-block:: python
+
+        array = numpy.zeros((2, 3))
+        view = IndexedArrayView(array, [{10: 0, 11: 1}, {0: 0, 5: 1, 7: 2}])
+        view[11][5] = 1.5
+        assert array[1, 1] == 1.5
+
+    Attributes:
+        array (numpy.ndarray): viewed array
+        indexes (list(dict)): map of ids to indexes for each dimension of the array
+    """
+
+    __slots__ = ["array", "indexes"]
+
+    def __init__(self, array, indexes):
+        """Initialization
+
+        Args:
+            array (numpy.ndarray): viewed array
+            indexes (list(dict)): map of ids to indexes for each dimension of the array
+        """
+        self.array = array
+        self.indexes = indexes
+
+    def __getitem__(self, key):
+        """Get an item by its id
+
+        Args:
+            key: item's id
+        Returns:
+            Union[IndexedArrayView, bool, float]: sub-view or value of the item
+        Raises:
+            KeyError: id not found
+        """
+        index = self.indexes[0][key]
+        if len(self.indexes) == 1:
+            return self.array[index].item()
+        return IndexedArrayView(self.array[index], self.indexes[1:])
+
+    def __setitem__(self, key, value):
+        """Set an item by its id
+
+        Args:
+            key: item's id
+            value: new value. For inner levels, it is a mapping with the values of the next level
+        Raises:
+            KeyError: id not found
+        """
+        index = self.indexes[0][key]
+        if len(self.indexes) == 1:
+            self.array[index] = value
+        else:
+            sub_view = IndexedArrayView(self.array[index], self.indexes[1:])
+            for (sub_key, sub_value) in value.items():
+                sub_view[sub_key] = sub_value
+
+    def __delitem__(self, key):
+        """Items cannot be removed from the view
+
+        Raises:
+            TypeError: always
+        """
+        raise TypeError("items cannot be removed from an indexed array view")
+
+    def __iter__(self):
+        """Iterate over the ids of the first level
+
+        Returns:
+            iterator: ids
+        """
+        return iter(self.indexes[0])
+
+    def __len__(self):
+        """Number of ids of the first level
+
+        Returns:
+            int: number of ids
+        """
+        return len(self.indexes[0])
+
+    def __repr__(self):
+        """String representation
+
+        Returns:
+            str: representation
+        """
+        return "{}({})".format(self.__class__.__name__, dict(self.items()))
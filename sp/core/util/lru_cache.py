@@ -0,0 +1,81 @@
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Bounded Least Recently Used (LRU) Cache
+
+    When the cache is full, the least recently used entry is discarded
+
+    Attributes:
+        max_size (int): maximum number of entries
+        hits (int): number of successful lookups
+        misses (int): number of failed lookups
+    """
+
+    def __init__(self, max_size):
+        """Initialization
+
+        Args:
+            max_size (int): maximum number of entries
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        """Number of entries
+
+        Returns:
+            int: number of entries
+        """
+        return len(self._data)
+
+    def __contains__(self, key):
+        """Check if a key is cached. It does not change the order of use
+
+        Args:
+            key: entry's key
+        Returns:
+            bool: True if the key is cached
+        """
+        return key in self._data
+
+    def get(self, key, default=None):
+        """Get a cached value and mark it as the most recently used entry
+
+        Args:
+            key: entry's key
+            default: value returned if the key is not cached
+        Returns:
+            object: cached value
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Cache a value
+
+        Args:
+            key: entry's key
+            value: value
+        """
+        if self.max_size <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,206 @@
+import itertools
+import multiprocessing as mp
+import pickle
+import threading
+
+BARRIER_TIMEOUT = 60.0
+"""Maximum time in seconds that a worker waits for the others while a context is pushed or released"""
+
+_contexts = {}
+_barrier = None
+
+
+def _init_worker(barrier):
+    """Initialize a worker process
+
+    Args:
+        barrier (multiprocessing.Barrier): barrier shared by all workers
+    """
+    global _barrier
+    _barrier = barrier
+
+
+def _push_context(args):
+    """Store a context in the worker process.
+    The worker then waits for the others, so each worker runs this task exactly once
+
+    Args:
+        args (tuple): context's key and pickled context
+    """
+    key, data = args
+    _contexts[key] = pickle.loads(data)
+    _barrier.wait(BARRIER_TIMEOUT)
+
+
+def _release_context(key):
+    """Remove a context from the worker process.
+    The worker then waits for the others, so each worker runs this task exactly once
+
+    Args:
+        key (int): context's key
+    """
+    _contexts.pop(key, None)
+    _barrier.wait(BARRIER_TIMEOUT)
+
+
+def _run_task(args):
+    """Run a task with a context stored in the worker process
+
+    Args:
+        args (tuple): context's key, task function, and task item
+    Returns:
+        object: task result
+    """
+    key, func, item = args
+    return func(_contexts[key], item)
+
+
+class WorkerPool:
+    """Persistent Multiprocessing Pool
+
+    The worker processes are forked once and reused by many executions, e.g., the genetic algorithm of
+    every time slot of a simulation.
+    Instead of forking new processes for each execution, the problem context (e.g., a genetic operator with
+    the system's state and environment input) is pushed to all workers with :py:meth:`set_context`
+    and it is removed with :py:meth:`release_context`.
+    Tasks are functions ``func(context, item)`` executed by :py:meth:`map`.
+    If the pool size is zero or processes cannot be forked, tasks are executed in the current process
+
+    E.g.:
+
+    .. code-block:: python
+
+        pool = WorkerPool(pool_size=4)
+        key = pool.set_context(ga_operator)
+        fitnesses = pool.map(evaluate, population, key)
+        pool.release_context(key)
+        pool.close()
+
+    Attributes:
+        pool_size (int): number of processes
+    """
+
+    def __init__(self, pool_size=0):
+        """Initialization
+
+        Args:
+            pool_size (int): number of processes
+        """
+        self.pool_size = pool_size
+        self._pool = None
+        self._barrier = None
+        self._lock = threading.RLock()
+        self._keys = itertools.count()
+
+    def __del__(self):
+        """Finalizer
+        """
+        try:
+            self.close()
+        except AttributeError:
+            pass
+
+    @property
+    def is_parallel(self):
+        """Whether tasks are executed by worker processes or not
+
+        Returns:
+            bool: True if worker processes are used
+        """
+        return self._pool is not None
+
+    def start(self):
+        """Fork the worker processes if they are not running.
+        Workers inherit all contexts set until then
+        """
+        with self._lock:
+            if self._pool is not None or self.pool_size <= 0:
+                return
+            try:
+                # Require UNIX fork to work
+                mp_ctx = mp.get_context("fork")
+                pool_size = min(self.pool_size, mp_ctx.cpu_count())
+                self._barrier = mp_ctx.Barrier(pool_size)
+                self._pool = mp_ctx.Pool(processes=pool_size,
+                                         initializer=_init_worker,
+                                         initargs=[self._barrier])
+            except ValueError:
+                self._pool = None
+                self._barrier = None
+
+    def close(self):
+        """Terminate the worker processes
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.terminate()
+            self._pool = None
+            self._barrier = None
+
+    def _broadcast(self, func, arg):
+        """Execute a task once in every worker
+
+        Args:
+            func: task function synchronized by the workers' barrier
+            arg: task argument
+        Returns:
+            bool: True if all workers executed the task
+        """
+        nb_workers = self._barrier.parties
+        try:
+            self._pool.map(func, [arg] * nb_workers, chunksize=1)
+            return True
+        except (threading.BrokenBarrierError, RuntimeError):
+            return False
+
+    def set_context(self, context):
+        """Push a context to all workers
+
+        Args:
+            context: context object. It is pickled to be sent to the running workers
+        Returns:
+            int: context's key
+        """
+        with self._lock:
+            key = next(self._keys)
+            _contexts[key] = context
+            if self._pool is None:
+                self.start()
+                return key
+
+            try:
+                data = pickle.dumps(context, pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                data = None
+            if data is None or not self._broadcast(_push_context, (key, data)):
+                # Fork new workers, so they inherit the context
+                self.close()
+                self.start()
+            return key
+
+    def release_context(self, key):
+        """Remove a context from all workers
+
+        Args:
+            key (int): context's key
+        """
+        with self._lock:
+            _contexts.pop(key, None)
+            if self._pool is not None and not self._broadcast(_release_context, key):
+                self.close()
+
+    def map(self, func, items, key):
+        """Execute a task for each item
+
+        Args:
+            func: task function ``func(context, item)``. It must be a module-level function
+            items (list): list of items
+            key (int): context's key
+        Returns:
+            list: task results
+        """
+        pool = self._pool
+        if pool is None:
+            context = _contexts[key]
+            return [func(context, item) for item in items]
+        return pool.map(_run_task, [(key, func, item) for item in items])
@@ -1,4 +1,4 @@
-from sp.core.model import ControlInput
+from sp.core.model import ControlInput, LoadDistribution
 from sp.system_controller.model.opt_solution import OptSolution
 from sp.hierarchical_controller.global_ctrl.model import GlobalScenario, GlobalNode
 
@@ -50,11 +50,9 @@ def from_real_control_input(control_input, global_scenario, global_node):
             c_ctrl_input.app_placement[app.id][node.id] = False
             c_ctrl_input.received_load[app.id][node.id] = 0.0
             c_ctrl_input.allocated_resource[app.id][node.id] = {}
-            c_ctrl_input.load_distribution[app.id][node.id] = {}
+            c_ctrl_input.load_distribution[app.id][node.id] = LoadDistribution()
             for resource in real_scenario.resources:
                 c_ctrl_input.allocated_resource[app.id][node.id][resource.name] = 0.0
-            for dst_node in all_nodes:
-                c_ctrl_input.load_distribution[app.id][node.id][dst_node.id] = 0.0
 
     for app in real_scenario.apps:
         # For nodes inside the cluster
@@ -1,13 +1,17 @@
 from .coverage import Coverage
 from sp.physical_system.model.attached_user import AttachedUser
-import math
+from sp.core.geometry import SpatialIndex
+from sp.core.model import UserAttachments
+from sp.core.mobility.trace_store import get_users_position
 
 
 class CircleCoverage(Coverage):
     """Circle Coverage
 
     It attaches an user to the nearest (edge/base station) node.
-    The attachment only occurs if the distance between user and node is less than the specified radius
+    The attachment only occurs if the distance between user and node is less than the specified radius.
+    Nearest nodes of all users are found at once with a :py:class:`sp.core.geometry.SpatialIndex`,
+    and positions of users in a :py:class:`sp.core.mobility.TraceStore` are also obtained at once
 
     Attributes:
         radius (float): maximum distance between an user and a node. In meters if the GPS coordination system is used
@@ -31,32 +35,21 @@ class CircleCoverage(Coverage):
             distance_tolerance (float): distance tolerance. In meters if the GPS coordination system is used
 
         Returns:
-            dict: attached users indexed by their ids
+            UserAttachments: attached users indexed by their ids
         """
 
         time = system.time
         distance_tolerance = distance_tolerance if distance_tolerance is not None else 0.0
-        attachments = {}
 
-        for user in system.users:
-            attached_node_id = None
-            min_dist = math.inf
-            user_pos = user.get_position(time, time_tolerance=time_tolerance)
-
-            if user_pos is not None:
-                for node in system.bs_nodes:
-                    node_pos = node.position
-
-                    if node_pos is None:
-                        continue
-
-                    dist = user_pos.distance(node_pos)
-                    if dist < min_dist + distance_tolerance and dist <= self.radius + distance_tolerance:
-                        min_dist = dist
-                        attached_node_id = node.id
+        bs_nodes = [node for node in system.bs_nodes if node.position is not None]
+        users_pos = get_users_position(system.users, time, time_tolerance=time_tolerance)
+        index = SpatialIndex([node.position for node in bs_nodes])
+        nearest = index.nearest(users_pos, max_distance=self.radius, distance_tolerance=distance_tolerance)
 
+        attachments = UserAttachments()
+        for (user, user_pos, node_index) in zip(system.users, users_pos, nearest):
             attached_user = AttachedUser.from_user(user)
-            attached_user.node_id = attached_node_id
+            attached_user.node_id = bs_nodes[node_index].id if node_index is not None else None
             attached_user.position = user_pos
             attachments[attached_user.id] = attached_user
 
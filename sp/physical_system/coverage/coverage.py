@@ -16,7 +16,7 @@ class Coverage(ABC):
             distance_tolerance (float): distance tolerance. In meters if the GPS coordination system is used
 
         Returns:
-            dict: attached users indexed by their ids
+            sp.core.model.user_attachments.UserAttachments: attached users indexed by their ids
         """
         pass
 
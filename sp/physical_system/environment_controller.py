@@ -2,7 +2,7 @@ from sp.physical_system.coverage.min_distance import Coverage, MinDistanceCovera
 from sp.physical_system.routing.shortest_path import Routing, ShortestPathRouting
 from sp.physical_system.estimator import LinkDelayEstimator, DefaultLinkDelayEstimator
 from sp.physical_system.estimator import GeneratedLoadEstimator, DefaultGeneratedLoadEstimator
-from sp.core.model import EnvironmentInput
+from sp.core.model import ArrayEnvironmentInput
 
 
 class EnvironmentController:
@@ -46,17 +46,19 @@ class EnvironmentController:
         Args:
             system (sp.core.model.system.System): system's state
         Returns:
-            EnvironmentInput: environment input of the specified time
+            ArrayEnvironmentInput: environment input of the specified time
         """
 
-        env = EnvironmentInput()
+        env = ArrayEnvironmentInput.create_empty(system)
 
         time_tol = system.sampling_time
         env.attached_users = self.coverage.update(system, env, time_tolerance=time_tol)
-        env.generated_load = self.gen_load_estimator.calc_all_loads(system, env, time_tolerance=time_tol)
+        for (app_id, loads) in self.gen_load_estimator.calc_all_loads(system, env, time_tolerance=time_tol).items():
+            env.generated_load[app_id] = loads
 
         self.routing.update(system, env)
-        env.net_delay = self.routing.get_all_paths_length()
-        env.net_path = self.routing.get_all_paths()
+        for (app_id, distances) in self.routing.get_all_paths_length().items():
+            env.net_delay[app_id] = distances
+        env.net_path = self.routing.get_path_table(system)
 
         return env
@@ -1,3 +1,4 @@
+from sp.core.model import NetPathTable
 from abc import ABC, abstractmethod
 
 
@@ -73,6 +74,17 @@ class Routing(ABC):
         """
         return None
 
+    def get_path_table(self, system):
+        """Get path between all pair of nodes for each application as a read-only table.
+        See :py:class:`sp.core.model.net_path_table.NetPathTable`
+
+        Args:
+            system (sp.core.model.system.System): system's state
+        Returns:
+            NetPathTable: all paths
+        """
+        return NetPathTable.from_dict(self.get_all_paths(), system.apps_index, system.nodes_index)
+
     @abstractmethod
     def update(self, system, environment_input):
         """Update the routing based on the system's state and environment input
@@ -11,6 +11,8 @@ class ShortestPathRouting(Routing):
         link_delay_estimator (LinkDelayEstimator): link delay estimator
         paths (dict): all network paths for each application
         distances (dict): all network distances for each application
+        path_table (NetPathTable): all network paths as a read-only table.
+            It is shared by the environment inputs while the paths do not change
     """
 
     def __init__(self):
@@ -22,6 +24,7 @@ class ShortestPathRouting(Routing):
 
         self.paths = None
         self.distances = None
+        self.path_table = None
 
     def get_path(self, app_id, src_node_id, dst_node_id):
         """Get path between two nodes for an application
@@ -66,6 +69,21 @@ class ShortestPathRouting(Routing):
         """
         return self.distances
 
+    def get_path_table(self, system):
+        """Get path between all pair of nodes for each application as a read-only table.
+        The table is cached until the paths are updated
+
+        Args:
+            system (sp.core.model.system.System): system's state
+        Returns:
+            NetPathTable: all paths
+        """
+        table = self.path_table
+        if table is None or table.apps_index != system.apps_index or table.nodes_index != system.nodes_index:
+            table = Routing.get_path_table(self, system)
+            self.path_table = table
+        return table
+
     def update(self, system, environment_input):
         """Update the routing based on the system's state and environment input
 
@@ -82,6 +100,7 @@ class ShortestPathRouting(Routing):
 
         self.distances = {}
         self.paths = {}
+        self.path_table = None
         for app in system.apps:
             delay_estimator = self.link_delay_estimator
 
@@ -1,5 +1,6 @@
 from .monitor import Monitor
 from sp.system_controller import util
+from sp.system_controller.metric.engine import MetricEngine
 import time
 import os
 import json
@@ -62,10 +63,9 @@ class OptimizerMonitor(Monitor):
         elapsed_time = time.perf_counter() - self._perf_count
         valid = util.is_solution_valid(system, control_input, environment_input, **self.valid_checking_extra_params)
         datum = {'time': sim_time, 'opt': opt_name, 'elapsed_time': elapsed_time, 'valid': valid}
-        for func in self.metrics_func:
-            key = func.__name__
-            value = func(system, control_input, environment_input)
-            datum[key] = value
+        engine = MetricEngine(system, control_input, environment_input)
+        for (func, value) in zip(self.metrics_func, engine.evaluate(self.metrics_func)):
+            datum[func.__name__] = value
 
         # apps_type = []
         # for app in system.apps:
@@ -2,6 +2,7 @@ from sp.core.estimator import Estimator
 from sp.core.model import System, EnvironmentInput, ControlInput
 from sp.system_controller.util.calc import calc_received_load
 from abc import ABC, abstractmethod
+import numpy as np
 import math
 
 
@@ -24,6 +25,27 @@ class ProcessingEstimator(Estimator):
         """
         pass
 
+    def calc_all(self, system, control_input, environment_input):
+        """Estimate the state of the processors of all applications in all nodes
+
+        Args:
+            system (System): system
+            control_input (ControlInput): control input
+            environment_input (EnvironmentInput):  environment input
+        Returns:
+            tuple: processing delays and queue sizes,
+                both arrays (apps x nodes) ordered as ``system.apps`` and ``system.nodes``
+        """
+        shape = (len(system.apps), len(system.nodes))
+        delay = np.zeros(shape)
+        queue_size = np.zeros(shape)
+        for (a, app) in enumerate(system.apps):
+            for (n, node) in enumerate(system.nodes):
+                result = self.calc(app.id, node.id, system, control_input, environment_input)
+                delay[a, n] = result.delay
+                queue_size[a, n] = result.queue_size
+        return delay, queue_size
+
 
 class ProcessingResult(ABC):
     """Processing Estimation Result Abstract Class.
@@ -91,6 +113,33 @@ class DefaultProcessingEstimator(ProcessingEstimator):
 
         return DefaultProcessingResult(arrival_rate, service_rate)
 
+    def calc_all(self, system, control_input, environment_input):
+        """Estimate the state of the processors of all applications in all nodes.
+        Arrival and service rates are computed as arrays, see :py:class:`DefaultProcessingResult`
+
+        Args:
+            system (System): system
+            control_input (ControlInput): control input
+            environment_input (EnvironmentInput):  environment input
+        Returns:
+            tuple: processing delays and queue sizes,
+                both arrays (apps x nodes) ordered as ``system.apps`` and ``system.nodes``
+        """
+        from sp.system_controller.metric.engine import MetricEngine
+
+        engine = MetricEngine(system, control_input, environment_input)
+        arrival_rate = engine.received_load
+        service_rate = engine.service_rate
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delay = np.where(service_rate > arrival_rate, 1.0 / (service_rate - arrival_rate), math.inf)
+            delay[(service_rate == 0.0) & (arrival_rate == 0.0)] = 0.0
+
+            p = arrival_rate / service_rate
+            queue_size = np.where((service_rate > arrival_rate) & (arrival_rate > 0.0), p ** 2 / (1.0 - p), math.inf)
+            queue_size[arrival_rate == 0.0] = 0.0
+        return delay, queue_size
+
 
 class DefaultProcessingResult(ProcessingResult):
     """Default Processing Estimation Result.
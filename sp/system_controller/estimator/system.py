@@ -44,17 +44,13 @@ class DefaultSystemEstimator(SystemEstimator):
         next_system.environment_input = environment_input
 
         proc_estimator = DefaultProcessingEstimator()
-        for app in next_system.apps:
-            for dst_node in next_system.nodes:
+        delay, queue_size = proc_estimator.calc_all(system, control_input, environment_input)
+        for (a, app) in enumerate(next_system.apps):
+            for (n, dst_node) in enumerate(next_system.nodes):
                 if not control_input.get_app_placement(app.id, dst_node.id):
                     continue
 
-                proc_result = proc_estimator(app.id, dst_node.id,
-                                             system=system,
-                                             control_input=control_input,
-                                             environment_input=environment_input)
-
-                next_system.processing_delay[app.id][dst_node.id] = proc_result.delay
-                next_system.app_queue_size[app.id][dst_node.id] = proc_result.queue_size
+                next_system.processing_delay[app.id][dst_node.id] = float(delay[a, n])
+                next_system.app_queue_size[app.id][dst_node.id] = float(queue_size[a, n])
 
         return next_system
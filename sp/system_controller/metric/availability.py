@@ -1,79 +1,87 @@
 from sp.core.model import System, ControlInput, EnvironmentInput
+from .engine import MetricEngine, engine_metric
 from statistics import mean
+import numpy as np
 
 
-def avg_unavailability(system, control_input, environment_input):
+@engine_metric
+def avg_unavailability(system, control_input, environment_input, engine=None):
     """Average Unavailability Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
 
-    probs = _calc_unavailability_probability(system, control_input, environment_input)
+    probs = _calc_unavailability_probability(system, control_input, environment_input, engine=engine)
     return mean(probs) if len(probs) > 0 else 0.0
 
 
-def avg_availability(system, control_input, environment_input):
+@engine_metric
+def avg_availability(system, control_input, environment_input, engine=None):
     """Average Availability Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    probs = _calc_unavailability_probability(system, control_input, environment_input)
+    probs = _calc_unavailability_probability(system, control_input, environment_input, engine=engine)
     return mean(map(lambda p: 1.0 - p, probs)) if len(probs) > 0 else 0.0
 
 
-def max_unavailability(system, control_input, environment_input):
+@engine_metric
+def max_unavailability(system, control_input, environment_input, engine=None):
     """Maximum Unavailability Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    probs = _calc_unavailability_probability(system, control_input, environment_input)
+    probs = _calc_unavailability_probability(system, control_input, environment_input, engine=engine)
     return max(probs) if len(probs) > 0 else 0.0
 
 
-def min_availability(system, control_input, environment_input):
+@engine_metric
+def min_availability(system, control_input, environment_input, engine=None):
     """Minimum Availability Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    probs = _calc_unavailability_probability(system, control_input, environment_input)
+    probs = _calc_unavailability_probability(system, control_input, environment_input, engine=engine)
     return min(map(lambda p: 1.0 - p, probs)) if len(probs) > 0 else 0.0
 
 
-def _calc_unavailability_probability(system, control_input, environment_input):
+def _calc_unavailability_probability(system, control_input, environment_input, engine=None):
     """Calculate unavailability for every application place on nodes
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         list: list of metric values
     """
-    probs = []
-    for app in system.apps:
-        fail_prob = 1.0
-        for node in system.nodes:
-            if control_input.app_placement[app.id][node.id]:
-                fail_prob *= (1.0 - app.availability * node.availability)
-        probs.append(fail_prob)
-    return probs
+    engine = MetricEngine.create(system, control_input, environment_input, engine=engine)
+    app_avail = np.array([app.availability for app in engine.apps], dtype=float)
+    node_avail = np.array([node.availability for node in engine.nodes], dtype=float)
+    fail_probs = np.where(engine.placement, 1.0 - np.outer(app_avail, node_avail), 1.0)
+    return fail_probs.prod(axis=1).tolist()
@@ -1,69 +1,78 @@
 from sp.core.model import System, ControlInput, EnvironmentInput
+from .engine import MetricEngine, engine_metric
 from statistics import mean
+import numpy as np
 
 
-def overall_cost(system, control_input, environment_input):
+@engine_metric
+def overall_cost(system, control_input, environment_input, engine=None):
     """Overall Allocation Cost Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    costs = _calc_resource_allocation_cost(system, control_input, environment_input)
+    costs = _calc_resource_allocation_cost(system, control_input, environment_input, engine=engine)
     return sum(costs) if len(costs) > 0 else 0.0
 
 
-def max_cost(system, control_input, environment_input):
+@engine_metric
+def max_cost(system, control_input, environment_input, engine=None):
     """Maximum Allocation Cost Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    costs = _calc_resource_allocation_cost(system, control_input, environment_input)
+    costs = _calc_resource_allocation_cost(system, control_input, environment_input, engine=engine)
     return max(costs) if len(costs) > 0 else 0.0
 
 
-def avg_cost(system, control_input, environment_input):
+@engine_metric
+def avg_cost(system, control_input, environment_input, engine=None):
     """Average Allocation Cost Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    costs = _calc_resource_allocation_cost(system, control_input, environment_input)
+    costs = _calc_resource_allocation_cost(system, control_input, environment_input, engine=engine)
     return mean(costs) if len(costs) > 0 else 0.0
 
 
-def _calc_resource_allocation_cost(system, control_input, environment_input):
+def _calc_resource_allocation_cost(system, control_input, environment_input, engine=None):
     """Calculate resource allocation cost for every application instance placed on nodes
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         list: list of metric values
     """
+    engine = MetricEngine.create(system, control_input, environment_input, engine=engine)
+    alloc = engine.allocated_resource
+    resources = system.resources
     costs = []
-    for app in system.apps:
-        for node in system.nodes:
-            if not control_input.app_placement[app.id][node.id]:
-                continue
-            cost = 0.0
-            for resource in system.resources:
-                alloc_resource = control_input.allocated_resource[app.id][node.id][resource.name]
-                cost += node.cost[resource.name](alloc_resource)
-            if system.sampling_time > 0.0:
-                cost *= system.sampling_time
-            costs.append(cost)
+    for (a, n) in zip(*np.nonzero(engine.placement)):
+        node = engine.nodes[n]
+        cost = 0.0
+        for (r, resource) in enumerate(resources):
+            cost += node.cost[resource.name](float(alloc[a, n, r]))
+        if system.sampling_time > 0.0:
+            cost *= system.sampling_time
+        costs.append(cost)
     return costs
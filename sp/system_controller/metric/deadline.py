@@ -1,155 +1,171 @@
 from sp.core.model import System, ControlInput, EnvironmentInput
-from sp.system_controller.util import calc_response_time, calc_load_after_distribution
+from .engine import MetricEngine, engine_metric
 from numpy import mean, average
+import numpy as np
 
 
-def max_deadline_violation(system, control_input, environment_input):
+@engine_metric
+def max_deadline_violation(system, control_input, environment_input, engine=None):
     """Maximum Deadline Violation Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta = _calc_delta_time(system, control_input, environment_input)
-    violations = list(filter(lambda d: d > 0.0, delta))
-    return max(violations) if len(violations) > 0 else 0.0
+    delta = _calc_delta_time(system, control_input, environment_input, engine=engine)
+    violations = delta[delta > 0.0]
+    return float(violations.max()) if len(violations) > 0 else 0.0
 
 
-def avg_deadline_violation(system, control_input, environment_input):
+@engine_metric
+def avg_deadline_violation(system, control_input, environment_input, engine=None):
     """Average Deadline Violation Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta = _calc_delta_time(system, control_input, environment_input)
-    violations = list(map(lambda d: max(0.0, d), delta))
-    return mean(violations) if len(violations) > 0 else 0.0
+    delta = _calc_delta_time(system, control_input, environment_input, engine=engine)
+    violations = np.maximum(delta, 0.0)
+    return float(mean(violations)) if len(violations) > 0 else 0.0
 
 
-def weighted_avg_deadline_violation(system, control_input, environment_input):
+@engine_metric
+def weighted_avg_deadline_violation(system, control_input, environment_input, engine=None):
     """Weighted Average Deadline Violation Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True)
-    violations = list(map(lambda d: max(0.0, d), delta))
-    total_load = sum(load) if len(load) > 0 else 0.0
+    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True, engine=engine)
+    violations = np.maximum(delta, 0.0)
+    total_load = load.sum()
     if len(violations) > 0 and total_load > 0.0:
-        return average(violations, weights=load)
+        return float(average(violations, weights=load))
     else:
         return 0.0
 
 
-def avg_only_violated_deadline(system, control_input, environment_input):
+@engine_metric
+def avg_only_violated_deadline(system, control_input, environment_input, engine=None):
     """Average Only Violated Deadline Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta = _calc_delta_time(system, control_input, environment_input)
-    violations = list(filter(lambda d: d > 0.0, delta))
-    return mean(violations) if len(violations) > 0 else 0.0
+    delta = _calc_delta_time(system, control_input, environment_input, engine=engine)
+    violations = delta[delta > 0.0]
+    return float(mean(violations)) if len(violations) > 0 else 0.0
 
 
-def weighted_avg_only_violated_deadline(system, control_input, environment_input):
+@engine_metric
+def weighted_avg_only_violated_deadline(system, control_input, environment_input, engine=None):
     """Average Only Violated Deadline Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True)
-    filtered_index = list(filter(lambda i: delta[i] > 0.0, range(len(delta))))
-    violations = [delta[i] for i in filtered_index]
-    load = [load[i] for i in filtered_index]
-    total_load = sum(load) if len(load) > 0 else 0.0
+    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True, engine=engine)
+    violated = delta > 0.0
+    violations = delta[violated]
+    load = load[violated]
+    total_load = load.sum()
     if len(violations) > 0 and total_load > 0.0:
-        return average(violations, weights=load)
+        return float(average(violations, weights=load))
     else:
         return 0.0
 
 
-def overall_deadline_violation(system, control_input, environment_input):
+@engine_metric
+def overall_deadline_violation(system, control_input, environment_input, engine=None):
     """Overall Deadline Violation Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta = _calc_delta_time(system, control_input, environment_input)
-    violations = list(filter(lambda d: d > 0.0, delta))
-    return sum(violations) if len(violations) > 0 else 0.0
+    delta = _calc_delta_time(system, control_input, environment_input, engine=engine)
+    return float(delta[delta > 0.0].sum())
 
 
-def weighted_overall_deadline_violation(system, control_input, environment_input):
+@engine_metric
+def weighted_overall_deadline_violation(system, control_input, environment_input, engine=None):
     """Weighted Overall Deadline Violation Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True)
-    violations = list(map(lambda i: max(delta[i], 0.0) * load[i], range(len(delta))))
-    return sum(violations) if len(violations) > 0 else 0.0
+    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True, engine=engine)
+    return float((np.maximum(delta, 0.0) * load).sum())
 
 
-def deadline_satisfaction(system, control_input, environment_input):
+@engine_metric
+def deadline_satisfaction(system, control_input, environment_input, engine=None):
     """Deadline Satisfaction Rate Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta = _calc_delta_time(system, control_input, environment_input)
-    success_count = sum(map(lambda d: d <= 0.0, delta))
+    delta = _calc_delta_time(system, control_input, environment_input, engine=engine)
+    success_count = np.count_nonzero(delta <= 0.0)
     return success_count / float(len(delta)) if len(delta) > 0 else 1.0
 
 
-def weighted_deadline_satisfaction(system, control_input, environment_input):
+@engine_metric
+def weighted_deadline_satisfaction(system, control_input, environment_input, engine=None):
     """Weighted Deadline Satisfaction Rate Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True)
-    sat = list(map(lambda i: load[i] if delta[i] <= 0.0 else 0.0, range(len(delta))))
-    total_load = sum(load) if len(load) > 0 else 0.0
-    return sum(sat) / total_load if len(sat) > 0 and total_load > 0.0 else 0.0
+    delta, load = _calc_delta_time(system, control_input, environment_input, return_load=True, engine=engine)
+    total_load = load.sum()
+    return float(load[delta <= 0.0].sum() / total_load) if len(delta) > 0 and total_load > 0.0 else 0.0
 
 
-def _calc_delta_time(system, control_input, environment_input, return_load=False):
+def _calc_delta_time(system, control_input, environment_input, return_load=False, engine=None):
     """Calculate difference between response time and deadline for all request flows
 
     Args:
@@ -157,24 +173,13 @@ def _calc_delta_time(system, control_input, environment_input, return_load=False
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
         return_load (bool): Return along with time deltas, the loads of each request flow
+        engine (MetricEngine): shared metric engine
     Returns:
-        Union[list, tuple]: lists of time deltas or a tuple with time deltas and loads
+        Union[numpy.ndarray, tuple]: time deltas or a tuple with time deltas and loads
     """
-    deltas, loads = [], []
-    for app in system.apps:
-        for dst_node in system.nodes:
-            if not control_input.get_app_placement(app.id, dst_node.id):
-                continue
-            for src_node in system.nodes:
-                load = calc_load_after_distribution(app.id, src_node.id, dst_node.id,
-                                                    system, control_input, environment_input)
-                if load > 0.0:
-                    rt = calc_response_time(app.id, src_node.id, dst_node.id,
-                                            system, control_input, environment_input)
-                    deltas.append(rt - app.deadline)
-                    loads.append(load)
+    engine = MetricEngine.create(system, control_input, environment_input, engine=engine)
+    deltas = engine.active_flow_response_time - engine.active_flow_deadline
     if return_load:
-        return deltas, loads
+        return deltas, engine.active_flow_load
     else:
         return deltas
-
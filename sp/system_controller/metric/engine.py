@@ -0,0 +1,475 @@
+from sp.core.model import Resource, ArrayEnvironmentInput
+from sp.system_controller.model import OptSolution, ArrayOptSolution
+from sp.system_controller.util.calc import calc_min_migration_delays, calc_network_delays
+from sp.system_controller.estimator.processing import DefaultProcessingResult
+from sp.core.util.cached_property import cached_property
+import numpy as np
+
+_ENGINE_METRICS = set()
+
+
+def engine_metric(metric_func):
+    """Register a metric function that accepts a :py:class:`MetricEngine` by the ``engine`` keyword argument.
+    Registered metrics share the same engine when evaluated by :py:meth:`MetricEngine.evaluate`
+
+    Args:
+        metric_func: metric function
+    Returns:
+        the same metric function
+    """
+    _ENGINE_METRICS.add(metric_func)
+    return metric_func
+
+
+class MetricEngine:
+    """Vectorized Metric Engine
+
+    It calculates with NumPy the loads and delays of all request flows for a system's state, control input,
+    and environment input. Each quantity is calculated once, when it is first accessed,
+    and it is shared by all metrics evaluated with the same engine.
+
+    Arrays are indexed by the position of applications and nodes in ``system.apps`` and ``system.nodes``.
+    Request flows are indexed as (application, source node, destination node)
+
+    Attributes:
+        system (sp.core.model.system.System): system
+        control_input (sp.core.model.control_input.ControlInput): control input
+        environment_input (sp.core.model.environment_input.EnvironmentInput): environment input
+        apps (list(sp.core.model.application.Application)): applications
+        nodes (list(sp.core.model.node.Node)): nodes
+    """
+
+    def __init__(self, system, control_input, environment_input):
+        """Initialization
+
+        Args:
+            system (sp.core.model.system.System): system
+            control_input (sp.core.model.control_input.ControlInput): control input
+            environment_input (sp.core.model.environment_input.EnvironmentInput): environment input
+        """
+        self.system = system
+        self.control_input = control_input
+        self.environment_input = environment_input
+        self.apps = system.apps
+        self.nodes = system.nodes
+
+    @classmethod
+    def create(cls, system, control_input, environment_input, engine=None):
+        """Get an engine for the specified inputs
+
+        Args:
+            system (sp.core.model.system.System): system
+            control_input (sp.core.model.control_input.ControlInput): control input
+            environment_input (sp.core.model.environment_input.EnvironmentInput): environment input
+            engine (MetricEngine): engine shared by metrics. It is used if it has been created for the same inputs
+        Returns:
+            MetricEngine: engine
+        """
+        if engine is not None and engine.system is system and engine.control_input is control_input \
+                and engine.environment_input is environment_input:
+            return engine
+        return cls(system, control_input, environment_input)
+
+    def evaluate(self, metrics):
+        """Evaluate a list of metrics.
+        Metrics registered with :py:func:`engine_metric` reuse this engine
+
+        Args:
+            metrics (list): metric functions
+        Returns:
+            list(float): metric values
+        """
+        values = []
+        for metric_func in metrics:
+            if metric_func in _ENGINE_METRICS:
+                value = metric_func(self.system, self.control_input, self.environment_input, engine=self)
+            else:
+                value = metric_func(self.system, self.control_input, self.environment_input)
+            values.append(value)
+        return values
+
+    def _array_indexes(self, apps_index, nodes_index):
+        """Get the array positions of the system's applications and nodes
+
+        Args:
+            apps_index (dict): map of application's id to its index
+            nodes_index (dict): map of node's id to its index
+        Returns:
+            tuple: applications' and nodes' positions. A position is None if the array is already aligned
+        """
+        apps_pos = [apps_index[app.id] for app in self.apps]
+        nodes_pos = [nodes_index[node.id] for node in self.nodes]
+        if apps_pos == list(range(len(apps_index))):
+            apps_pos = None
+        if nodes_pos == list(range(len(nodes_index))):
+            nodes_pos = None
+        return apps_pos, nodes_pos
+
+    @staticmethod
+    def _select(array, apps_pos, nodes_pos, nb_node_dims):
+        """Select the system's applications and nodes from an array
+
+        Args:
+            array (numpy.ndarray): array indexed by application and node(s)
+            apps_pos (list): applications' positions or None to select all
+            nodes_pos (list): nodes' positions or None to select all
+            nb_node_dims (int): number of node dimensions after the application dimension
+        Returns:
+            numpy.ndarray: selected array
+        """
+        if apps_pos is not None:
+            array = array[apps_pos]
+        if nodes_pos is not None:
+            for dim in range(1, nb_node_dims + 1):
+                array = np.take(array, nodes_pos, axis=dim)
+        return array
+
+    @cached_property
+    def _control_pos(self):
+        """Array positions of the control input if it is array-backed
+        """
+        control = self.control_input
+        if not isinstance(control, ArrayOptSolution):
+            return None
+        return self._array_indexes(control.apps_index, control.nodes_index)
+
+    @cached_property
+    def _environment_pos(self):
+        """Array positions of the environment input if it is array-backed
+        """
+        env = self.environment_input
+        if not isinstance(env, ArrayEnvironmentInput):
+            return None
+        return self._array_indexes(env.apps_index, env.nodes_index)
+
+    @cached_property
+    def placement(self):
+        """Application placement
+
+        Returns:
+            numpy.ndarray: boolean array (apps x nodes)
+        """
+        if self._control_pos is not None:
+            return self._select(self.control_input.placement, *self._control_pos, 1)
+        control = self.control_input
+        return np.array([[control.get_app_placement(app.id, node.id) for node in self.nodes]
+                         for app in self.apps], dtype=bool).reshape(len(self.apps), len(self.nodes))
+
+    @cached_property
+    def allocated_resource(self):
+        """Allocated resources, ordered as ``system.resources``
+
+        Returns:
+            numpy.ndarray: array (apps x nodes x resources)
+        """
+        resources = self.system.resources
+        if self._control_pos is not None:
+            control = self.control_input
+            alloc = self._select(control.alloc, *self._control_pos, 1)
+            return alloc[:, :, [control.resources_index[r.name] for r in resources]]
+        control = self.control_input
+        return np.array([[[control.get_allocated_resource(app.id, node.id, r.name) for r in resources]
+                          for node in self.nodes] for app in self.apps],
+                        dtype=float).reshape(len(self.apps), len(self.nodes), len(resources))
+
+    def get_allocated_resource(self, resource_name):
+        """Get the allocated amount of a resource
+
+        Args:
+            resource_name (str): resource's name
+        Returns:
+            numpy.ndarray: array (apps x nodes)
+        """
+        index = [resource.name for resource in self.system.resources].index(resource_name)
+        return self.allocated_resource[:, :, index]
+
+    @cached_property
+    def load_distribution(self):
+        """Load distribution
+
+        Returns:
+            numpy.ndarray: array (apps x source nodes x destination nodes)
+        """
+        if self._control_pos is not None:
+            return self._select(self.control_input.ld, *self._control_pos, 2)
+        control = self.control_input
+        nodes_index = {node.id: index for (index, node) in enumerate(self.nodes)}
+        ld = np.zeros((len(self.apps), len(self.nodes), len(self.nodes)))
+        for (a, app) in enumerate(self.apps):
+            for (src_node_id, dst_node_id, value) in control.get_load_flows(app.id):
+                if src_node_id in nodes_index and dst_node_id in nodes_index:
+                    ld[a, nodes_index[src_node_id], nodes_index[dst_node_id]] = value
+        return ld
+
+    @cached_property
+    def generated_load(self):
+        """Load generated by users
+
+        Returns:
+            numpy.ndarray: array (apps x nodes)
+        """
+        if self._environment_pos is not None:
+            return self._select(self.environment_input.load, *self._environment_pos, 1)
+        env = self.environment_input
+        return np.array([[env.get_generated_load(app.id, node.id) for node in self.nodes] for app in self.apps],
+                        dtype=float).reshape(len(self.apps), len(self.nodes))
+
+    @cached_property
+    def net_delay(self):
+        """Network delay
+
+        Returns:
+            numpy.ndarray: array (apps x source nodes x destination nodes)
+        """
+        return calc_network_delays(self.system, self.environment_input)
+
+    @cached_property
+    def load_before_distribution(self):
+        """Load before distribution.
+        See :py:func:`sp.system_controller.util.calc.calc_load_before_distribution`
+
+        Returns:
+            numpy.ndarray: array (apps x nodes)
+        """
+        system = self.system
+        queue_size = np.array([[system.get_app_queue_size(app.id, node.id) for node in self.nodes]
+                               for app in self.apps], dtype=float).reshape(len(self.apps), len(self.nodes))
+        return self.generated_load + queue_size / float(system.sampling_time)
+
+    @cached_property
+    def flow_load(self):
+        """Load of each request flow.
+        See :py:func:`sp.system_controller.util.calc.calc_load_after_distribution`
+
+        Returns:
+            numpy.ndarray: array (apps x source nodes x destination nodes)
+        """
+        return self.load_before_distribution[:, :, np.newaxis] * self.load_distribution
+
+    @cached_property
+    def received_load(self):
+        """Load received by each node.
+        See :py:func:`sp.system_controller.util.calc.calc_received_load`
+
+        Returns:
+            numpy.ndarray: array (apps x nodes)
+        """
+        if self._control_pos is not None:
+            return self._select(self.control_input.rl, *self._control_pos, 1)
+        if isinstance(self.control_input, OptSolution):
+            control = self.control_input
+            return np.array([[control.get_received_load(app.id, node.id) for node in self.nodes]
+                             for app in self.apps], dtype=float).reshape(len(self.apps), len(self.nodes))
+        return self.flow_load.sum(axis=1)
+
+    @cached_property
+    def service_rate(self):
+        """Service rate of each application instance
+
+        Returns:
+            numpy.ndarray: array (apps x nodes)
+        """
+        work_size = np.array([app.work_size for app in self.apps], dtype=float)
+        return self.get_allocated_resource(Resource.CPU) / work_size[:, np.newaxis]
+
+    @cached_property
+    def proc_delay(self):
+        """Processing delay of each application instance using the M/M/1 queueing model.
+        See :py:func:`sp.system_controller.util.calc.calc_processing_delay`
+
+        Returns:
+            numpy.ndarray: array (apps x nodes)
+        """
+        mu = self.service_rate
+        rate_diff = mu - self.received_load
+        stable = (self.get_allocated_resource(Resource.CPU) > 0.0) & (rate_diff > 0.0)
+        delay = np.full(mu.shape, np.inf)
+        np.divide(1.0, rate_diff, out=delay, where=stable)
+        return delay
+
+    def get_processing_result(self, app_id, node_id):
+        """Get the processing state of an application instance.
+        See :py:class:`sp.system_controller.estimator.processing.DefaultProcessingEstimator`
+
+        Args:
+            app_id (int): application's id
+            node_id (int): node's id
+        Returns:
+            DefaultProcessingResult: processor's state
+        """
+        a = self.apps_index[app_id]
+        n = self.nodes_index[node_id]
+        return DefaultProcessingResult(float(self.received_load[a, n]), float(self.service_rate[a, n]))
+
+    @cached_property
+    def apps_index(self):
+        """Map of application's id to its position in the engine's arrays
+
+        Returns:
+            dict: positions
+        """
+        return {app.id: a for (a, app) in enumerate(self.apps)}
+
+    @cached_property
+    def nodes_index(self):
+        """Map of node's id to its position in the engine's arrays
+
+        Returns:
+            dict: positions
+        """
+        return {node.id: n for (n, node) in enumerate(self.nodes)}
+
+    @cached_property
+    def app_size(self):
+        """Size of each placed application instance, i.e., the amount of RAM and DISK allocated to it.
+        See :py:func:`sp.system_controller.util.calc.calc_app_size`
+
+        Returns:
+            numpy.ndarray: array (apps x nodes). It is zero for nodes not hosting the application
+        """
+        size = np.zeros(self.placement.shape)
+        resources_name = [r.name for r in self.system.resources]
+        for resource_name in (Resource.RAM, Resource.DISK):
+            if resource_name in resources_name:
+                size += self.get_allocated_resource(resource_name)
+        return np.where(self.placement, size, 0.0)
+
+    @cached_property
+    def current_placement(self):
+        """Application placement of the current system's state
+
+        Returns:
+            numpy.ndarray: boolean array (apps x nodes) or None if the system does not have a control input
+        """
+        curr_control = self.system.control_input
+        if curr_control is None:
+            return None
+        if isinstance(curr_control, ArrayOptSolution):
+            apps_pos, nodes_pos = self._array_indexes(curr_control.apps_index, curr_control.nodes_index)
+            return self._select(curr_control.placement, apps_pos, nodes_pos, 1)
+        return np.array([[curr_control.get_app_placement(app.id, node.id) for node in self.nodes]
+                         for app in self.apps], dtype=bool).reshape(len(self.apps), len(self.nodes))
+
+    @cached_property
+    def new_placement(self):
+        """Application instances that are not running in the current system's state
+
+        Returns:
+            numpy.ndarray: boolean array (apps x nodes)
+        """
+        if self.current_placement is None:
+            return np.zeros(self.placement.shape, dtype=bool)
+        return self.placement & ~self.current_placement
+
+    @cached_property
+    def min_migration_delay(self):
+        """Minimum migration delay of new application instances.
+        See :py:func:`sp.system_controller.util.calc.calc_min_migration_delay`
+
+        Returns:
+            numpy.ndarray: array (apps x nodes). It is zero for instances that are not new
+        """
+        delay = np.zeros(self.placement.shape)
+        new_placement = self.new_placement
+        for a in np.nonzero(new_placement.any(axis=1))[0]:
+            app_delay = calc_min_migration_delays(self.apps[a].id, self.system,
+                                                  self.control_input, self.environment_input)
+            delay[a] = np.where(new_placement[a], app_delay, 0.0)
+        return delay
+
+    @cached_property
+    def init_delay(self):
+        """Initialization delay of each application instance.
+        See :py:func:`sp.system_controller.util.calc.calc_initialization_delay`
+
+        Returns:
+            numpy.ndarray: array (apps x nodes)
+        """
+        t = self.system.sampling_time
+        mig_delay = self.min_migration_delay
+        with np.errstate(invalid="ignore"):
+            init_delay = np.where(t > mig_delay, mig_delay * (mig_delay + 1.0) / (2.0 * t), mig_delay)
+        return np.where(self.new_placement, init_delay, 0.0)
+
+    @cached_property
+    def response_time(self):
+        """Response time of each request flow.
+        See :py:func:`sp.system_controller.util.calc.calc_response_time`
+
+        Returns:
+            numpy.ndarray: array (apps x source nodes x destination nodes)
+        """
+        dst_delay = self.proc_delay + self.init_delay
+        return self.net_delay + dst_delay[:, np.newaxis, :]
+
+    @cached_property
+    def flow_mask(self):
+        """Active request flows, i.e., flows with load to a node hosting the application
+
+        Returns:
+            numpy.ndarray: boolean array (apps x source nodes x destination nodes)
+        """
+        return self.placement[:, np.newaxis, :] & (self.flow_load > 0.0)
+
+    @cached_property
+    def _flow_order(self):
+        """Active request flows in (application, destination node, source node) order.
+        Only the non-zero entries of the load distribution are visited
+        """
+        a, s, d = np.nonzero(self.load_distribution)
+        load = self.load_before_distribution[a, s] * self.load_distribution[a, s, d]
+        active = self.placement[a, d] & (load > 0.0)
+        a, s, d = a[active], s[active], d[active]
+        order = np.lexsort((s, d, a))
+        return a[order], d[order], s[order]
+
+    def get_flow_values(self, values):
+        """Get the values of the active request flows,
+        ordered by application, destination node, and source node
+
+        Args:
+            values (numpy.ndarray): array (apps x source nodes x destination nodes)
+        Returns:
+            numpy.ndarray: 1-D array of values
+        """
+        a, d, s = self._flow_order
+        return values[a, s, d]
+
+    @cached_property
+    def active_flow_response_time(self):
+        """Response time of the active request flows, ordered as in :py:meth:`get_flow_values`
+
+        Returns:
+            numpy.ndarray: 1-D array of response times
+        """
+        a, d, s = self._flow_order
+        return self.net_delay[a, s, d] + (self.proc_delay[a, d] + self.init_delay[a, d])
+
+    @cached_property
+    def active_flow_load(self):
+        """Load of the active request flows, ordered as in :py:meth:`get_flow_values`
+
+        Returns:
+            numpy.ndarray: 1-D array of loads
+        """
+        a, d, s = self._flow_order
+        return self.load_before_distribution[a, s] * self.load_distribution[a, s, d]
+
+    @cached_property
+    def active_flow_deadline(self):
+        """Deadline of the active request flows, ordered as in :py:meth:`get_flow_values`
+
+        Returns:
+            numpy.ndarray: 1-D array of deadlines
+        """
+        a, d, s = self._flow_order
+        return self.flow_deadline.reshape(-1)[a]
+
+    @cached_property
+    def flow_deadline(self):
+        """Deadline of each request flow
+
+        Returns:
+            numpy.ndarray: array (apps x 1 x 1) broadcastable to the request flows
+        """
+        return np.array([app.deadline for app in self.apps], dtype=float).reshape(-1, 1, 1)
@@ -1,51 +1,59 @@
 from sp.core.model import System, ControlInput, EnvironmentInput
-from sp.system_controller.util import calc_min_migration_delay, calc_app_size
+from .engine import MetricEngine, engine_metric
 from statistics import mean
+import numpy as np
 
 
-def overall_migration_cost(current_system, next_control, next_environment):
+@engine_metric
+def overall_migration_cost(current_system, next_control, next_environment, engine=None):
     """Overall Migration/Replication Cost Metric
 
     Args:
         current_system (System): current system's state
         next_control (ControlInput): next control input
         next_environment (EnvironmentInput):  next environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    values = _calc_migration_cost(current_system, next_control, next_environment)
+    values = _calc_migration_cost(current_system, next_control, next_environment, engine=engine)
     return sum(values) if len(values) > 0 else 0.0
 
 
-def max_migration_cost(current_system, next_control, next_environment):
+@engine_metric
+def max_migration_cost(current_system, next_control, next_environment, engine=None):
     """Maximum Migration/Replication Cost Metric
 
     Args:
         current_system (System): current system's state
         next_control (ControlInput): next control input
         next_environment (EnvironmentInput):  next environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    values = _calc_migration_cost(current_system, next_control, next_environment)
+    values = _calc_migration_cost(current_system, next_control, next_environment, engine=engine)
     return max(values) if len(values) > 0 else 0.0
 
 
-def avg_migration_cost(current_system, next_control, next_environment):
+@engine_metric
+def avg_migration_cost(current_system, next_control, next_environment, engine=None):
     """Average Migration/Replication Cost Metric
 
     Args:
         current_system (System): current system's state
         next_control (ControlInput): next control input
         next_environment (EnvironmentInput):  next environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    values = _calc_migration_cost(current_system, next_control, next_environment)
+    values = _calc_migration_cost(current_system, next_control, next_environment, engine=engine)
     return mean(values) if len(values) > 0 else 0.0
 
 
-def migration_rate(current_system, next_control, next_environment):
+@engine_metric
+def migration_rate(current_system, next_control, next_environment, engine=None):
     """Calculate the migration/replication ratio.
     That is, is fraction of new application replicas among all replicas
 
@@ -53,29 +61,23 @@ def migration_rate(current_system, next_control, next_environment):
         current_system (System): current system's state
         next_control (ControlInput): next control input
         next_environment (EnvironmentInput):  next environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
     ratio = 0.0
-    current_control = current_system.control_input
-    if current_control is not None:
-        new_place_count = 0
-        total_place_count = 0
-        for app in current_system.apps:
-            for node in current_system.nodes:
-                cur_place = current_control.get_app_placement(app.id, node.id)
-                next_place = next_control.get_app_placement(app.id, node.id)
-
-                total_place_count += int(next_place)
-                new_place_count += int(next_place and not cur_place)
-
+    engine = MetricEngine.create(current_system, next_control, next_environment, engine=engine)
+    if engine.current_placement is not None:
+        new_place_count = np.count_nonzero(engine.new_placement)
+        total_place_count = np.count_nonzero(engine.placement)
         if total_place_count > 0:
             ratio = new_place_count / float(total_place_count)
 
     return ratio
 
 
-def weighted_migration_rate(current_system, next_control, next_environment):
+@engine_metric
+def weighted_migration_rate(current_system, next_control, next_environment, engine=None):
     """Calculate the migration/replication ratio.
     That is, is fraction of new application replicas among all replicas
 
@@ -83,50 +85,33 @@ def weighted_migration_rate(current_system, next_control, next_environment):
         current_system (System): current system's state
         next_control (ControlInput): next control input
         next_environment (EnvironmentInput):  next environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
     ratio = 0.0
-    current_control = current_system.control_input
-    if current_control is not None:
-        new_place_count = 0
-        total_place_count = 0
-        for app in current_system.apps:
-            for node in current_system.nodes:
-                cur_place = current_control.get_app_placement(app.id, node.id)
-                next_place = next_control.get_app_placement(app.id, node.id)
-                app_size = calc_app_size(app.id, node.id, current_system, next_control, next_environment)
-
-                total_place_count += int(next_place) * app_size
-                new_place_count += int(next_place and not cur_place) * app_size
-
+    engine = MetricEngine.create(current_system, next_control, next_environment, engine=engine)
+    if engine.current_placement is not None:
+        app_size = engine.app_size
+        total_place_count = float(np.sum(app_size))
+        new_place_count = float(np.sum(app_size * engine.new_placement))
         if total_place_count > 0:
             ratio = new_place_count / float(total_place_count)
 
     return ratio
 
 
-def _calc_migration_cost(current_system, next_control, next_environment):
+def _calc_migration_cost(current_system, next_control, next_environment, engine=None):
     """Calculate migration/replication cost for every migrated/new application instance
 
     Args:
         current_system (System): current system's state
         next_control (ControlInput): next control input
         next_environment (EnvironmentInput):  next environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         list: list of metric values
     """
-    current_control = current_system.control_input
-    costs = []
-    if current_control is not None:
-        for app in current_system.apps:
-            for node in current_system.nodes:
-                curr_place = current_control.get_app_placement(app.id, node.id)
-                next_place = next_control.get_app_placement(app.id, node.id)
-                if not next_place or curr_place:
-                    continue
-
-                delay = calc_min_migration_delay(app.id, node.id, current_system, next_control, next_environment)
-                if delay > 0.0:
-                    costs.append(delay)
-    return costs
+    engine = MetricEngine.create(current_system, next_control, next_environment, engine=engine)
+    delays = engine.min_migration_delay[engine.new_placement]
+    return delays[delays > 0.0].tolist()
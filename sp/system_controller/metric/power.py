@@ -1,68 +1,75 @@
 from sp.core.model import Resource, System, ControlInput, EnvironmentInput
+from .engine import MetricEngine, engine_metric
 from statistics import mean
 
 
-def overall_power_consumption(system, control_input, environment_input):
+@engine_metric
+def overall_power_consumption(system, control_input, environment_input, engine=None):
     """Overall CPU Power Consumption Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    values = _calc_cpu_power_consumption(system, control_input, environment_input)
+    values = _calc_cpu_power_consumption(system, control_input, environment_input, engine=engine)
     return sum(values) if len(values) > 0 else 0.0
 
 
-def avg_power_consumption(system, control_input, environment_input):
+@engine_metric
+def avg_power_consumption(system, control_input, environment_input, engine=None):
     """Average CPU Power Consumption Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    values = _calc_cpu_power_consumption(system, control_input, environment_input)
+    values = _calc_cpu_power_consumption(system, control_input, environment_input, engine=engine)
     return mean(values) if len(values) > 0 else 0.0
 
 
-def max_power_consumption(system, control_input, environment_input):
+@engine_metric
+def max_power_consumption(system, control_input, environment_input, engine=None):
     """Maximum CPU Power Consumption Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    values = _calc_cpu_power_consumption(system, control_input, environment_input)
+    values = _calc_cpu_power_consumption(system, control_input, environment_input, engine=engine)
     return max(values) if len(values) > 0 else 0.0
 
 
-def _calc_cpu_power_consumption(system, control_input, environment_input):
+def _calc_cpu_power_consumption(system, control_input, environment_input, engine=None):
     """ Calculate CPU power consumption for every nodes
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         list: list of metric values
     """
+    engine = MetricEngine.create(system, control_input, environment_input, engine=engine)
+    cpu_alloc = engine.get_allocated_resource(Resource.CPU)
+    cpu_used = (cpu_alloc * engine.placement).sum(axis=0)
+
     consumptions = []
-    for node in system.nodes:
+    for (n, node) in enumerate(engine.nodes):
         cpu_total = node.cpu_capacity
-        cpu_used = 0.0
-        for app in system.apps:
-            if control_input.app_placement[app.id][node.id]:
-                cpu_used += control_input.allocated_resource[app.id][node.id][Resource.CPU]
-
-        utilization = cpu_used / float(cpu_total) if cpu_total > 0.0 else 0.0
+        utilization = float(cpu_used[n]) / float(cpu_total) if cpu_total > 0.0 else 0.0
         pwr_cons = node.power_consumption(utilization)
         consumptions.append(pwr_cons)
     return consumptions
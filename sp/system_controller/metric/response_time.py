@@ -1,84 +1,93 @@
 from sp.core.model import System, ControlInput, EnvironmentInput
-from sp.system_controller.util import calc_response_time, calc_load_after_distribution
+from .engine import MetricEngine, engine_metric
 from numpy import mean, average
 
 
-def max_response_time(system, control_input, environment_input):
+@engine_metric
+def max_response_time(system, control_input, environment_input, engine=None):
     """Maximum Response Time Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    rt = _calc_rt(system, control_input, environment_input)
-    return max(rt) if len(rt) > 0 else 0.0
+    rt = _calc_rt(system, control_input, environment_input, engine=engine)
+    return float(rt.max()) if len(rt) > 0 else 0.0
 
 
-def avg_response_time(system, control_input, environment_input):
+@engine_metric
+def avg_response_time(system, control_input, environment_input, engine=None):
     """Average Response Time Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    rt = _calc_rt(system, control_input, environment_input)
-    return mean(rt) if len(rt) > 0 else 0.0
+    rt = _calc_rt(system, control_input, environment_input, engine=engine)
+    return float(mean(rt)) if len(rt) > 0 else 0.0
 
 
-def weighted_avg_response_time(system, control_input, environment_input):
+@engine_metric
+def weighted_avg_response_time(system, control_input, environment_input, engine=None):
     """Weighted Average Response Time Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    rt, load = _calc_rt(system, control_input, environment_input, return_load=True)
-    total_load = sum(load) if len(load) > 0 else 0.0
+    rt, load = _calc_rt(system, control_input, environment_input, return_load=True, engine=engine)
+    total_load = load.sum()
     if len(rt) > 0 and total_load > 0.0:
-        return average(rt, weights=load)
+        return float(average(rt, weights=load))
     else:
         return 0.0
 
 
-def overall_response_time(system, control_input, environment_input):
+@engine_metric
+def overall_response_time(system, control_input, environment_input, engine=None):
     """Overall Response Time Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    rt = _calc_rt(system, control_input, environment_input)
-    return sum(rt) if len(rt) > 0 else 0.0
+    rt = _calc_rt(system, control_input, environment_input, engine=engine)
+    return float(rt.sum())
 
 
-def weighted_overall_response_time(system, control_input, environment_input):
+@engine_metric
+def weighted_overall_response_time(system, control_input, environment_input, engine=None):
     """Weighted Overall Response Time Metric
 
     Args:
         system (System): system
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
+        engine (MetricEngine): shared metric engine
     Returns:
         float: metric value
     """
-    rt, load = _calc_rt(system, control_input, environment_input, return_load=True)
-    w_rt = list(map(lambda i: rt[i] * load[i], range(len(rt))))
-    return sum(w_rt) if len(w_rt) > 0 else 0.0
+    rt, load = _calc_rt(system, control_input, environment_input, return_load=True, engine=engine)
+    return float((rt * load).sum())
 
 
-def _calc_rt(system, control_input, environment_input, return_load=False):
+def _calc_rt(system, control_input, environment_input, return_load=False, engine=None):
     """Calculate response time for every request flow
 
     Args:
@@ -86,23 +95,13 @@ def _calc_rt(system, control_input, environment_input, return_load=False):
         control_input (ControlInput): control input
         environment_input (EnvironmentInput):  environment input
         return_load (bool): Return along with response time, the loads of each request flow
+        engine (MetricEngine): shared metric engine
     Returns:
-        Union[list, tuple]: lists of response times or a tuple with response times and loads
+        Union[numpy.ndarray, tuple]: response times or a tuple with response times and loads
     """
-    list_rt, list_load = [], []
-    for app in system.apps:
-        for dst_node in system.nodes:
-            if not control_input.get_app_placement(app.id, dst_node.id):
-                continue
-            for src_node in system.nodes:
-                load = calc_load_after_distribution(app.id, src_node.id, dst_node.id,
-                                                    system, control_input, environment_input)
-                if load > 0.0:
-                    rt = calc_response_time(app.id, src_node.id, dst_node.id,
-                                            system, control_input, environment_input)
-                    list_rt.append(rt)
-                    list_load.append(load)
+    engine = MetricEngine.create(system, control_input, environment_input, engine=engine)
+    list_rt = engine.active_flow_response_time
     if return_load:
-        return list_rt, list_load
+        return list_rt, engine.active_flow_load
     else:
         return list_rt
@@ -1 +1,2 @@
 from .opt_solution import OptSolution
+from .array_opt_solution import ArrayOptSolution
@@ -0,0 +1,183 @@
+from sp.core.model import Resource
+from sp.core.util.indexed_array import IndexedArrayView
+from .opt_solution import OptSolution
+import hashlib
+import numpy as np
+
+
+class ArrayOptSolution(OptSolution):
+    """Array-backed Optimization Solution Class Model
+
+    The solution is stored in dense NumPy arrays and the dictionary attributes of
+    :py:class:`~sp.system_controller.model.opt_solution.OptSolution` are views of these arrays.
+    The maps of ids to array indexes are shared with the system's scenario
+
+    Attributes:
+        placement (numpy.ndarray): application placement, boolean matrix (apps x nodes)
+        alloc (numpy.ndarray): allocated resources (apps x nodes x resources)
+        ld (numpy.ndarray): load distribution (apps x source nodes x destination nodes)
+        rl (numpy.ndarray): cached received load (apps x nodes)
+        apps_index (dict): map of application's id to its index
+        nodes_index (dict): map of node's id to its index
+        resources_index (dict): map of resource's name to its index
+    """
+
+    def __init__(self):
+        """Initialization
+        """
+        OptSolution.__init__(self)
+        self.placement = None
+        self.alloc = None
+        self.ld = None
+        self.rl = None
+        self.apps_index = None
+        self.nodes_index = None
+        self.resources_index = None
+        self._nodes_id = None
+
+    def _bind_views(self):
+        """Bind the dictionary attributes to views of the arrays
+        """
+        apps_index, nodes_index, resources_index = self.apps_index, self.nodes_index, self.resources_index
+        self.app_placement = IndexedArrayView(self.placement, [apps_index, nodes_index])
+        self.allocated_resource = IndexedArrayView(self.alloc, [apps_index, nodes_index, resources_index])
+        self.load_distribution = IndexedArrayView(self.ld, [apps_index, nodes_index, nodes_index])
+        self.received_load = IndexedArrayView(self.rl, [apps_index, nodes_index])
+
+    def get_app_placement(self, app_id, node_id):
+        """Check if an application is placed on specific node
+
+        Args:
+            app_id (int): application's id
+            node_id (int): node's id
+        Returns:
+            bool: True if the node hosts the application, False otherwise
+        """
+        return bool(self.placement[self.apps_index[app_id], self.nodes_index[node_id]])
+
+    def get_load_distribution(self, app_id, src_node_id, dst_node_id):
+        """Get the load distribution of application requests from a source node to a destination node
+
+        Args:
+            app_id (int): application's id
+            src_node_id (int): source node's id
+            dst_node_id (int): destination node's id
+        Returns:
+            float: load distribution
+        """
+        nodes_index = self.nodes_index
+        return float(self.ld[self.apps_index[app_id], nodes_index[src_node_id], nodes_index[dst_node_id]])
+
+    def get_load_flows(self, app_id):
+        """Get the non-zero load distribution of an application's requests
+
+        Args:
+            app_id (int): application's id
+        Returns:
+            list(tuple): list of (source node's id, destination node's id, load distribution)
+        """
+        app_ld = self.ld[self.apps_index[app_id]]
+        src_indexes, dst_indexes = np.nonzero(app_ld)
+        nodes_id = self.nodes_id
+        return [(nodes_id[s], nodes_id[d], float(app_ld[s, d])) for (s, d) in zip(src_indexes, dst_indexes)]
+
+    def get_load_sources(self, app_id, dst_node_id):
+        """Get the non-zero load distribution of an application's requests to a destination node
+
+        Args:
+            app_id (int): application's id
+            dst_node_id (int): destination node's id
+        Returns:
+            list(tuple): list of (source node's id, load distribution)
+        """
+        dst_ld = self.ld[self.apps_index[app_id], :, self.nodes_index[dst_node_id]]
+        nodes_id = self.nodes_id
+        return [(nodes_id[s], float(dst_ld[s])) for s in np.nonzero(dst_ld)[0]]
+
+    @property
+    def nodes_id(self):
+        """Node's id of each index
+
+        Returns:
+            list: list of ids
+        """
+        if self._nodes_id is None:
+            nodes_id = [None] * len(self.nodes_index)
+            for (node_id, index) in self.nodes_index.items():
+                nodes_id[index] = node_id
+            self._nodes_id = nodes_id
+        return self._nodes_id
+
+    def get_allocated_resource(self, app_id, node_id, resource_name):
+        """Get the amount of allocated resource to an application on a node
+
+        Args:
+            app_id (int): application's id
+            node_id (int): node's id
+            resource_name (str): resource's name
+        Returns:
+            float: amount of allocated resource
+        """
+        return float(self.alloc[self.apps_index[app_id], self.nodes_index[node_id],
+                                self.resources_index[resource_name]])
+
+    def get_allocated_cpu(self, app_id, node_id):
+        """Get the amount of CPU allocated to an application on a node
+
+        Args:
+            app_id (int): application's id
+            node_id (int): node's id
+        Returns:
+            float: amount of allocated resource
+        """
+        return self.get_allocated_resource(app_id, node_id, Resource.CPU)
+
+    def get_received_load(self, app_id, node_id):
+        """Get received load for an application in a node
+
+        Args:
+            app_id (int): application's id
+            node_id (int): node's id
+
+        Returns:
+            float: load
+        """
+        return float(self.rl[self.apps_index[app_id], self.nodes_index[node_id]])
+
+    def digest(self):
+        """Get a digest of the solution.
+        Solutions with the same placement, allocated resources and load distribution have the same digest
+
+        Returns:
+            bytes: digest
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (self.placement, self.alloc, self.ld):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.digest()
+
+    @classmethod
+    def create_empty(cls, system):
+        """Create a empty solution for a system's scenario
+
+        Args:
+            system (sp.core.model.system.System): system
+
+        Returns:
+            ArrayOptSolution: solution
+        """
+        solution = cls()
+        solution.apps_index = system.apps_index
+        solution.nodes_index = system.nodes_index
+        solution.resources_index = system.resources_index
+
+        nb_apps = len(solution.apps_index)
+        nb_nodes = len(solution.nodes_index)
+        nb_resources = len(solution.resources_index)
+        solution.placement = np.zeros((nb_apps, nb_nodes), dtype=bool)
+        solution.alloc = np.zeros((nb_apps, nb_nodes, nb_resources))
+        solution.ld = np.zeros((nb_apps, nb_nodes, nb_nodes))
+        solution.rl = np.zeros((nb_apps, nb_nodes))
+        solution._bind_views()
+
+        return solution
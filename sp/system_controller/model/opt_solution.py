@@ -1,4 +1,4 @@
-from sp.core.model import ControlInput
+from sp.core.model import ControlInput, LoadDistribution
 
 
 class OptSolution(ControlInput):
@@ -48,13 +48,10 @@ class OptSolution(ControlInput):
             for node in system.nodes:
                 solution.app_placement[app.id][node.id] = False
                 solution.allocated_resource[app.id][node.id] = {}
-                solution.load_distribution[app.id][node.id] = {}
+                solution.load_distribution[app.id][node.id] = LoadDistribution()
                 solution.received_load[app.id][node.id] = 0.0
 
                 for resource in system.resources:
                     solution.allocated_resource[app.id][node.id][resource.name] = 0.0
 
-                for dst_node in system.nodes:
-                    solution.load_distribution[app.id][node.id][dst_node.id] = 0.0
-
         return solution
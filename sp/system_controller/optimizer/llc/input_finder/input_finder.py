@@ -15,6 +15,7 @@ class InputFinder(ABC):
         system_estimator (SystemEstimator): system estimator
         dominance_func (function): multi-objective dominance function
         pool_size (int): multi-processing pool size
+        pool (WorkerPool): shared worker pool. If None, the genetic algorithms create their own pools
         last_inputs (list(GAIndividual)): list of last control inputs
     """
 
@@ -27,6 +28,7 @@ class InputFinder(ABC):
                  dominance_func,
                  pool_size=0,
                  last_inputs=None,
+                 pool=None,
                  **kwargs):
         """Initialization
         """
@@ -38,6 +40,7 @@ class InputFinder(ABC):
         self.system_estimator = system_estimator
         self.dominance_func = dominance_func
         self.pool_size = pool_size
+        self.pool = pool
         self.last_inputs = last_inputs
 
     @property
@@ -21,6 +21,7 @@ class MGAInputFinder(InputFinder):
                  dominance_func,
                  pool_size,
                  last_inputs,
+                 pool=None,
                  **ga_params):
         """Initialization
         """
@@ -33,7 +34,8 @@ class MGAInputFinder(InputFinder):
                              system_estimator=system_estimator,
                              dominance_func=dominance_func,
                              pool_size=pool_size,
-                             last_inputs=last_inputs)
+                             last_inputs=last_inputs,
+                             pool=pool)
         self.ga_params = ga_params
 
     def solve(self):
@@ -45,7 +47,8 @@ class MGAInputFinder(InputFinder):
         map_func = map
         pool_size = int(min(self.pool_size, self.nb_slots, mp.cpu_count()))
         pool = None
-        if pool_size > 1:
+        # With a shared worker pool, each GA already uses all workers, so GAs are executed in sequence
+        if pool_size > 1 and self.pool is None:
             try:
                 pool = ThreadPool(self.pool_size)
                 map_func = pool.map
@@ -80,6 +83,7 @@ class MGAInputFinder(InputFinder):
         ga = NSGAII(operator=ga_operator,
                     dominance_func=self.dominance_func,
                     pool_size=self.pool_size,
+                    pool=self.pool,
                     **self.ga_params)
 
         if self.last_inputs is not None:
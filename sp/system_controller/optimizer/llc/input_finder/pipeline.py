@@ -53,6 +53,7 @@ class PipelineInputFinder(InputFinder):
                                   dominance_func=self.dominance_func,
                                   pool_size=self.pool_size,
                                   last_inputs=control_inputs,
+                                  pool=self.pool,
                                   **params)
 
             control_inputs = finder.solve()
@@ -23,6 +23,7 @@ class SGAInputFinder(InputFinder):
                  dominance_func,
                  pool_size,
                  last_inputs,
+                 pool=None,
                  load_chunk_distribution=None,
                  **ga_params):
         """Initialization
@@ -36,7 +37,8 @@ class SGAInputFinder(InputFinder):
                              system_estimator=system_estimator,
                              dominance_func=dominance_func,
                              pool_size=pool_size,
-                             last_inputs=last_inputs)
+                             last_inputs=last_inputs,
+                             pool=pool)
         self.ga_params = ga_params
         self._plan_finder = EmptyPlanFinder(system=system,
                                             environment_inputs=environment_inputs,
@@ -45,6 +47,7 @@ class SGAInputFinder(InputFinder):
                                             system_estimator=system_estimator,
                                             dominance_func=dominance_func,
                                             pool_size=pool_size,
+                                            pool=pool,
                                             load_chunk_distribution=load_chunk_distribution)
 
     def solve(self):
@@ -60,6 +63,7 @@ class SGAInputFinder(InputFinder):
         ga = NSGAII(operator=ga_operator,
                     dominance_func=self.dominance_func,
                     pool_size=self.pool_size,
+                    pool=self.pool,
                     **self.ga_params)
 
         if self.last_inputs is not None:
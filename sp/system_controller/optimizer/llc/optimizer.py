@@ -2,6 +2,7 @@ from sp.system_controller.optimizer import Optimizer
 from sp.system_controller.estimator import SystemEstimator, DefaultSystemEstimator
 from sp.system_controller.predictor import EnvironmentPredictor, DefaultEnvironmentPredictor
 from sp.system_controller.metric import deadline, cost, availability, migration
+from sp.core.util.worker_pool import WorkerPool
 from .two_step import TwoStep
 
 
@@ -30,7 +31,8 @@ class LLCOptimizer(Optimizer):
         dominance_func (function): multi-objective dominance function.
             It can be either :py:func:`~sp.system_controller.optimizer.moga.ga_operator.preferred_dominates` or
             :py:func:`~sp.core.heuristic.nsgaii.pareto_dominates`
-        pool_size (int): multi-processing pool size. If zero, the optimizer doesn't use multi-processing
+        pool_size (int): multi-processing pool size. If zero, the optimizer doesn't use multi-processing.
+            The worker processes are kept between time slots until :py:meth:`clear_params` is called
     """
 
     def __init__(self):
@@ -52,6 +54,7 @@ class LLCOptimizer(Optimizer):
         self.pool_size = 4
 
         self._last_population = None
+        self._pool = None
 
     def init_params(self):
         """Initialize parameters for a simulation
@@ -71,11 +74,17 @@ class LLCOptimizer(Optimizer):
         if not isinstance(self.objective, list):
             self.objective = [self.objective]
 
+        if self._pool is None:
+            self._pool = WorkerPool(self.pool_size)
+
     def clear_params(self):
         """Clear parameters of a simulation
         """
         self.environment_predictor.clear()
         self._last_population = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     def solve(self, system, environment_input):
         """Solve the service placement problem
@@ -102,6 +111,7 @@ class LLCOptimizer(Optimizer):
                            input_finder_params=self.input_finder_params,
                            dominance_func=self.dominance_func,
                            pool_size=self.pool_size,
+                           pool=self._pool,
                            last_population=self._last_population)
 
         population = two_step.solve()
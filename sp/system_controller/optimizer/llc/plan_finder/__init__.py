@@ -1,4 +1,4 @@
-from .plan_finder import PlanFinder, Plan
+from .plan_finder import PlanFinder, Plan, get_decoder, decode_control_input
 from .ga import GAPlanFinder
 from .beam import BeamPlanFinder
 from .random import RandomPlanFinder
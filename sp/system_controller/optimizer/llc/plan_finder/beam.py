@@ -1,7 +1,7 @@
 from sp.core.heuristic import nsgaii
+from sp.system_controller.metric.engine import MetricEngine
 from .plan_finder import PlanFinder, Plan, decode_control_input
-from functools import cmp_to_key
-import multiprocessing as mp
+import copy
 
 
 class BeamPlanFinder(PlanFinder):
@@ -10,63 +10,38 @@ class BeamPlanFinder(PlanFinder):
         self.beam_width = beam_width
         self.prune = prune
 
-    def _decode_control_inputs(self, system, control_inputs, environment_input):
-        def decode(control_input):
-            return decode_control_input(system, control_input, environment_input)
-
-        map_func = map
-        func = decode
-        pool = None
-        if self.pool_size > 0:
-            try:
-                # Require UNIX fork to work
-                mp_ctx = mp.get_context("fork")
-                pool_size = min(self.pool_size, mp_ctx.cpu_count())
-                pool = mp_ctx.Pool(processes=pool_size,
-                                   initializer=_init_pool,
-                                   initargs=[system, environment_input, decode_control_input])
-                map_func = pool.map
-                func = _decode_control_input
-            except ValueError:
-                pass
-
-        results = map_func(func, control_inputs)
-        if pool is not None:
-            pool.terminate()
-        return results
-
     def solve(self, control_inputs):
+        self._init_pool()
         beam_node = BeamNode()
         beam_node.system = self.system
         beam_nodes = [beam_node]
 
         for seq_index in range(self.sequence_length):
+            stage_ctrl_inputs = control_inputs
+            # Control inputs of a beam node are expanded in chunks, so each worker process restores the node's state
+            # and creates its decoder once per chunk
+            nb_chunks = max(1, -(-self._pool.pool_size // len(beam_nodes))) if self._pool.is_parallel else 1
+            chunks = _split(stage_ctrl_inputs, nb_chunks)
+            items = [(_strip_system(bn.system), seq_index, chunk) for bn in beam_nodes for chunk in chunks]
+            results = [result
+                       for chunk_results in self._pool.map(_expand_beam_node, items, self._pool_key)
+                       for result in chunk_results]
+
             next_beam_nodes = []
-            env_input = self.environment_inputs[seq_index]
-            stage_ctrl_inputs = control_inputs[seq_index]
-
-            for beam_node in beam_nodes:
-                system = beam_node.system
-                decoded_ctrl_inputs = self._decode_control_inputs(system, stage_ctrl_inputs, env_input)
-                for (ctrl_index, ctrl_input) in enumerate(decoded_ctrl_inputs):
-                    next_system = self.system_estimator(system, ctrl_input, env_input)
-
-                    add_system = True
-                    if self.prune:
-                        for next_beam_node in next_beam_nodes:
-                            if next_beam_node.system == next_system:
-                                add_system = False
-                                break
-
-                    if add_system:
-                        fitness = [func(system, ctrl_input, env_input) for func in self.objective]
-
-                        next_beam_node = BeamNode()
-                        next_beam_node.parent = beam_node
-                        next_beam_node.system = next_system
-                        next_beam_node.control_input = stage_ctrl_inputs[ctrl_index]
-                        next_beam_node.fitness = fitness
-                        next_beam_nodes.append(next_beam_node)
+            next_fingerprints = set()
+            for (item_index, (next_system, fitness, fingerprint)) in enumerate(results):
+                if self.prune:
+                    if fingerprint in next_fingerprints:
+                        continue
+                    next_fingerprints.add(fingerprint)
+
+                beam_node = beam_nodes[item_index // len(stage_ctrl_inputs)]
+                next_beam_node = BeamNode()
+                next_beam_node.parent = beam_node
+                next_beam_node.system = self._restore_system(next_system, seq_index)
+                next_beam_node.control_input = stage_ctrl_inputs[item_index % len(stage_ctrl_inputs)]
+                next_beam_node.fitness = fitness
+                next_beam_nodes.append(next_beam_node)
 
             next_beam_nodes = _sort_beam_nodes(next_beam_nodes, self.objective_aggregator, self.dominance_func)
             beam_nodes = next_beam_nodes[:self.beam_width]
@@ -74,6 +49,40 @@ class BeamPlanFinder(PlanFinder):
         plans = [bn.create_plan(self.objective_aggregator) for bn in beam_nodes]
         return plans
 
+    def expand(self, system, seq_index, encoded_control):
+        """Apply an encoded control input to a system's state of the beam
+
+        Args:
+            system (System): system's state
+            seq_index (int): index of the stage in the plan
+            encoded_control (GAIndividual): encoded control input
+        Returns:
+            tuple: next system's state, fitness of the control input and fingerprint of the next state
+        """
+        env_input = self.environment_inputs[seq_index]
+        ctrl_input = decode_control_input(system, encoded_control, env_input, self.load_chunk_distribution)
+        fitness = MetricEngine(system, ctrl_input, env_input).evaluate(self.objective)
+        next_system = self.system_estimator(system, ctrl_input, env_input)
+        fingerprint = next_system.fingerprint() if self.prune else None
+        return next_system, fitness, fingerprint
+
+    def _restore_system(self, system, seq_index):
+        """Restore the fields of a system's state removed by :py:func:`_strip_system`
+
+        Args:
+            system (System): stripped system's state
+            seq_index (int): index of the stage in the plan where the state was created.
+                If negative, it is the initial state
+        Returns:
+            System: system's state
+        """
+        system.scenario = self.system.scenario
+        if seq_index < 0:
+            system.environment_input = self.system.environment_input
+        else:
+            system.environment_input = self.environment_inputs[seq_index]
+        return system
+
 
 class BeamNode:
     def __init__(self):
@@ -116,35 +125,52 @@ def _sort_beam_nodes(beam_nodes, fitness_aggregator, dominance_operator):
     fronts, rank = nsgaii.fast_non_dominated_sort(fitnesses, dominance_operator)
     crwd_dist = nsgaii.crowding_distance(fitnesses, fronts)
 
-    def sort_cmp(item_1, item_2):
-        index_1 = beam_nodes.index(item_1)
-        index_2 = beam_nodes.index(item_2)
-        if rank[index_1] < rank[index_2]:
-            return -1
-        elif (rank[index_1] == rank[index_2]
-              and crwd_dist[index_1] < crwd_dist[index_2]):
-            return -1
-        else:
-            return 1
-
-    return sorted(beam_nodes, key=cmp_to_key(sort_cmp))
-
-
-class _ControlInputDecoder:
-    def __init__(self, system, environment_input, decoder_func):
-        self.system = system
-        self.environment_input = environment_input
-        self.decoder_func = decoder_func
-
-    def __call__(self, control_input):
-        return self.decoder_func(self.system, control_input, self.environment_input)
-
-
-def _init_pool(system, environment_input, decoder_func):
-    global _decoder
-    _decoder = _ControlInputDecoder(system, environment_input, decoder_func)
-
-
-def _decode_control_input(control_input):
-    global _decoder
-    return _decoder(control_input)
+    order = nsgaii.sort_by_rank_and_crowding(rank, crwd_dist, descending_crowding=False)
+    return [beam_nodes[i] for i in order]
+
+
+def _strip_system(system):
+    """Copy a system's state without its scenario and environment input, which are shared by all states.
+    It reduces the data sent to worker processes
+
+    Args:
+        system (System): system's state
+    Returns:
+        System: stripped copy
+    """
+    stripped = copy.copy(system)
+    stripped.scenario = None
+    stripped.environment_input = None
+    return stripped
+
+
+def _split(items, nb_chunks):
+    """Split a list into contiguous chunks of similar sizes
+
+    Args:
+        items (list): list
+        nb_chunks (int): maximum number of chunks
+    Returns:
+        list(list): non-empty chunks
+    """
+    size = max(1, -(-len(items) // nb_chunks))
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+def _expand_beam_node(plan_finder, item):
+    """Apply encoded control inputs to a system's state in a worker process
+
+    Args:
+        plan_finder (BeamPlanFinder): plan finder
+        item (tuple): stripped system's state, stage index and list of encoded control inputs
+    Returns:
+        list(tuple): stripped next system's state, fitness and fingerprint of the next state
+            for each encoded control input
+    """
+    system, seq_index, encoded_controls = item
+    system = plan_finder._restore_system(copy.copy(system), seq_index - 1)
+    results = []
+    for encoded_control in encoded_controls:
+        next_system, fitness, fingerprint = plan_finder.expand(system, seq_index, encoded_control)
+        results.append((_strip_system(next_system), fitness, fingerprint))
+    return results
@@ -11,8 +11,7 @@ class ExhaustivePlanFinder(PlanFinder):
         """
         sequences = [[]]
         for _ in range(self.sequence_length):
-            for control_input in control_inputs:
-                sequences = [seq + [control_input] for seq in sequences]
+            sequences = [seq + [control_input] for seq in sequences for control_input in control_inputs]
 
         return self.create_plans(sequences)
 
@@ -13,6 +13,8 @@ class GAPlanFinder(PlanFinder):
                  system_estimator,
                  dominance_func,
                  pool_size,
+                 pool=None,
+                 prefix_cache_size=0,
                  **ga_params):
 
         PlanFinder.__init__(self,
@@ -22,13 +24,16 @@ class GAPlanFinder(PlanFinder):
                             objective_aggregator=objective_aggregator,
                             system_estimator=system_estimator,
                             dominance_func=dominance_func,
-                            pool_size=pool_size)
+                            pool_size=pool_size,
+                            pool=pool,
+                            prefix_cache_size=prefix_cache_size)
         self.ga_params = ga_params
 
     def solve(self, control_inputs):
         ga_operator = GAPFOperator(control_inputs, self.sequence_length, self.create_plan)
         ga = NSGAII(operator=ga_operator,
                     pool_size=self.pool_size,
+                    pool=self.pool,
                     dominance_func=self.dominance_func,
                     **self.ga_params)
         population = ga.solve()
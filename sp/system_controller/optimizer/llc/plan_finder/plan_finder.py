@@ -3,10 +3,17 @@ from sp.core.heuristic import nsgaii
 from sp.core.heuristic.brkga import GAIndividual
 from sp.system_controller.optimizer.moga import MOGAOperator
 from sp.system_controller.estimator import SystemEstimator
+from sp.system_controller.metric.engine import MetricEngine
 from abc import ABC, abstractmethod
 from collections import UserList
-from functools import cmp_to_key
-import multiprocessing as mp
+from sp.core.util.worker_pool import WorkerPool
+from sp.core.util.lru_cache import LRUCache
+import numpy as np
+
+DECODER_CACHE_SIZE = 32
+"""Maximum number of control input decoders cached by :py:func:`get_decoder`"""
+
+_decoders = LRUCache(DECODER_CACHE_SIZE)
 
 
 class PlanFinder(ABC):
@@ -21,6 +28,11 @@ class PlanFinder(ABC):
         dominance_func (function): multi-objective dominance function
         pool_size (int): multi-processing pool size
         load_chunk_distribution (float): load chunk distribution
+        pool (WorkerPool): shared worker pool. If None, a pool of ``pool_size`` processes is created
+        prefix_cache_size (int): maximum number of cached plan prefixes. Each cached prefix stores the
+            system's state and the objective values after its control inputs are applied.
+            A state includes the decoded control input, whose load distribution has apps x nodes x nodes values,
+            and each worker process keeps its own cache. By default (zero), the cache is disabled
     """
 
     def __init__(self,
@@ -32,6 +44,8 @@ class PlanFinder(ABC):
                  dominance_func,
                  pool_size=0,
                  load_chunk_distribution=None,
+                 pool=None,
+                 prefix_cache_size=0,
                  **kwargs):
         """Initialization
         """
@@ -45,9 +59,11 @@ class PlanFinder(ABC):
         self.load_chunk_distribution = load_chunk_distribution
 
         self.pool_size = pool_size
-        self.__pool = None
-        self.__map_func = None
-        self.__pool_func = None
+        self.pool = pool
+        self._pool = None
+        self._pool_key = None
+        self.prefix_cache_size = prefix_cache_size
+        self._prefix_cache = LRUCache(prefix_cache_size)
 
     @property
     def sequence_length(self):
@@ -71,39 +87,44 @@ class PlanFinder(ABC):
         """
         self._clear_pool()
 
+    def __getstate__(self):
+        """Get the state to be pickled. Worker pools and cached prefixes are not pickled
+
+        Returns:
+            dict: state
+        """
+        state = self.__dict__.copy()
+        state["pool"] = None
+        state["_pool"] = None
+        state["_pool_key"] = None
+        state["_prefix_cache"] = LRUCache(self.prefix_cache_size)
+        return state
+
     def _init_pool(self):
         """Initialize the multiprocessing pool
         """
-        if self.__pool is not None:
+        if self._pool is not None:
             return
 
-        self.__pool = None
-        self.__map_func = map
-        self.__pool_func = self.create_plan
-        if self.pool_size > 0:
-            try:
-                # Require UNIX fork to work
-                mp_ctx = mp.get_context("fork")
-                self.pool_size = min(self.pool_size, mp_ctx.cpu_count())
-                self.__pool = mp_ctx.Pool(processes=self.pool_size,
-                                          initializer=_init_pool,
-                                          initargs=[self])
-                self.__map_func = self.__pool.map
-                self.__pool_func = _create_plan
-            except ValueError:
-                pass
+        self._pool = self.pool
+        if self._pool is None:
+            self._pool = WorkerPool(self.pool_size)
+        self._pool_key = self._pool.set_context(self)
 
     def _clear_pool(self):
-        """Terminate the multiprocessing pool
+        """Release the plan finder from the multiprocessing pool.
+        The pool is terminated if it is not shared
         """
-        if self.__pool is not None:
-            self.__pool.terminate()
-            self.__pool = None
-            self.__map_func = None
-            self.__pool_func = None
+        if self._pool is not None:
+            self._pool.release_context(self._pool_key)
+            if self._pool is not self.pool:
+                self._pool.close()
+        self._pool = None
+        self._pool_key = None
 
     def create_plan(self, control_sequence):
-        """Create a control input plan
+        """Create a control input plan.
+        Prefixes of the sequence that were already simulated are fetched from the prefix cache
 
         Args:
             control_sequence (list(GAIndividual)): sequence of encoded control inputs
@@ -112,17 +133,24 @@ class PlanFinder(ABC):
         """
         obj_values = [[] for _ in self.objective]
         system = self.system
+        prefix = ()
         for index in range(len(control_sequence)):
             env_input = self.environment_inputs[index]
             control_input = control_sequence[index]
-            control_input = decode_control_input(system, control_input, env_input, self.load_chunk_distribution)
+            prefix += (_control_key(control_input),)
+
+            cached = self._prefix_cache.get(prefix)
+            if cached is None:
+                control_input = decode_control_input(system, control_input, env_input, self.load_chunk_distribution)
+                stage_values = MetricEngine(system, control_input, env_input).evaluate(self.objective)
+                system = self.system_estimator(system, control_input, env_input)
+                self._prefix_cache.put(prefix, (system, stage_values))
+            else:
+                system, stage_values = cached
 
-            for (func_index, func) in enumerate(self.objective):
-                value = func(system, control_input, env_input)
+            for (func_index, value) in enumerate(stage_values):
                 obj_values[func_index].append(value)
 
-            system = self.system_estimator(system, control_input, env_input)
-
         fitness = [self.objective_aggregator(value) for value in obj_values]
         return Plan(control_sequence, fitness)
 
@@ -135,8 +163,7 @@ class PlanFinder(ABC):
             list(Plan): list of plan, one for each control sequence
         """
         self._init_pool()
-        plans = list(self.__map_func(self.__pool_func, control_sequences))
-        return plans
+        return self._pool.map(_create_plan, control_sequences, self._pool_key)
 
     def sort_plans(self, plans):
         """Sort a list of plans according to their aggregated objective
@@ -150,18 +177,8 @@ class PlanFinder(ABC):
         fronts, rank = nsgaii.fast_non_dominated_sort(fitnesses, self.dominance_func)
         crwd_dist = nsgaii.crowding_distance(fitnesses, fronts)
 
-        def sort_cmp(plan_1, plan_2):
-            index_1 = plans.index(plan_1)
-            index_2 = plans.index(plan_2)
-            if rank[index_1] < rank[index_2]:
-                return -1
-            elif (rank[index_1] == rank[index_2]
-                  and crwd_dist[index_1] < crwd_dist[index_2]):
-                return -1
-            else:
-                return 1
-
-        return sorted(plans, key=cmp_to_key(sort_cmp))
+        order = nsgaii.sort_by_rank_and_crowding(rank, crwd_dist, descending_crowding=False)
+        return [plans[i] for i in order]
 
     @abstractmethod
     def solve(self, control_inputs):
@@ -217,7 +234,8 @@ class Plan(UserList):
 
 
 def decode_control_input(system, encoded_control, environment_input, load_chunk_distribution=None):
-    """Decode a control input
+    """Decode a control input.
+    The decoder of the system's state and environment input is reused, see :py:func:`get_decoder`
 
     Args:
         system (System): system
@@ -227,31 +245,56 @@ def decode_control_input(system, encoded_control, environment_input, load_chunk_
     Returns:
         ControlInput: decoded control input
     """
-    ga_operator = MOGAOperator(system=system,
-                               environment_input=environment_input,
-                               objective=None,
-                               use_heuristic=False,
-                               load_chunk_distribution=load_chunk_distribution)
+    ga_operator = get_decoder(system, environment_input, load_chunk_distribution)
     return ga_operator.decode(encoded_control)
 
 
-def _init_pool(plan_finder):
-    """Initialize a sub-process to create a plan
+def get_decoder(system, environment_input, load_chunk_distribution=None):
+    """Get the control input decoder of a system's state and an environment input.
+    Decoders are cached by the identity of the state, its time and current control input, and the environment input,
+    so they are created once per stage and shared by all plan and input finders of a process.
+    A decoder can also generate the heuristic first population, but it has no objective to evaluate solutions.
+    Cache entries keep references to these objects, so their ids are not reused while they are cached.
+    Other in-place changes of the state or the environment input are not detected
 
     Args:
-        plan_finder (PlanFinder): plan finder
+        system (System): system
+        environment_input (EnvironmentInput): environment input
+        load_chunk_distribution (float): load chunk distribution
+    Returns:
+        MOGAOperator: decoder
+    """
+    key = (id(system), system.time, id(system.control_input), id(environment_input), load_chunk_distribution)
+    cached = _decoders.get(key)
+    if cached is None:
+        ga_operator = MOGAOperator(system=system,
+                                   environment_input=environment_input,
+                                   objective=None,
+                                   use_heuristic=True,
+                                   load_chunk_distribution=load_chunk_distribution)
+        cached = (system.control_input, ga_operator)
+        _decoders.put(key, cached)
+    return cached[1]
+
+
+def _control_key(encoded_control):
+    """Get the key that identifies an encoded control input in the prefix cache
+
+    Args:
+        encoded_control (GAIndividual): encoded control input
+    Returns:
+        bytes: key
     """
-    global _pf
-    _pf = plan_finder
+    return np.asarray(encoded_control, dtype=np.float64).tobytes()
 
 
-def _create_plan(control_sequence):
-    """Calculate the fitness of an individual
+def _create_plan(plan_finder, control_sequence):
+    """Create a plan in a worker process
 
     Args:
+        plan_finder (PlanFinder): plan finder
         control_sequence (list(GAIndividual)): control inputs sequence
     Returns:
         Plan: plan
     """
-    global _pf
-    return _pf.create_plan(control_sequence)
+    return plan_finder.create_plan(control_sequence)
@@ -1,6 +1,6 @@
 from sp.core.model import System, EnvironmentInput
 from sp.core.heuristic.brkga import GAIndividual
-from sp.system_controller.optimizer.moga import MOGAOperator, indiv_gen, preferred_dominates
+from sp.system_controller.optimizer.moga import indiv_gen, preferred_dominates
 from sp.system_controller.estimator.system import DefaultSystemEstimator, SystemEstimator
 from sp.system_controller.predictor import EnvironmentPredictor
 from . import plan_finder as pf
@@ -62,6 +62,7 @@ class TwoStep:
         dominance_func (function): multi-objective dominance function
         last_population (list): control inputs of last time-slot
         pool_size (int): multi-processing pool size
+        pool (WorkerPool): shared worker pool
     """
 
     def __init__(self,
@@ -79,7 +80,8 @@ class TwoStep:
                  input_finder_params=None,
                  dominance_func=None,
                  last_population=None,
-                 pool_size=0):
+                 pool_size=0,
+                 pool=None):
         """Initialization
         """
 
@@ -93,6 +95,7 @@ class TwoStep:
         self.objective_aggregator = objective_aggregator
         self.dominance_func = dominance_func
         self.pool_size = pool_size
+        self.pool = pool
         self.plan_finder_class = plan_finder_class
         self.plan_finder_params = plan_finder_params
         self.input_finder_class = input_finder_class
@@ -176,6 +179,7 @@ class TwoStep:
                                                    system_estimator=self.system_estimator,
                                                    dominance_func=self.dominance_func,
                                                    pool_size=self.pool_size,
+                                                   pool=self.pool,
                                                    **params)
 
     def _clear_plan_finder(self):
@@ -207,6 +211,7 @@ class TwoStep:
                                                      system_estimator=self.system_estimator,
                                                      dominance_func=self.dominance_func,
                                                      pool_size=self.pool_size,
+                                                     pool=self.pool,
                                                      last_inputs=self.last_population,
                                                      **params)
 
@@ -252,10 +257,7 @@ class TwoStep:
         Returns:
             list: list of control inputs plan/path
         """
-        ga_operator = MOGAOperator(system=self.system,
-                                   environment_input=self.environment_input,
-                                   objective=self.objective,
-                                   use_heuristic=True)
+        ga_operator = pf.get_decoder(self.system, self.environment_input)
 
         if len(control_inputs) == 0:
             control_inputs = ga_operator.first_population()
@@ -284,8 +286,4 @@ class TwoStep:
         Returns:
              OptSolution: a valid optimization solution as a control input
         """
-        ga_operator = MOGAOperator(system=self.system,
-                                   environment_input=self.environment_input,
-                                   objective=self.objective,
-                                   use_heuristic=True)
-        return ga_operator.decode(control_input)
+        return pf.decode_control_input(self.system, control_input, self.environment_input)
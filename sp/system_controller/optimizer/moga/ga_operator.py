@@ -1,5 +1,7 @@
-from sp.core.heuristic.nsgaii import pareto_dominates
+from sp.core.heuristic.nsgaii import pareto_dominates, pareto_dominance_matrix, dominance_matrix_func
 from sp.system_controller.optimizer.soga import SOGAOperator, indiv_gen
+from sp.system_controller.metric.engine import MetricEngine
+import numpy as np
 
 DEFAULT_DOMINANCE_TOLERANCE = 0.0
 
@@ -29,16 +31,16 @@ class MOGAOperator(SOGAOperator):
         """
         return False
 
-    def evaluate(self, individual):
-        """Evaluate an individual and obtain its fitness
+    def evaluate_solution(self, solution):
+        """Evaluate a decoded solution
 
         Args:
-            individual (GAIndividual): individual
+            solution (OptSolution): solution
         Returns:
-            object: fitness value
+            list: fitness values, one for each objective
         """
-        solution = self.decode(individual)
-        return [f(self.system, solution, self.environment_input) for f in self.objective]
+        engine = MetricEngine(self.system, solution, self.environment_input)
+        return engine.evaluate(self.objective)
 
 
 def preferred_dominates(fitness_1, fitness_2, dominance_tolerance=DEFAULT_DOMINANCE_TOLERANCE):
@@ -55,3 +57,24 @@ def preferred_dominates(fitness_1, fitness_2, dominance_tolerance=DEFAULT_DOMINA
         return pareto_dominates(fitness_1[1:], fitness_2[1:])
     else:
         return fitness_1[0] < fitness_2[0]
+
+
+@dominance_matrix_func(preferred_dominates)
+def preferred_dominance_matrix(fitnesses_1, fitnesses_2, dominance_tolerance=DEFAULT_DOMINANCE_TOLERANCE):
+    """Vectorized version of :py:func:`preferred_dominates`
+
+    Args:
+        fitnesses_1 (numpy.ndarray): fitness of each individual of the first population (individuals x objectives)
+        fitnesses_2 (numpy.ndarray): fitness of each individual of the second population (individuals x objectives)
+        dominance_tolerance (float): tolerance
+    Returns:
+        numpy.ndarray: boolean matrix where the element (p, q) is True if individual p dominates individual q
+    """
+    first_p = fitnesses_1[:, 0, np.newaxis]
+    first_q = fitnesses_2[np.newaxis, :, 0]
+    dominates = first_p < first_q
+    if fitnesses_1.shape[1] > 1:
+        with np.errstate(invalid="ignore"):
+            close = np.abs(first_p - first_q) <= dominance_tolerance
+        dominates = np.where(close, pareto_dominance_matrix(fitnesses_1[:, 1:], fitnesses_2[:, 1:]), dominates)
+    return dominates
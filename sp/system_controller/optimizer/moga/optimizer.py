@@ -1,4 +1,5 @@
 from sp.core.heuristic.nsgaii import NSGAII
+from sp.core.util.worker_pool import WorkerPool
 from sp.system_controller.optimizer.optimizer import Optimizer
 from sp.system_controller.metric import deadline, availability, cost
 from .ga_operator import MOGAOperator, preferred_dominates
@@ -23,10 +24,17 @@ class MOGAOptimizer(Optimizer):
         stop_threshold (float): MGBM stopping threshold.
             See Also: https://doi.org/10.1016/j.ins.2016.07.025
         use_heuristic (bool): whether heuristics is used to generate the first population or not
-        pool_size (int): multi-processing pool size. If zero, the optimizer doesn't use multi-processing
+        pool_size (int): multi-processing pool size. If zero, the optimizer doesn't use multi-processing.
+            The worker processes are kept between time slots until :py:meth:`clear_params` is called
         timeout (Union[float, None]): maximum execution time of the optimizer. If None, there is no timeout
         load_chunk_distribution (float): load chunk distribution (value between 0 and 1).
             Loads are distributed in chunks where its size is defined by this attribute
+        cache_size (int): maximum number of fitness values cached during the execution of the genetic algorithm.
+            It sizes both the cache of chromosomes in the genetic algorithm and the cache of decoded solutions
+            that the genetic operator keeps in each worker process. If zero (default), the fitness is not cached
+        vectorized (bool): whether mutants and offspring of a generation are generated at once with NumPy arrays.
+            Random values are then drawn from :py:mod:`numpy.random` instead of :py:mod:`random`,
+            so both generators must be seeded to reproduce a run. By default, it is False
     """
 
     def __init__(self):
@@ -45,8 +53,11 @@ class MOGAOptimizer(Optimizer):
         self.use_heuristic = True
         self.timeout = None
         self.pool_size = 4
+        self.cache_size = 0
+        self.vectorized = False
 
         self._last_population = None
+        self._pool = None
 
     def init_params(self):
         """Initialize parameters for a simulation
@@ -61,10 +72,16 @@ class MOGAOptimizer(Optimizer):
         if not isinstance(self.objective, list):
             self.objective = [self.objective]
 
+        if self._pool is None:
+            self._pool = WorkerPool(self.pool_size)
+
     def clear_params(self):
         """Clear parameters of a simulation
         """
         self._last_population = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     def solve(self, system, environment_input):
         """Solve the service placement problem
@@ -81,7 +98,8 @@ class MOGAOptimizer(Optimizer):
                                    environment_input=environment_input,
                                    use_heuristic=self.use_heuristic,
                                    extra_first_population=self._last_population,
-                                   load_chunk_distribution=self.load_chunk_distribution)
+                                   load_chunk_distribution=self.load_chunk_distribution,
+                                   cache_size=self.cache_size)
         mo_ga = NSGAII(operator=ga_operator,
                        nb_generations=self.nb_generations,
                        population_size=self.population_size,
@@ -91,7 +109,10 @@ class MOGAOptimizer(Optimizer):
                        stop_threshold=self.stop_threshold,
                        dominance_func=self.dominance_func,
                        timeout=self.timeout,
-                       pool_size=self.pool_size)
+                       pool_size=self.pool_size,
+                       pool=self._pool,
+                       cache_size=self.cache_size,
+                       vectorized=self.vectorized)
         population = mo_ga.solve()
 
         last_pop_size = int(round(self.elite_proportion * len(population)))
@@ -1,6 +1,6 @@
 from sp.core.heuristic.nsgaii import NSGAII
 from sp.system_controller.optimizer.moga import MOGAOptimizer, MOGAOperator
-from sp.system_controller.model import OptSolution
+from sp.system_controller.model import OptSolution, ArrayOptSolution
 
 
 class NoMigrationOptimizer(MOGAOptimizer):
@@ -74,7 +74,7 @@ class NoMigrationGAOperator(MOGAOperator):
         if prev_control_input is None:
             solution, selected_nodes = MOGAOperator._decode_part_1(self, individual)
         else:
-            solution = OptSolution.create_empty(self.system)
+            solution = ArrayOptSolution.create_empty(self.system)
             selected_nodes = {}
             for app in self.system.apps:
                 app_nodes = []
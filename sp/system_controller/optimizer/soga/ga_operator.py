@@ -1,18 +1,21 @@
 from sp.core.model import Resource
 from sp.core.heuristic.brkga import GAOperator, GAIndividual
-from sp.system_controller.model import OptSolution
+from sp.core.util.cached_property import cached_property
+from sp.system_controller.model import OptSolution, ArrayOptSolution
 from sp.system_controller.util import make_solution_feasible
 from sp.system_controller.util import calc_response_time, calc_load_before_distribution
-from sp.system_controller.util import calc_network_delay, calc_processing_delay, calc_initialization_delay
-from .cached_delays import CachedDelays
+from sp.system_controller.util import calc_processing_delay, calc_min_migration_delays, calc_network_delays
+from sp.system_controller.metric.engine import MetricEngine
+from sp.core.util.lru_cache import LRUCache
 import numpy as np
 import math
-import copy
 
 
 DEFAULT_STALL_WINDOW = 30
 DEFAULT_STALL_THRESHOLD = 0.0
 DEFAULT_LOAD_CHUNK_DISTRIBUTION = 0.25
+CAPACITY_TOLERANCE = 1e-9
+"""Relative tolerance below a node's capacity where the running resource usage is checked against the exact sum"""
 
 
 class SOGAOperator(GAOperator):
@@ -29,12 +32,15 @@ class SOGAOperator(GAOperator):
         stall_window (int): stall window stopping criteria. That is, the algorithm stops if the best fitness value
             over stall generations is less than or equal to this attribute
         stall_threshold (float): stall threshold used in the stopping criteria
+        cache_size (int): maximum number of fitness values cached by decoded solution.
+            Different chromosomes often decode to the same solution. If zero, the fitness is not cached
     """
 
     def __init__(self, objective, system, environment_input,
                  use_heuristic=True,
                  extra_first_population=None,
-                 load_chunk_distribution=None):
+                 load_chunk_distribution=None,
+                 cache_size=0):
         """Initialization
         """
         GAOperator.__init__(self)
@@ -57,6 +63,16 @@ class SOGAOperator(GAOperator):
         self.stall_threshold = DEFAULT_STALL_THRESHOLD
         self._best_values = []
 
+        self.cache_size = cache_size
+        self._fitness_cache = None
+
+        # Running resource usage (nodes x resources) of the solution being decoded
+        self._node_usage = None
+        self._usage_solution = None
+        self._node_capacity = None
+        self._near_capacity = None
+        self._resources_name = None
+
     @property
     def requests(self):
         """Get source of requests for all applications
@@ -80,6 +96,8 @@ class SOGAOperator(GAOperator):
         """
         GAOperator.init_params(self)
         self._best_values = []
+        self._fitness_cache = LRUCache(self.cache_size) if self.cache_size > 0 else None
+        self.build_delay_tables()
 
     def first_population(self):
         """Generate some specific individuals for the first population based on heuristic algorithms
@@ -157,7 +175,26 @@ class SOGAOperator(GAOperator):
         """
 
         solution = self.decode(individual)
-        return self.objective(self.system, solution, self.environment_input)
+        if self._fitness_cache is None or not isinstance(solution, ArrayOptSolution):
+            return self.evaluate_solution(solution)
+
+        key = solution.digest()
+        fitness = self._fitness_cache.get(key)
+        if fitness is None:
+            fitness = self.evaluate_solution(solution)
+            self._fitness_cache.put(key, fitness)
+        return fitness
+
+    def evaluate_solution(self, solution):
+        """Evaluate a decoded solution
+
+        Args:
+            solution (OptSolution): solution
+        Returns:
+            object: fitness value
+        """
+        engine = MetricEngine(self.system, solution, self.environment_input)
+        return engine.evaluate([self.objective])[0]
 
     def decode(self, individual):
         """Decode the individual's chromosome and obtain a valid solution for the optimization problem
@@ -172,6 +209,7 @@ class SOGAOperator(GAOperator):
         solution, selected_nodes = self._decode_part_1(individual)
         solution = self._decode_part_2(individual, solution, selected_nodes)
         solution = self._decode_part_3(individual, solution, selected_nodes)
+        self._clear_node_usage()
         return solution
 
     def _decode_part_1(self, individual):
@@ -186,7 +224,7 @@ class SOGAOperator(GAOperator):
         nb_apps = len(self.system.apps)
         nb_nodes = len(self.system.nodes)
 
-        solution = OptSolution.create_empty(self.system)
+        solution = ArrayOptSolution.create_empty(self.system)
 
         selected_nodes = {}
         for (a_index, app) in enumerate(self.system.apps):
@@ -226,7 +264,7 @@ class SOGAOperator(GAOperator):
         end = self.nb_genes
         priority = individual[start:end]
 
-        cached_delays = CachedDelays()
+        proc_delays = np.full((nb_apps, nb_nodes), np.nan)
 
         requests_index = list(range(len(self.requests)))
         requests_index.sort(key=lambda i: priority[i], reverse=True)
@@ -244,10 +282,10 @@ class SOGAOperator(GAOperator):
             if total_load > 0.0:
                 nodes = list(selected_nodes[app.id])
                 nodes.append(cloud_node)
-                nodes.sort(key=lambda n: self._calc_response_time(app, src_node, n, solution, cached_delays))
+                nodes.sort(key=lambda n: self._calc_response_time(app, src_node, n, solution, proc_delays))
 
                 while remaining_load > 0.0 and chunk_count < max_nb_chunks:
-                    # nodes.sort(key=lambda n: self._calc_response_time(app, src_node, n, solution, cached_delays))
+                    # nodes.sort(key=lambda n: self._calc_response_time(app, src_node, n, solution, proc_delays))
                     for dst_node in nodes:
                         if self._alloc_resources(app, dst_node, solution, chunk, increment=True):
                             solution.app_placement[app.id][dst_node.id] = True
@@ -257,7 +295,7 @@ class SOGAOperator(GAOperator):
                             remaining_load -= chunk
                             chunk = min(remaining_load, chunk)
                             chunk_count += 1
-                            cached_delays.invalidate(app.id, src_node.id, dst_node.id)
+                            proc_delays[self.system.apps_index[app.id], self.system.nodes_index[dst_node.id]] = np.nan
                             break
 
         return solution
@@ -284,106 +322,168 @@ class SOGAOperator(GAOperator):
         return make_solution_feasible(self.system, solution, self.environment_input)
 
     def _alloc_resources(self, app, node, solution, load, increment=True):
-        """Allocate resources for an application in a node based on current load distribution and application placement
+        """Allocate resources for an application in a node based on current load distribution and application placement.
+        The node's resource usage is kept as a running total, so each attempt costs O(resources)
 
         Args:
             app (sp.core.model.application.Application): application
             node (sp.core.model.node.Node): node
-            solution (OptSolution): solution
+            solution (ArrayOptSolution): solution
             load (float): received load
             increment (bool): whether the passed load should be added to the current load in the solution
         Returns:
             bool: it was possible to allocate resources or not
         """
-        prev_load = solution.received_load[app.id][node.id]
-        prev_alloc_res = copy.copy(solution.allocated_resource[app.id][node.id])
+        a_index = self.system.apps_index[app.id]
+        n_index = self.system.nodes_index[node.id]
+        usage = self._get_node_usage(solution)
+        capacity = self._node_capacity[n_index]
+        near_capacity = self._near_capacity[n_index]
 
         if increment:
-            solution.received_load[app.id][node.id] += load
-        else:
-            solution.received_load[app.id][node.id] = load
-        load = solution.received_load[app.id][node.id]
-        for resource in self.system.resources:
-            demand = app.demand[resource.name](load)
-            solution.allocated_resource[app.id][node.id][resource.name] = demand
-
-        if not self._check_capacity_constraint(node, solution):
-            solution.received_load[app.id][node.id] = prev_load
-            solution.allocated_resource[app.id][node.id] = prev_alloc_res
-            return False
-        else:
-            return True
-
-    def _check_capacity_constraint(self, node, solution):
-        """Check if a solution respects capacity constraint in a specific node
+            load += solution.rl[a_index, n_index]
+        alloc = np.array([app.demand[name](load) for name in self._resources_name])
+        node_usage = usage[n_index] + (alloc - solution.alloc[a_index, n_index])
+
+        if np.any(node_usage > near_capacity):
+            # Running totals accumulate rounding errors, so check near the capacity with the exact sum
+            node_alloc = solution.alloc[:, n_index].copy()
+            node_alloc[a_index] = alloc
+            node_usage = node_alloc.sum(axis=0)
+            if np.any(node_usage > capacity):
+                usage[n_index] = solution.alloc[:, n_index].sum(axis=0)
+                return False
+
+        solution.rl[a_index, n_index] = load
+        solution.alloc[a_index, n_index] = alloc
+        usage[n_index] = node_usage
+        return True
+
+    def _get_node_usage(self, solution):
+        """Get the running resource usage of each node in a solution being decoded
 
         Args:
-            node (sp.core.model.node.Node):
-            solution (OptSolution): solution
+            solution (ArrayOptSolution): solution
         Returns:
-            bool: constraint is satisfied or not
+            numpy.ndarray: allocated resources of each node (nodes x resources)
         """
-        alloc_res = solution.allocated_resource
-        for resource in self.system.resources:
-            capacity = node.capacity[resource.name]
-            demand = sum(map(lambda a: alloc_res[a.id][node.id][resource.name], self.system.apps))
-            if demand > capacity:
-                return False
-        return True
+        if self._node_capacity is None:
+            self._resources_name = [None] * len(self.system.resources_index)
+            for (name, r_index) in self.system.resources_index.items():
+                self._resources_name[r_index] = name
+            self._node_capacity = np.zeros((len(self.system.nodes_index), len(self._resources_name)))
+            for node in self.system.nodes:
+                n_index = self.system.nodes_index[node.id]
+                self._node_capacity[n_index] = [node.capacity[name] for name in self._resources_name]
+            with np.errstate(invalid="ignore"):
+                tolerance = CAPACITY_TOLERANCE * np.abs(self._node_capacity)
+                self._near_capacity = np.where(np.isinf(self._node_capacity), self._node_capacity,
+                                               self._node_capacity - tolerance)
+
+        if self._usage_solution is not solution:
+            self._node_usage = solution.alloc.sum(axis=0)
+            self._usage_solution = solution
+        return self._node_usage
+
+    def _clear_node_usage(self):
+        """Clear the running resource usage after a solution is decoded
+        """
+        self._node_usage = None
+        self._usage_solution = None
+
+    def build_delay_tables(self):
+        """Build the delay tables that do not depend on the decoded individuals.
+        They are built once per execution, before the operator is sent to worker processes
+        """
+        return self.net_delay_table, self.init_delay_table
 
-    def _calc_response_time(self, app, src_node, dst_node, solution, cached_delays):
+    @cached_property
+    def net_delay_table(self):
+        """Network delay of each request flow
+
+        Returns:
+            numpy.ndarray: read-only array (apps x source nodes x destination nodes)
+        """
+        delay = calc_network_delays(self.system, self.environment_input).copy()
+        delay.flags.writeable = False
+        return delay
+
+    @cached_property
+    def init_delay_table(self):
+        """Initialization delay of each application on each node, assuming the application is placed on the node.
+        See :py:func:`sp.system_controller.util.calc.calc_initialization_delay`
+
+        Returns:
+            numpy.ndarray: read-only array (apps x nodes)
+        """
+        system, env = self.system, self.environment_input
+        apps_index, nodes_index = system.apps_index, system.nodes_index
+        curr_control = system.control_input
+        init_delay = np.zeros((len(apps_index), len(nodes_index)))
+        if curr_control is not None:
+            t = system.sampling_time
+            for (app_id, a_index) in apps_index.items():
+                mig_delay = calc_min_migration_delays(app_id, system, None, env)
+                with np.errstate(invalid="ignore"):
+                    init_delay[a_index] = np.where(t > mig_delay, mig_delay * (mig_delay + 1.0) / (2.0 * t), mig_delay)
+        init_delay.flags.writeable = False
+        return init_delay
+
+    def _calc_response_time(self, app, src_node, dst_node, solution, proc_delays):
         """Calculate response time of requests from src_node to dst_node
 
         Args:
             app (sp.core.model.application.Application): requested application
             src_node (sp.core.model.node.Node): source node
             dst_node (sp.core.model.node.Node): destination node
-            solution (OptSolution): solution
-            cached_delays (CachedDelays): cached delays
+            solution (ArrayOptSolution): solution
+            proc_delays (numpy.ndarray): processing delays (apps x nodes) cached while a solution is decoded.
+                Invalid delays are NaN
         Returns:
             float: response time
         """
-        if cached_delays.is_valid(app.id, src_node.id, dst_node.id):
-            return cached_delays.get_rt(app.id, src_node.id, dst_node.id)
-
-        prev_cpu_alloc = solution.allocated_resource[app.id][dst_node.id][Resource.CPU]
-        prev_load = solution.received_load[app.id][dst_node.id]
-        prev_place = solution.app_placement[app.id][dst_node.id]
-
-        if not prev_place:
-            load = 0.0
-            demand = app.demand[Resource.CPU](load)
-            solution.allocated_resource[app.id][dst_node.id][Resource.CPU] = demand
-            solution.received_load[app.id][dst_node.id] = load
-            solution.app_placement[app.id][dst_node.id] = True
-
-        net_delay = None
-        if cached_delays.is_net_delay_valid(app.id, src_node.id, dst_node.id):
-            net_delay = cached_delays.get_net_delay(app.id, src_node.id, dst_node.id)
-        else:
-            net_delay = calc_network_delay(app.id, src_node.id, dst_node.id,
-                                           self.system, solution, self.environment_input)
-            cached_delays.set_net_delay(app.id, src_node.id, dst_node.id, net_delay)
-
-        proc_delay = None
-        if cached_delays.is_proc_delay_valid(app.id, dst_node.id):
-            proc_delay = cached_delays.get_proc_delay(app.id, dst_node.id)
-        else:
-            proc_delay = calc_processing_delay(app.id, dst_node.id, self.system, solution, self.environment_input)
-            cached_delays.set_proc_delay(app.id, dst_node.id, proc_delay)
-
-        init_delay = None
-        if cached_delays.is_init_delay_valid(app.id, dst_node.id):
-            init_delay = cached_delays.get_init_delay(app.id, dst_node.id)
-        else:
-            init_delay = calc_initialization_delay(app.id, dst_node.id, self.system, solution, self.environment_input)
-            cached_delays.set_init_delay(app.id, dst_node.id, init_delay)
-
-        # rt = calc_response_time(app.id, src_node.id, dst_node.id, self.system, solution, self.environment_input)
-        rt = net_delay + proc_delay + init_delay
-
-        solution.allocated_resource[app.id][dst_node.id][Resource.CPU] = prev_cpu_alloc
-        solution.received_load[app.id][dst_node.id] = prev_load
-        solution.app_placement[app.id][dst_node.id] = prev_place
-
-        return rt
+        a_index = self.system.apps_index[app.id]
+        s_index = self.system.nodes_index[src_node.id]
+        d_index = self.system.nodes_index[dst_node.id]
+
+        proc_delay = proc_delays[a_index, d_index]
+        if math.isnan(proc_delay):
+            proc_delay = self._calc_processing_delay(app, dst_node, solution)
+            proc_delays[a_index, d_index] = proc_delay
+
+        net_delay = self.net_delay_table[a_index, s_index, d_index]
+        init_delay = self.init_delay_table[a_index, d_index]
+        return float(net_delay + proc_delay + init_delay)
+
+    def _calc_processing_delay(self, app, dst_node, solution):
+        """Calculate the processing delay of an application in a node.
+        If the application is not placed on the node, the delay is calculated for a new instance without load
+
+        Args:
+            app (sp.core.model.application.Application): application
+            dst_node (sp.core.model.node.Node): node
+            solution (ArrayOptSolution): solution
+        Returns:
+            float: processing delay
+        """
+        a_index = self.system.apps_index[app.id]
+        d_index = self.system.nodes_index[dst_node.id]
+        if solution.placement[a_index, d_index]:
+            return calc_processing_delay(app.id, dst_node.id, self.system, solution, self.environment_input)
+
+        cpu_index = self.system.resources_index[Resource.CPU]
+        prev_cpu_alloc = solution.alloc[a_index, d_index, cpu_index]
+        prev_load = solution.rl[a_index, d_index]
+
+        load = 0.0
+        solution.alloc[a_index, d_index, cpu_index] = app.demand[Resource.CPU](load)
+        solution.rl[a_index, d_index] = load
+        solution.placement[a_index, d_index] = True
+
+        proc_delay = calc_processing_delay(app.id, dst_node.id, self.system, solution, self.environment_input)
+
+        solution.alloc[a_index, d_index, cpu_index] = prev_cpu_alloc
+        solution.rl[a_index, d_index] = prev_load
+        solution.placement[a_index, d_index] = False
+
+        return proc_delay
@@ -1,6 +1,7 @@
 from sp.system_controller.optimizer.optimizer import Optimizer
 from sp.system_controller.metric import deadline
 from sp.core.heuristic.brkga import BRKGA
+from sp.core.util.worker_pool import WorkerPool
 from .ga_operator import SOGAOperator
 
 
@@ -18,10 +19,17 @@ class SOGAOptimizer(Optimizer):
         mutant_proportion (float): proportion of mutant individuals in a population (value between 0 and 1)
         elite_probability (float): probability of selecting a elite's gene during a crossover (value between 0 and 1)
         use_heuristic (bool): whether heuristics is used to generate the first population or not
-        pool_size (int): multi-processing pool size. If zero, the optimizer doesn't use multi-processing
+        pool_size (int): multi-processing pool size. If zero, the optimizer doesn't use multi-processing.
+            The worker processes are kept between time slots until :py:meth:`clear_params` is called
         timeout (Union[float, None]): maximum execution time of the optimizer. If None, there is no timeout
         load_chunk_distribution (float): load chunk distribution (value between 0 and 1).
             Loads are distributed in chunks where its size is defined by this attribute
+        cache_size (int): maximum number of fitness values cached during the execution of the genetic algorithm.
+            It sizes both the cache of chromosomes in the genetic algorithm and the cache of decoded solutions
+            that the genetic operator keeps in each worker process. If zero (default), the fitness is not cached
+        vectorized (bool): whether mutants and offspring of a generation are generated at once with NumPy arrays.
+            Random values are then drawn from :py:mod:`numpy.random` instead of :py:mod:`random`,
+            so both generators must be seeded to reproduce a run. By default, it is False
     """
 
     def __init__(self):
@@ -37,8 +45,11 @@ class SOGAOptimizer(Optimizer):
         self.load_chunk_distribution = 0.25
         self.use_heuristic = True
         self.pool_size = 4
+        self.cache_size = 0
+        self.vectorized = False
         self.timeout = None
         self._last_population = None
+        self._pool = None
 
     def init_params(self):
         """Initialize parameters for a simulation
@@ -46,10 +57,16 @@ class SOGAOptimizer(Optimizer):
         if self.objective is None:
             self.objective = deadline.max_deadline_violation
 
+        if self._pool is None:
+            self._pool = WorkerPool(self.pool_size)
+
     def clear_params(self):
         """Clear parameters of a simulation
         """
         self._last_population = None
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     def solve(self, system, environment_input):
         """Solve the service placement problem
@@ -67,7 +84,8 @@ class SOGAOptimizer(Optimizer):
                                    objective=self.objective,
                                    use_heuristic=self.use_heuristic,
                                    extra_first_population=self._last_population,
-                                   load_chunk_distribution=self.load_chunk_distribution)
+                                   load_chunk_distribution=self.load_chunk_distribution,
+                                   cache_size=self.cache_size)
         so_ga = BRKGA(operator=ga_operator,
                       nb_generations=self.nb_generations,
                       population_size=self.population_size,
@@ -75,7 +93,10 @@ class SOGAOptimizer(Optimizer):
                       mutant_proportion=self.mutant_proportion,
                       elite_probability=self.elite_probability,
                       timeout=self.timeout,
-                      pool_size=self.pool_size)
+                      pool_size=self.pool_size,
+                      pool=self._pool,
+                      cache_size=self.cache_size,
+                      vectorized=self.vectorized)
         population = so_ga.solve()
 
         last_pop_size = int(round(self.elite_proportion * len(population)))
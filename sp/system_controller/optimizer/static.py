@@ -1,6 +1,6 @@
 from sp.core.heuristic.nsgaii import NSGAII
 from sp.system_controller.optimizer.moga import MOGAOptimizer, MOGAOperator
-from sp.system_controller.model import OptSolution
+from sp.system_controller.model import OptSolution, ArrayOptSolution
 from sp.system_controller.util import calc_load_before_distribution, make_solution_feasible
 
 
@@ -125,7 +125,7 @@ class _StaticGAOperator(MOGAOperator):
         nb_apps = len(self.system.apps)
         nb_nodes = len(self.system.nodes)
         cloud_node = self.system.cloud_node
-        solution = OptSolution.create_empty(self.system)
+        solution = ArrayOptSolution.create_empty(self.system)
 
         # Set the same nodes as placement locations
         for app in self.system.apps:
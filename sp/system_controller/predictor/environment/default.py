@@ -1,6 +1,6 @@
 from .environment import EnvironmentPredictor
 from sp.core.predictor import AutoARIMAPredictor, SimpleExpSmoothingPredictor
-from sp.core.model import EnvironmentInput, System
+from sp.core.model import EnvironmentInput, ArrayEnvironmentInput, System
 from collections import defaultdict
 from future.utils import iteritems
 import time
@@ -158,7 +158,8 @@ class DefaultEnvironmentPredictor(EnvironmentPredictor):
         Returns:
             list(EnvironmentInput): predicted data
         """
-        envs = [EnvironmentInput.create_empty(self.system) for _ in range(steps)]
+        path_table = ArrayEnvironmentInput.get_path_table(self.environment_input, self.system)
+        envs = [ArrayEnvironmentInput.create_empty(self.system, path_table) for _ in range(steps)]
         total_elapsed_time = 0.0
 
         perf_count = time.perf_counter()
@@ -181,18 +182,20 @@ class DefaultEnvironmentPredictor(EnvironmentPredictor):
         """Predict load attribute of next environment inputs
 
         Args:
-            env_inputs list(EnvironmentInput): next environment inputs
+            env_inputs list(ArrayEnvironmentInput): next environment inputs
             steps (int): number of values to predict
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
+        apps_index, nodes_index = self.system.apps_index, self.system.nodes_index
         for app in self.system.apps:
+            a = apps_index[app.id]
             for src_node in self.system.nodes:
+                s = nodes_index[src_node.id]
                 predictor = self.load_predictor[app.id][src_node.id]
                 values = predictor.predict(steps)
-                values = list(map(lambda v: max(0.0, v), values))
                 for index in range(steps):
-                    env_inputs[index].generated_load[app.id][src_node.id] = values[index]
+                    env_inputs[index].load[a, s] = max(0.0, values[index])
 
         return env_inputs
 
@@ -200,21 +203,21 @@ class DefaultEnvironmentPredictor(EnvironmentPredictor):
         """Predict network delay attribute of next environment inputs
 
         Args:
-            env_inputs list(EnvironmentInput): next environment inputs
+            env_inputs list(ArrayEnvironmentInput): next environment inputs
             steps (int): number of values to predict
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
+        apps_index, nodes_index = self.system.apps_index, self.system.nodes_index
         for app in self.system.apps:
+            a = apps_index[app.id]
             for src_node in self.system.nodes:
+                s = nodes_index[src_node.id]
                 for dst_node in self.system.nodes:
+                    d = nodes_index[dst_node.id]
                     predictor = self.net_delay_predictor[app.id][src_node.id][dst_node.id]
                     values = predictor.predict(steps)
-                    values = list(map(lambda v: max(0.0, v), values))
                     for index in range(steps):
-                        env_inputs[index].net_delay[app.id][src_node.id][dst_node.id] = values[index]
-
-        for index in range(steps):
-            env_inputs[index].net_path = self.environment_input.net_path
+                        env_inputs[index].delay[a, s, d] = max(0.0, values[index])
 
         return env_inputs
\ No newline at end of file
@@ -1,9 +1,10 @@
 from .environment import EnvironmentPredictor
 from sp.core.predictor import AutoARIMAPredictor, SimpleExpSmoothingPredictor, NaivePredictor
-from sp.core.model import EnvironmentInput, System
+from sp.core.model import EnvironmentInput, ArrayEnvironmentInput, System
 from sp.core.util import json_util
 from collections import defaultdict
 import multiprocessing as mp
+import numpy as np
 import time
 import logging
 
@@ -225,9 +226,10 @@ class MultiProcessingEnvironmentPredictor(EnvironmentPredictor):
         Args:
             steps (int): number of values to predict
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
-        envs = [EnvironmentInput.create_empty(self.system) for _ in range(steps)]
+        path_table = ArrayEnvironmentInput.get_path_table(self.environment_input, self.system)
+        envs = [ArrayEnvironmentInput.create_empty(self.system, path_table) for _ in range(steps)]
 
         total_elapsed_time = 0.0
 
@@ -251,19 +253,12 @@ class MultiProcessingEnvironmentPredictor(EnvironmentPredictor):
         """Predict load attribute of next environment inputs
 
         Args:
-            env_inputs list(EnvironmentInput): next environment inputs
+            env_inputs list(ArrayEnvironmentInput): next environment inputs
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
         steps = len(env_inputs)
-        if self._cached_pred_load is not None and len(self._cached_pred_load) >= steps:
-            predictions = self._cached_pred_load[:steps]
-            for index in range(steps):
-                for app in self.system.apps:
-                    for src_node in self.system.nodes:
-                        value = predictions[index][app.id][src_node.id]
-                        env_inputs[index].generated_load[app.id][src_node.id] = value
-        else:
+        if self._cached_pred_load is None or len(self._cached_pred_load) < steps:
             list_params = []
             map_func = self._map_func
             if self.load_predictor_class == NaivePredictor:
@@ -279,14 +274,15 @@ class MultiProcessingEnvironmentPredictor(EnvironmentPredictor):
                     list_params.append(params)
 
             predictions = list(map_func(_predict, list_params))
-            self._cached_pred_load = [defaultdict(lambda: defaultdict(lambda: 0.0)) for _ in range(steps)]
+            apps_index, nodes_index = self.system.apps_index, self.system.nodes_index
+            self._cached_pred_load = np.zeros((steps, len(apps_index), len(nodes_index)))
             for (params, values) in zip(list_params, predictions):
-                app_id = params["app_id"]
-                node_id = params["node_id"]
-                for index in range(steps):
-                    value = values[index]
-                    env_inputs[index].generated_load[app_id][node_id] = value
-                    self._cached_pred_load[index][app_id][node_id] = value
+                a = apps_index[params["app_id"]]
+                s = nodes_index[params["node_id"]]
+                self._cached_pred_load[:, a, s] = values[:steps]
+
+        for index in range(steps):
+            env_inputs[index].load[:] = self._cached_pred_load[index]
 
         return env_inputs
 
@@ -294,20 +290,12 @@ class MultiProcessingEnvironmentPredictor(EnvironmentPredictor):
         """Predict network delay attribute of next environment inputs
 
         Args:
-            env_inputs list(EnvironmentInput): next environment inputs
+            env_inputs list(ArrayEnvironmentInput): next environment inputs
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
         steps = len(env_inputs)
-        if self._cached_pred_net is not None and len(self._cached_pred_net) >= steps:
-            predictions = self._cached_pred_net[:steps]
-            for index in range(steps):
-                for app in self.system.apps:
-                    for src_node in self.system.nodes:
-                        for dst_node in self.system.nodes:
-                            value = predictions[index][app.id][src_node.id][dst_node.id]
-                            env_inputs[index].net_delay[app.id][src_node.id][dst_node.id] = value
-        else:
+        if self._cached_pred_net is None or len(self._cached_pred_net) < steps:
             list_params = []
             map_func = self._map_func
             if self.net_delay_predictor_class == NaivePredictor:
@@ -324,19 +312,17 @@ class MultiProcessingEnvironmentPredictor(EnvironmentPredictor):
                         list_params.append(params)
 
             predictions = list(map_func(_predict, list_params))
-            self._cached_pred_net = [defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: 0.0)))
-                                     for _ in range(steps)]
+            apps_index, nodes_index = self.system.apps_index, self.system.nodes_index
+            nb_nodes = len(nodes_index)
+            self._cached_pred_net = np.zeros((steps, len(apps_index), nb_nodes, nb_nodes))
             for (params, values) in zip(list_params, predictions):
-                app_id = params["app_id"]
-                src_node_id = params["src_node_id"]
-                dst_node_id = params["dst_node_id"]
-                for index in range(steps):
-                    value = values[index]
-                    env_inputs[index].net_delay[app_id][src_node_id][dst_node_id] = value
-                    self._cached_pred_net[index][app_id][src_node_id][dst_node_id] = value
+                a = apps_index[params["app_id"]]
+                s = nodes_index[params["src_node_id"]]
+                d = nodes_index[params["dst_node_id"]]
+                self._cached_pred_net[:, a, s, d] = values[:steps]
 
         for index in range(steps):
-            env_inputs[index].net_path = self.environment_input.net_path
+            env_inputs[index].delay[:] = self._cached_pred_net[index]
 
         return env_inputs
 
@@ -1,5 +1,5 @@
 from .environment import EnvironmentPredictor
-from sp.core.model import EnvironmentInput, System
+from sp.core.model import EnvironmentInput, ArrayEnvironmentInput, System
 from sp.core.util import json_util
 from collections import defaultdict
 
@@ -155,9 +155,10 @@ class RealDataEnvironmentPredictor(EnvironmentPredictor):
         Args:
             steps (int): number of values to predict
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
-        envs = [EnvironmentInput.create_empty(self.system) for _ in range(steps)]
+        path_table = ArrayEnvironmentInput.get_path_table(self.environment_input, self.system)
+        envs = [ArrayEnvironmentInput.create_empty(self.system, path_table) for _ in range(steps)]
         envs = self._predict_load(envs)
         envs = self._predict_net_delay(envs)
         return envs
@@ -166,12 +167,15 @@ class RealDataEnvironmentPredictor(EnvironmentPredictor):
         """Predict load attribute of next environment inputs
 
         Args:
-            env_inputs list(EnvironmentInput): next environment inputs
+            env_inputs list(ArrayEnvironmentInput): next environment inputs
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
+        apps_index, nodes_index = self.system.apps_index, self.system.nodes_index
         for app in self.system.apps:
+            a = apps_index[app.id]
             for node in self.system.nodes:
+                s = nodes_index[node.id]
                 data = self._load_data[app.id][node.id]
                 for step in range(len(env_inputs)):
                     data_index = step + self._current_index + 1
@@ -179,21 +183,25 @@ class RealDataEnvironmentPredictor(EnvironmentPredictor):
                     if data_index < len(data):
                         value = data[data_index]
                     else:
-                        value = self.environment_input.generated_load[app.id][node.id]
-                    env_inputs[step].generated_load[app.id][node.id] = value
+                        value = self.environment_input.get_generated_load(app.id, node.id)
+                    env_inputs[step].load[a, s] = value
         return env_inputs
 
     def _predict_net_delay(self, env_inputs):
         """Predict network delay attribute of next environment inputs
 
         Args:
-            env_inputs list(EnvironmentInput): next environment inputs
+            env_inputs list(ArrayEnvironmentInput): next environment inputs
         Returns:
-            list(EnvironmentInput): predicted data
+            list(ArrayEnvironmentInput): predicted data
         """
+        apps_index, nodes_index = self.system.apps_index, self.system.nodes_index
         for app in self.system.apps:
+            a = apps_index[app.id]
             for src_node in self.system.nodes:
+                s = nodes_index[src_node.id]
                 for dst_node in self.system.nodes:
+                    d = nodes_index[dst_node.id]
                     data = self._net_delay_data[app.id][src_node.id][dst_node.id]
                     for step in range(len(env_inputs)):
                         data_index = step + self._current_index + 1
@@ -201,9 +209,6 @@ class RealDataEnvironmentPredictor(EnvironmentPredictor):
                         if data_index < len(data):
                             value = data[data_index]
                         else:
-                            value = self.environment_input.net_delay[app.id][src_node.id][dst_node.id]
-                        env_inputs[step].net_delay[app.id][src_node.id][dst_node.id] = value
-                        env_inputs[step].net_path = self.environment_input.net_path
+                            value = self.environment_input.get_net_delay(app.id, src_node.id, dst_node.id)
+                        env_inputs[step].delay[a, s, d] = value
         return env_inputs
-
-
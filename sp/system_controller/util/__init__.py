@@ -1,8 +1,8 @@
 from .alloc import alloc_demanded_resources
-from .calc import calc_response_time, calc_processing_delay, calc_network_delay, calc_initialization_delay, \
-    calc_migration_delay, calc_min_migration_delay, calc_app_size, \
-    calc_load_before_distribution, calc_load_after_distribution, calc_received_load
-from .check import is_solution_valid
+from .calc import calc_response_time, calc_processing_delay, calc_network_delay, calc_network_delays, \
+    calc_initialization_delay, calc_migration_delay, calc_min_migration_delay, calc_min_migration_delays, \
+    calc_app_size, calc_load_before_distribution, calc_load_after_distribution, calc_received_load
+from .check import is_solution_valid, find_solution_violations
 from .make import make_solution_feasible
 from .dominance import pareto_dominates, preferred_dominates
 from .metric import filter_metric
@@ -1,5 +1,6 @@
-from sp.core.model import Resource, System, ControlInput, EnvironmentInput
+from sp.core.model import Resource, System, ControlInput, EnvironmentInput, ArrayEnvironmentInput
 from sp.system_controller.model import OptSolution
+import numpy as np
 import math
 
 
@@ -64,6 +65,36 @@ def calc_network_delay(app_id, src_node_id, dst_node_id, system, control_input,
     return environment_input.get_net_delay(app_id, src_node_id, dst_node_id)
 
 
+def calc_network_delays(system, environment_input, apps=None, nodes=None):
+    """Calculate the average network delay of all request flows in one pass.
+    It is the batched version of :py:func:`calc_network_delay`
+
+    Args:
+        system (System): system
+        environment_input (EnvironmentInput): environment input
+        apps (list): applications. If None, ``system.apps`` are used
+        nodes (list): source and destination nodes. If None, ``system.nodes`` are used
+    Returns:
+        numpy.ndarray: network delays (apps x source nodes x destination nodes) ordered as ``apps`` and ``nodes``.
+            It may be the environment input's array, so it must not be modified
+    """
+    apps = system.apps if apps is None else apps
+    nodes = system.nodes if nodes is None else nodes
+    if isinstance(environment_input, ArrayEnvironmentInput):
+        delay = environment_input.delay
+        apps_pos = [environment_input.apps_index[app.id] for app in apps]
+        nodes_pos = [environment_input.nodes_index[node.id] for node in nodes]
+        if apps_pos != list(range(delay.shape[0])):
+            delay = delay[apps_pos]
+        if nodes_pos != list(range(delay.shape[1])):
+            delay = delay[:, nodes_pos][:, :, nodes_pos]
+        return delay
+
+    return np.array([[[environment_input.get_net_delay(app.id, src_node.id, dst_node.id) for dst_node in nodes]
+                      for src_node in nodes] for app in apps],
+                    dtype=float).reshape(len(apps), len(nodes), len(nodes))
+
+
 def calc_initialization_delay(app_id, node_id, system, control_input, environment_input):
     """Calculate initialization delay of application instance in a node
 
@@ -217,6 +248,107 @@ def calc_min_migration_delay(app_id, dst_node_id, system, control_input, environ
     return (mig_delay, selected_src_node_id) if return_src_node_id else mig_delay
 
 
+def calc_min_migration_delays(app_id, system, control_input, environment_input, return_src_node_index=False):
+    """Calculate minimum migration/replication delay of an application to all destination nodes in one pass.
+    It is the batched version of :py:func:`calc_min_migration_delay`
+
+    Args:
+        app_id (int): application's id
+        system (System): system
+        control_input (ControlInput): control input
+        environment_input (EnvironmentInput): environment input
+        return_src_node_index (bool): whether source node's indexes should be return or not
+    Returns:
+        Union[numpy.ndarray, tuple]: migration delays (nodes) indexed by ``system.nodes_index``
+            or tuple (mig delays, src node indexes)
+    """
+    nb_nodes = len(system.nodes_index)
+    nodes_range = np.arange(nb_nodes)
+    curr_control = system.control_input
+    if curr_control is None:
+        mig_delay = np.zeros(nb_nodes)
+        return (mig_delay, nodes_range) if return_src_node_index else mig_delay
+
+    placement = np.zeros(nb_nodes, dtype=bool)
+    app_size = np.zeros(nb_nodes)
+    for node in system.nodes:
+        n = system.nodes_index[node.id]
+        placement[n] = curr_control.get_app_placement(app_id, node.id)
+        if placement[n]:
+            app_size[n] = calc_app_size(app_id, node.id, system, curr_control, environment_input)
+
+    path_delay, path_inv_bw, path_exists = _calc_path_costs(app_id, system, environment_input)
+    with np.errstate(invalid="ignore"):
+        delay = path_delay + (app_size * 8.0)[:, np.newaxis] * path_inv_bw
+    delay = np.where(path_exists, delay, np.inf)
+    delay[~placement | (app_size == 0.0), :] = np.inf
+    delay[nodes_range, nodes_range] = np.inf
+
+    src_index = np.argmin(delay, axis=0)
+    mig_delay = delay[src_index, nodes_range]
+
+    no_src = np.isinf(mig_delay)
+    if no_src.any():
+        cloud_index = system.nodes_index[system.cloud_node.id]
+        cloud_size = calc_app_size(app_id, system.cloud_node.id, system, curr_control, environment_input,
+                                   ignore_placement=True)
+        if cloud_size == 0.0:
+            cloud_delay = np.full(nb_nodes, np.inf)
+        else:
+            with np.errstate(invalid="ignore"):
+                cloud_delay = path_delay[cloud_index] + cloud_size * 8.0 * path_inv_bw[cloud_index]
+            cloud_delay = np.where(path_exists[cloud_index], cloud_delay, np.inf)
+            cloud_delay[cloud_index] = 0.0
+        mig_delay[no_src] = cloud_delay[no_src]
+        src_index[no_src] = cloud_index
+
+    mig_delay[placement] = 0.0
+    src_index[placement] = nodes_range[placement]
+    return (mig_delay, src_index) if return_src_node_index else mig_delay
+
+
+def _calc_path_costs(app_id, system, environment_input):
+    """Calculate the transfer costs of the network paths of an application.
+    The transfer delay of ``size`` bits through a path is ``path_delay + size * path_inv_bw``
+
+    Args:
+        app_id (int): application's id
+        system (System): system
+        environment_input (EnvironmentInput): environment input
+    Returns:
+        tuple: arrays (source nodes x destination nodes) of the propagation delay sums, inverse bandwidth sums,
+            and whether a source node reaches a destination node
+    """
+    nodes_index = system.nodes_index
+    network = system.scenario.network
+    nb_nodes = len(nodes_index)
+    path_table = getattr(environment_input, "path_table", None)
+
+    if isinstance(environment_input, ArrayEnvironmentInput) and path_table is not None \
+            and path_table.apps_index == system.apps_index and path_table.nodes_index == nodes_index:
+        a = system.apps_index[app_id]
+        path_delay = path_table.sum_link_values(a, network.link_propagation_delay)
+        path_inv_bw = path_table.sum_link_values(a, network.link_inverse_bandwidth)
+        path_length = path_table.get_path_length(a)
+    else:
+        path_delay = np.zeros((nb_nodes, nb_nodes))
+        path_inv_bw = np.zeros((nb_nodes, nb_nodes))
+        path_length = np.zeros((nb_nodes, nb_nodes), dtype=int)
+        for (src_node_id, s) in nodes_index.items():
+            for (dst_node_id, d) in nodes_index.items():
+                net_path = environment_input.get_net_path(app_id, src_node_id, dst_node_id)
+                if not net_path:
+                    continue
+                path_length[s, d] = len(net_path)
+                for (link_start_node_id, link_end_node_id) in zip(net_path[:-1], net_path[1:]):
+                    link = system.get_link(link_start_node_id, link_end_node_id)
+                    path_delay[s, d] += link.propagation_delay
+                    path_inv_bw[s, d] += 1.0 / float(link.bandwidth)
+
+    path_exists = (path_length > 0) | np.eye(nb_nodes, dtype=bool)
+    return path_delay, path_inv_bw, path_exists
+
+
 def calc_load_before_distribution(app_id, node_id, system, environment_input):
     """Calculate load before distribution
 
@@ -269,7 +401,6 @@ def calc_received_load(app_id, node_id, system, control_input, environment_input
     if isinstance(control_input, OptSolution) and use_cache:
         load = control_input.get_received_load(app_id, node_id)
     else:
-        load = sum(map(lambda src_node: calc_load_after_distribution(app_id, src_node.id, node_id,
-                                                                     system, control_input, environment_input),
-                       system.nodes))
+        for (src_node_id, ld) in control_input.get_load_sources(app_id, node_id):
+            load += ld * calc_load_before_distribution(app_id, src_node_id, system, environment_input)
     return load
@@ -1,14 +1,15 @@
-from sp.core.model import Resource, System, ControlInput, EnvironmentInput
+from sp.core.model import System, ControlInput, EnvironmentInput
 from sp.system_controller.model import OptSolution
-from sp.system_controller.util.calc import calc_load_before_distribution
-import math
+from sp.system_controller.metric.engine import MetricEngine
+import numpy as np
 import logging
 
 ERROR_TOLERANCE = 0.001
 
 
 def is_solution_valid(system, solution, environment_input, allow_surplus_alloc=False):
-    """Check if a solution is valid
+    """Check if a solution is valid.
+    Each violation found is logged with debug level, see :py:func:`find_solution_violations`
 
     Args:
         system (System): system
@@ -18,99 +19,88 @@ def is_solution_valid(system, solution, environment_input, allow_surplus_alloc=F
     Returns:
         bool: valid or not
     """
-    for app in system.apps:
-        nb_instances = sum([solution.app_placement[app.id][n.id] for n in system.nodes])
-        if nb_instances > app.max_instances or nb_instances == 0:
-            logging.debug("Invalid number of instances for app %d: %d (max %d)",
-                          app.id, nb_instances, app.max_instances)
-            return False
-
-        for src_node in system.nodes:
-            src_ld = 0.0
-            for dst_node in system.nodes:
-                dst_ld = solution.load_distribution[app.id][src_node.id][dst_node.id]
-                if math.isnan(dst_ld) or dst_ld < 0.0 or dst_ld > 1.0 + ERROR_TOLERANCE:
-                    logging.debug("Invalid load distribution (app %d, src node %d, dst node %d): %f",
-                                  app.id, src_node.id, dst_node.id, dst_ld)
-                    return False
-
-                if dst_ld > 0.0 and not solution.app_placement[app.id][dst_node.id]:
-                    logging.debug("Invalid load distribution, node %d doesn't host the app %d",
-                                  dst_node.id, app.id)
-                    return False
-
-                src_ld += dst_ld
-            if abs(1.0 - src_ld) > ERROR_TOLERANCE:
-                logging.debug("Invalid load distribution, "
-                              "loads from node %d aren't completely distributed for app %d - %f",
-                              src_node.id, app.id, src_ld)
-                return False
-
-    for dst_node in system.nodes:
-        for resource in system.resources:
-            allocated = 0.0
-            for app in system.apps:
-                alloc_res = solution.allocated_resource[app.id][dst_node.id][resource.name]
-                if alloc_res > 0.0 and not solution.app_placement[app.id][dst_node.id]:
-                    logging.debug("Invalid resource allocation for %s, node %d doesn't host app %d",
-                                  resource.name, dst_node.id, app.id)
-                    return False
-                allocated += alloc_res
-
-                dst_load = 0.0
-                for src_node in system.nodes:
-                    ld = solution.load_distribution[app.id][src_node.id][dst_node.id]
-                    src_load = calc_load_before_distribution(app.id, src_node.id, system, environment_input)
-                    dst_load += float(ld * src_load)
-
-                if isinstance(solution, OptSolution):
-                    received_load = solution.received_load[app.id][dst_node.id]
-                    if abs(dst_load - received_load) > ERROR_TOLERANCE:
-                        logging.debug("Invalid received load of node %d for app %d: %f (valid %f)",
-                                      dst_node.id, app.id, received_load, dst_load)
-                        return False
-
-                if dst_load > 0.0 and not solution.app_placement[app.id][dst_node.id]:
-                    logging.debug("Invalid received load, node %d doesn't host app %d: %f",
-                                  dst_node.id, app.id, dst_load)
-                    return False
-
-                app_demand = app.demand[resource.name](dst_load)
-                if allow_surplus_alloc:
-                    if alloc_res - app_demand <= -1 * ERROR_TOLERANCE and solution.app_placement[app.id][dst_node.id]:
-                        logging.debug("Invalid allocated resource for (app %d, node %d, resource %s): %f (valid %f)",
-                                      app.id, dst_node.id, resource.name, alloc_res, app_demand)
-                        return False
-                else:
-                    if abs(app_demand - alloc_res) > ERROR_TOLERANCE and solution.app_placement[app.id][dst_node.id]:
-                        logging.debug("Invalid allocated resource for (app %d, node %d, resource %s): %f (valid %f)",
-                                      app.id, dst_node.id, resource.name, alloc_res, app_demand)
-                        return False
-
-            capacity = dst_node.capacity[resource.name]
-            if allocated - capacity > ERROR_TOLERANCE:
-                logging.debug("Invalid allocated resource, capacity exceeded for resource %s in node %d: %f (max %f)",
-                              resource.name, dst_node.id, allocated, capacity)
-                return False
-
-    for app in system.apps:
-        for dst_node in system.nodes:
-            if not solution.get_app_placement(app.id, dst_node.id):
-                continue
-
-            arrival_rate = 0.0
-            for src_node in system.nodes:
-                ld = solution.load_distribution[app.id][src_node.id][dst_node.id]
-                src_load = calc_load_before_distribution(app.id, src_node.id, system, environment_input)
-                arrival_rate += float(ld * src_load)
-
-            alloc_cpu = solution.allocated_resource[app.id][dst_node.id][Resource.CPU]
-            service_rate = alloc_cpu / float(app.work_size)
-
-            if arrival_rate - service_rate > ERROR_TOLERANCE:
-                logging.debug("Invalid processing queue in node %d for app %d, "
-                              "arrival rate %f exceeds service rate %f",
-                              dst_node.id, app.id, arrival_rate, service_rate)
-                return False
-
-    return True
+    violations = find_solution_violations(system, solution, environment_input, allow_surplus_alloc)
+    for violation in violations:
+        logging.debug(violation)
+    return len(violations) == 0
+
+
+def find_solution_violations(system, solution, environment_input, allow_surplus_alloc=False, engine=None):
+    """Find all constraint violations of a solution.
+    The constraints are checked with array operations over all applications and nodes at once
+
+    Args:
+        system (System): system
+        solution (Union[ControlInput, OptSolution]): optimization solution
+        environment_input (EnvironmentInput): environment input
+        allow_surplus_alloc (bool): whether or not the allocation of surplus resources to an application is allowed
+        engine (MetricEngine): shared metric engine
+    Returns:
+        list(str): description of each violation. The solution is valid if the list is empty
+    """
+    engine = MetricEngine.create(system, solution, environment_input, engine=engine)
+    apps, nodes, resources = system.apps, system.nodes, system.resources
+    placement = engine.placement
+    ld = engine.load_distribution
+    alloc = engine.allocated_resource
+    violations = []
+
+    nb_instances = placement.sum(axis=1)
+    max_instances = np.array([app.max_instances for app in apps])
+    for a in np.nonzero((nb_instances > max_instances) | (nb_instances == 0))[0]:
+        violations.append("Invalid number of instances for app %d: %d (max %d)"
+                          % (apps[a].id, nb_instances[a], max_instances[a]))
+
+    with np.errstate(invalid="ignore"):
+        invalid_ld = np.isnan(ld) | (ld < 0.0) | (ld > 1.0 + ERROR_TOLERANCE)
+        for (a, s, d) in zip(*np.nonzero(invalid_ld)):
+            violations.append("Invalid load distribution (app %d, src node %d, dst node %d): %f"
+                              % (apps[a].id, nodes[s].id, nodes[d].id, ld[a, s, d]))
+        for (a, d) in zip(*np.nonzero((ld > 0.0).any(axis=1) & ~placement)):
+            violations.append("Invalid load distribution, node %d doesn't host the app %d" % (nodes[d].id, apps[a].id))
+
+        src_ld = ld.sum(axis=2)
+        for (a, s) in zip(*np.nonzero(np.abs(1.0 - src_ld) > ERROR_TOLERANCE)):
+            violations.append("Invalid load distribution, loads from node %d aren't completely distributed "
+                              "for app %d - %f" % (nodes[s].id, apps[a].id, src_ld[a, s]))
+
+        for (a, n, r) in zip(*np.nonzero((alloc > 0.0) & ~placement[:, :, np.newaxis])):
+            violations.append("Invalid resource allocation for %s, node %d doesn't host app %d"
+                              % (resources[r].name, nodes[n].id, apps[a].id))
+
+        dst_load = np.einsum("as,asd->ad", engine.load_before_distribution, ld)
+        if isinstance(solution, OptSolution):
+            received_load = engine.received_load
+            for (a, n) in zip(*np.nonzero(np.abs(dst_load - received_load) > ERROR_TOLERANCE)):
+                violations.append("Invalid received load of node %d for app %d: %f (valid %f)"
+                                  % (nodes[n].id, apps[a].id, received_load[a, n], dst_load[a, n]))
+        for (a, n) in zip(*np.nonzero((dst_load > 0.0) & ~placement)):
+            violations.append("Invalid received load, node %d doesn't host app %d: %f"
+                              % (nodes[n].id, apps[a].id, dst_load[a, n]))
+
+        demand = np.zeros(alloc.shape)
+        for (a, n) in zip(*np.nonzero(placement)):
+            app = apps[a]
+            for (r, resource) in enumerate(resources):
+                demand[a, n, r] = app.demand[resource.name](dst_load[a, n])
+        if allow_surplus_alloc:
+            invalid_alloc = alloc - demand <= -1 * ERROR_TOLERANCE
+        else:
+            invalid_alloc = np.abs(demand - alloc) > ERROR_TOLERANCE
+        for (a, n, r) in zip(*np.nonzero(invalid_alloc & placement[:, :, np.newaxis])):
+            violations.append("Invalid allocated resource for (app %d, node %d, resource %s): %f (valid %f)"
+                              % (apps[a].id, nodes[n].id, resources[r].name, alloc[a, n, r], demand[a, n, r]))
+
+        allocated = alloc.sum(axis=0)
+        capacity = np.array([[node.capacity[resource.name] for resource in resources] for node in nodes],
+                            dtype=float).reshape(allocated.shape)
+        for (n, r) in zip(*np.nonzero(allocated - capacity > ERROR_TOLERANCE)):
+            violations.append("Invalid allocated resource, capacity exceeded for resource %s in node %d: %f (max %f)"
+                              % (resources[r].name, nodes[n].id, allocated[n, r], capacity[n, r]))
+
+        service_rate = engine.service_rate
+        for (a, n) in zip(*np.nonzero((dst_load - service_rate > ERROR_TOLERANCE) & placement)):
+            violations.append("Invalid processing queue in node %d for app %d, arrival rate %f exceeds service rate %f"
+                              % (nodes[n].id, apps[a].id, dst_load[a, n], service_rate[a, n]))
+
+    return violations
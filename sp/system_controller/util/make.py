@@ -1,4 +1,6 @@
-from sp.system_controller.util.calc import calc_load_before_distribution
+from sp.system_controller.model import ArrayOptSolution
+from sp.system_controller.util.calc import calc_load_before_distribution, calc_network_delays
+import numpy as np
 
 
 ROUND_PRECISION = 5
@@ -15,6 +17,10 @@ def make_solution_feasible(system, solution, environment_input):
         sp.system_controller.model.opt_solution.OptSolution: feasible solution
     """
     # solution = _round_values(system, solution, environment_input)
+    if isinstance(solution, ArrayOptSolution) and solution.apps_index == system.apps_index \
+            and solution.nodes_index == system.nodes_index:
+        return make_array_solution_feasible(system, solution, environment_input)
+
     solution = make_min_instances_constraint_feasible(system, solution, environment_input)
     solution = make_max_instances_constraint_feasible(system, solution, environment_input)
     solution = make_load_distribution_constraint_feasible(system, solution, environment_input)
@@ -139,6 +145,85 @@ def make_load_distribution_constraint_feasible(system, solution, environment_inp
     return solution
 
 
+def make_array_solution_feasible(system, solution, environment_input):
+    """It tries to make an array-backed solution feasible.
+    It performs the same repairs of :py:func:`make_solution_feasible` in bulk for each application
+
+    Args:
+        system (sp.core.model.system.System): system
+        solution (sp.system_controller.model.array_opt_solution.ArrayOptSolution): optimization solution
+        environment_input (sp.core.model.environment_input.EnvironmentInput): environment input
+    Returns:
+        sp.system_controller.model.array_opt_solution.ArrayOptSolution: feasible solution
+    """
+    cloud_index = system.nodes_index[system.cloud_node.id]
+    net_delay = None
+    for app in system.apps:
+        a = system.apps_index[app.id]
+        instances = np.nonzero(solution.placement[a])[0]
+
+        if len(instances) == 0:
+            solution.placement[a, cloud_index] = True
+            solution.rl[a, cloud_index] = 0.0
+            _set_array_demand(app, cloud_index, solution)
+            solution.ld[a, :, cloud_index] = 1.0
+            instances = np.array([cloud_index])
+
+        elif len(instances) > app.max_instances:
+            solution.placement[a, cloud_index] = True
+            others = instances[instances != cloud_index]
+            order = np.argsort(-solution.rl[a, others], kind="stable")
+            removed = others[order][app.max_instances - 1:]
+            for n in removed[::-1]:
+                solution.placement[a, n] = False
+                solution.rl[a, cloud_index] += solution.rl[a, n]
+                solution.rl[a, n] = 0.0
+                solution.alloc[a, n, :] = 0.0
+                solution.ld[a, :, cloud_index] += solution.ld[a, :, n]
+                solution.ld[a, :, n] = 0.0
+            _set_array_demand(app, cloud_index, solution)
+            instances = np.nonzero(solution.placement[a])[0]
+
+        remaining_ld = 1.0 - solution.ld[a][:, instances].sum(axis=1)
+        repaired_nodes = set()
+        for s in np.nonzero(remaining_ld > 0.0)[0]:
+            src_remaining_ld = round(float(remaining_ld[s]), ROUND_PRECISION)
+            if src_remaining_ld <= 0.0:
+                continue
+
+            if solution.placement[a, cloud_index]:
+                d = cloud_index
+            else:
+                if net_delay is None:
+                    net_delay = calc_network_delays(system, environment_input)
+                d = instances[np.argmin(net_delay[a, s, instances])]
+
+            src_node_id = system.nodes[s].id
+            total_load = calc_load_before_distribution(app.id, src_node_id, system, environment_input)
+            solution.ld[a, s, d] += src_remaining_ld
+            solution.rl[a, d] += src_remaining_ld * total_load
+            repaired_nodes.add(d)
+
+        for d in repaired_nodes:
+            _set_array_demand(app, d, solution)
+
+    return solution
+
+
+def _set_array_demand(app, node_index, solution):
+    """Allocate the demanded resources of an application instance according to its received load
+
+    Args:
+        app (sp.core.model.application.Application): application
+        node_index (int): node's index
+        solution (sp.system_controller.model.array_opt_solution.ArrayOptSolution): optimization solution
+    """
+    a = solution.apps_index[app.id]
+    load = solution.rl[a, node_index]
+    for (resource_name, r) in solution.resources_index.items():
+        solution.alloc[a, node_index, r] = app.demand[resource_name](load)
+
+
 def _round_values(system, solution, environment_input=None):
     """Round values of a solution
 
@@ -0,0 +1,65 @@
+from sp.core.heuristic.brkga import BRKGA, GAOperator, GAIndividual
+import random
+import unittest
+
+
+class _SumOperator(GAOperator):
+    @property
+    def nb_genes(self):
+        return 20
+
+    def evaluate(self, individual):
+        return sum(individual)
+
+
+class _IndexOperator(_SumOperator):
+    def rand_individual(self):
+        return GAIndividual([random.randrange(5) for _ in range(self.nb_genes)])
+
+
+class BRKGATestCase(unittest.TestCase):
+    def test_rand_population(self):
+        operator = _SumOperator()
+        population = operator.rand_population(10)
+        self.assertEqual(len(population), 10)
+        for indiv in population:
+            self.assertIsInstance(indiv, GAIndividual)
+            self.assertEqual(indiv.nb_genes, operator.nb_genes)
+            self.assertTrue(all(isinstance(g, float) and 0.0 <= g < 1.0 for g in indiv))
+            self.assertFalse(indiv.is_fitness_valid())
+
+        population = _IndexOperator().rand_population(10)
+        self.assertTrue(all(isinstance(g, int) for indiv in population for g in indiv))
+
+    def test_crossover_population(self):
+        for operator in [_SumOperator(), _IndexOperator()]:
+            parents_1 = operator.rand_population(5)
+            parents_2 = operator.rand_population(5)
+            offspring = operator.crossover_population(parents_1, parents_2, 0.7, 0.3)
+            self.assertEqual(len(offspring), 10)
+
+            for (index, (indiv_1, indiv_2)) in enumerate(zip(parents_1, parents_2)):
+                child_1, child_2 = offspring[2 * index], offspring[2 * index + 1]
+                for g in range(operator.nb_genes):
+                    self.assertIn(child_1[g], (indiv_1[g], indiv_2[g]))
+                    self.assertEqual({child_1[g], child_2[g]}, {indiv_1[g], indiv_2[g]})
+                    self.assertEqual(type(child_1[g]), type(indiv_1[g]))
+
+    def test_vectorized_solve(self):
+        ga = BRKGA(operator=_SumOperator(), population_size=20, nb_generations=10,
+                   elite_proportion=0.2, mutant_proportion=0.1, elite_probability=0.6, vectorized=True)
+        ga.init_params()
+        population = ga.first_population()
+        self.assertEqual(len(population), 20)
+        next_population = ga.next_population(population)
+        self.assertEqual(len(next_population), 20)
+        self.assertLessEqual(next_population[0].fitness, population[0].fitness)
+
+        population = ga.solve()
+        self.assertEqual(len(population), 20)
+        fitnesses = [indiv.fitness for indiv in population]
+        self.assertListEqual(fitnesses, sorted(fitnesses))
+
+
+if __name__ == '__main__':
+    unittest.main()
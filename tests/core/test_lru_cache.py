@@ -0,0 +1,57 @@
+from sp.core.util.lru_cache import LRUCache
+from sp.core.heuristic.brkga import BRKGA, GAOperator, GAIndividual
+import unittest
+
+
+class _CountOperator(GAOperator):
+    def __init__(self):
+        GAOperator.__init__(self)
+        self.nb_evaluations = 0
+
+    @property
+    def nb_genes(self):
+        return 3
+
+    def evaluate(self, individual):
+        self.nb_evaluations += 1
+        return sum(individual)
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    def test_eviction(self):
+        cache = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_ga_fitness_cache(self):
+        operator = _CountOperator()
+        ga = BRKGA(operator=operator, population_size=4, nb_generations=1,
+                   elite_proportion=0.25, mutant_proportion=0.25, cache_size=10)
+        ga.init_params()
+
+        chromosome = [0.1, 0.2, 0.3]
+        population = [GAIndividual(list(chromosome)) for _ in range(3)] + [GAIndividual([0.5, 0.5, 0.5])]
+        fitnesses = ga.evaluate_population(population)
+        self.assertEqual(operator.nb_evaluations, 2)
+        self.assertAlmostEqual(fitnesses[0], sum(chromosome))
+        self.assertListEqual(fitnesses[:3], [fitnesses[0]] * 3)
+        self.assertAlmostEqual(fitnesses[3], 1.5)
+
+        ga.evaluate_population([GAIndividual(list(chromosome))])
+        self.assertEqual(operator.nb_evaluations, 2)
+        ga.clear_params()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+from sp.core.heuristic import nsgaii
+from sp.system_controller.optimizer.moga.ga_operator import preferred_dominates
+import math
+import random
+import unittest
+
+
+class NSGAIITestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        values = [0.0, 1.0, 2.0, math.inf]
+        fitnesses = []
+        for _ in range(60):
+            fitness = [random.choice(values) if random.random() < 0.5 else random.random() for _ in range(3)]
+            fitnesses.append(fitness)
+        cls.fitnesses = fitnesses
+
+    def test_dominance_matrix(self):
+        fitnesses = self.fitnesses
+        for dominance_func in [nsgaii.pareto_dominates, preferred_dominates, lambda f_1, f_2: f_1 < f_2]:
+            dominates = nsgaii.dominance_matrix(fitnesses, dominance_func)
+            for (p, fit_p) in enumerate(fitnesses):
+                for (q, fit_q) in enumerate(fitnesses):
+                    expected = p != q and dominance_func(fit_p, fit_q)
+                    self.assertEqual(dominates[p, q], expected)
+
+            other_fitnesses = fitnesses[:10]
+            dominates = nsgaii.dominance_matrix(fitnesses, dominance_func, other_fitnesses)
+            self.assertEqual(dominates.shape, (len(fitnesses), len(other_fitnesses)))
+            for (p, fit_p) in enumerate(fitnesses):
+                for (q, fit_q) in enumerate(other_fitnesses):
+                    self.assertEqual(dominates[p, q], dominance_func(fit_p, fit_q))
+
+    def test_non_dominated_sort(self):
+        fitnesses = self.fitnesses
+        for dominance_func in [nsgaii.pareto_dominates, preferred_dominates]:
+            fronts, rank = nsgaii.fast_non_dominated_sort(fitnesses, dominance_func)
+            self.assertEqual(sum(map(len, fronts)), len(fitnesses))
+
+            for (index, front) in enumerate(fronts):
+                for p in front:
+                    self.assertEqual(rank[p], index)
+                    for (q, fit_q) in enumerate(fitnesses):
+                        # An individual is only dominated by individuals of previous fronts
+                        if dominance_func(fit_q, fitnesses[p]):
+                            self.assertLess(rank[q], index)
+                    if index > 0:
+                        self.assertTrue(any(dominance_func(fitnesses[q], fitnesses[p]) for q in fronts[index - 1]))
+
+    def test_crowding_distance(self):
+        fitnesses = [[0.0, 4.0], [1.0, 3.0], [2.0, 1.0], [4.0, 0.0], [3.0, 3.0], [5.0, 5.0]]
+        fronts = [[0, 1, 2, 3], [4], [5]]
+        distances = nsgaii.crowding_distance(fitnesses, fronts)
+        self.assertEqual(distances[0], nsgaii.MAX_CRWD_DIST)
+        self.assertEqual(distances[3], nsgaii.MAX_CRWD_DIST)
+        self.assertAlmostEqual(distances[1], 2.0 / 5.0 + 3.0 / 5.0)
+        self.assertAlmostEqual(distances[2], 3.0 / 5.0 + 3.0 / 5.0)
+        self.assertEqual(distances[4], nsgaii.MAX_CRWD_DIST)
+        self.assertEqual(distances[5], nsgaii.MAX_CRWD_DIST)
+
+    def test_sort_by_rank_and_crowding(self):
+        rank = [1, 0, 1, 0, 2]
+        crwd_dist = [0.5, math.inf, 2.0, 0.1, 0.0]
+        self.assertListEqual(nsgaii.sort_by_rank_and_crowding(rank, crwd_dist), [1, 3, 2, 0, 4])
+        self.assertListEqual(nsgaii.sort_by_rank_and_crowding(rank, crwd_dist, descending_crowding=False),
+                             [3, 1, 0, 2, 4])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 from sp.core.geometry.point.cartesian import CartesianPoint
 from sp.core.geometry.point.gps import GpsPoint
+from sp.core.geometry.point import gps
 import unittest
 
 
@@ -122,6 +123,43 @@ class PointTestCase(unittest.TestCase):
         self.assertEqual(round(inter_p.lat, 3), round(inter_values[GpsPoint.LAT_INDEX], 3))
         self.assertEqual(round(inter_p.lon, 3), round(inter_values[GpsPoint.LON_INDEX], 3))
 
+    def test_gps_distance_methods(self):
+        points = [GpsPoint(lat=37.75134, lon=-122.39488), GpsPoint(lat=37.75199, lon=-122.3946),
+                  GpsPoint(lat=37.78435, lon=-122.4126), GpsPoint(lat=-33.86785, lon=151.20732)]
+        matrix = gps.calc_distance_matrix(points)
+        equirect_matrix = gps.calc_distance_matrix(points[:3], method=gps.EQUIRECTANGULAR)
+        self.assertEqual(matrix.shape, (len(points), len(points)))
+        for (i_1, p_1) in enumerate(points):
+            for (i_2, p_2) in enumerate(points):
+                dist = p_1.distance(p_2)
+                self.assertAlmostEqual(matrix[i_1, i_2], dist, places=4)
+                if i_1 < 3 and i_2 < 3:
+                    self.assertAlmostEqual(equirect_matrix[i_1, i_2], dist, delta=1e-4 * dist + 1e-6)
+
+        p_1 = GpsPoint(lat=37.75134, lon=-122.39488)
+        p_2 = GpsPoint(lat=-33.86785, lon=151.20732)
+        p_1.distance_method = gps.HAVERSINE
+        self.assertAlmostEqual(p_1.distance(p_2), points[0].distance(p_2), places=4)
+        for fraction in [0.0, 0.3, 1.0]:
+            inter_p = p_1.intermediate(p_2, fraction)
+            expected_p = points[0].intermediate(p_2, fraction)
+            self.assertAlmostEqual(inter_p.lat, expected_p.lat, places=9)
+            self.assertAlmostEqual(inter_p.lon, expected_p.lon, places=9)
+
+        with self.assertRaises(ValueError):
+            gps.calc_distances(p_1.lon_lat, p_2.lon_lat, method="invalid")
+
+        # Intermediate points across the antimeridian follow the shortest arc
+        p_1 = GpsPoint(lat=10.0, lon=179.5)
+        p_2 = GpsPoint(lat=10.0, lon=-179.5)
+        p_1.distance_method = gps.EQUIRECTANGULAR
+        for (fraction, lon) in [(0.0, 179.5), (0.25, 179.75), (0.75, -179.75), (1.0, -179.5)]:
+            inter_p = p_1.intermediate(p_2, fraction)
+            self.assertAlmostEqual(inter_p.lon, lon, places=9)
+            self.assertAlmostEqual(inter_p.lat, 10.0, places=9)
+        inter_p = p_1.intermediate(p_2, 0.5)
+        self.assertAlmostEqual(p_1.distance(inter_p), p_1.distance(p_2) / 2.0, places=4)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,52 @@
+from sp.core.geometry import SpatialIndex, GpsPoint, CartesianPoint
+import math
+import random
+import unittest
+
+
+def linear_nearest(nodes, point, max_distance=math.inf, distance_tolerance=0.0):
+    nearest = None
+    min_dist = math.inf
+    for (index, node) in enumerate(nodes):
+        dist = point.distance(node)
+        if dist < min_dist + distance_tolerance and dist <= max_distance + distance_tolerance:
+            min_dist = dist
+            nearest = index
+    return nearest
+
+
+class SpatialIndexTestCase(unittest.TestCase):
+    def check_nearest(self, nodes, points):
+        index = SpatialIndex(nodes)
+        self.assertEqual(len(index), len(nodes))
+        for (max_distance, distance_tolerance) in [(math.inf, 0.0), (1000.0, 0.0), (1000.0, 200.0)]:
+            nearest = index.nearest(points, max_distance, distance_tolerance)
+            self.assertEqual(len(nearest), len(points))
+            for (point, node_index) in zip(points, nearest):
+                if point is None:
+                    self.assertIsNone(node_index)
+                else:
+                    expected = linear_nearest(nodes, point, max_distance, distance_tolerance)
+                    self.assertEqual(node_index, expected)
+
+    def test_gps_nearest(self):
+        random.seed(0)
+        nodes = [GpsPoint(-122.4 + random.uniform(-0.02, 0.02), 37.75 + random.uniform(-0.02, 0.02))
+                 for _ in range(20)]
+        points = [GpsPoint(-122.4 + random.uniform(-0.03, 0.03), 37.75 + random.uniform(-0.03, 0.03))
+                  for _ in range(30)]
+        self.check_nearest(nodes, points + [None])
+
+    def test_cartesian_nearest(self):
+        random.seed(0)
+        nodes = [CartesianPoint(random.uniform(0.0, 3000.0), random.uniform(0.0, 3000.0)) for _ in range(50)]
+        points = [CartesianPoint(random.uniform(-500.0, 3500.0), random.uniform(-500.0, 3500.0)) for _ in range(200)]
+        self.check_nearest(nodes, points + [None])
+
+    def test_empty(self):
+        index = SpatialIndex([])
+        self.assertListEqual(index.nearest([CartesianPoint(0.0, 0.0), None]), [None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
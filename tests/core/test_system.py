@@ -0,0 +1,56 @@
+from sp.core.model import Scenario, System
+import copy
+import json
+import math
+import unittest
+
+
+class SystemTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        filename = "tests/core/fixtures/test_scenario_from_file.json"
+        with open(filename) as json_file:
+            data = json.load(json_file)
+            cls.scenario = Scenario.from_json(data)
+
+    def create_system(self):
+        system = System()
+        system.scenario = self.scenario
+        for (index, app) in enumerate(system.apps):
+            for node in system.nodes:
+                system.app_queue_size[app.id][node.id] = index + node.id * 0.1
+                system.processing_delay[app.id][node.id] = math.inf if node.is_cloud() else 1.0
+        return system
+
+    def test_equality(self):
+        system_1 = self.create_system()
+        system_2 = self.create_system()
+        self.assertEqual(system_1, system_2)
+        self.assertEqual(system_1.fingerprint(), system_2.fingerprint())
+
+        app = system_2.apps[0]
+        node = system_2.bs_nodes[0]
+        system_2.app_queue_size[app.id][node.id] += 0.001
+        self.assertEqual(system_1, system_2)
+
+        system_2.processing_delay[app.id][node.id] = math.inf
+        self.assertNotEqual(system_1, system_2)
+        self.assertNotEqual(system_1.fingerprint(), system_2.fingerprint())
+
+        system_3 = copy.copy(system_1)
+        system_3.time += system_3.sampling_time
+        self.assertNotEqual(system_1, system_3)
+        self.assertNotEqual(system_1.fingerprint(), system_3.fingerprint())
+
+    def test_state_array(self):
+        system = self.create_system()
+        state = system.get_state_array()
+        self.assertEqual(state.shape, (2, len(system.apps), len(system.nodes)))
+        for (a, app) in enumerate(system.apps):
+            for (n, node) in enumerate(system.nodes):
+                self.assertEqual(state[0, a, n], system.get_app_queue_size(app.id, node.id))
+                self.assertEqual(state[1, a, n], system.get_processing_delay(app.id, node.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
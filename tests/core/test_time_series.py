@@ -73,3 +73,25 @@ class TimeSeriesTestCase(unittest.TestCase):
 
         self.assertEqual(ts.get_value(time_start - 1, time_tolerance=time_step), time_start)
         self.assertEqual(ts.get_value(time_end + 1, time_tolerance=time_step), time_end)
+
+    def test_interpolated_ts_lookups(self):
+        ts = InterpolatedTimeSeries()
+        for time in [8, 0, 4, 6, 2]:
+            ts.set_value(time, 2.0 * time)
+
+        times = [0.5, 1.0, 3.5, 3.9, 7.5, 1.5, 6.5, 0.1]
+        for time in times:
+            self.assertAlmostEqual(ts.get_value(time), 2.0 * time)
+        self.assertRaises(KeyError, ts.get_value, 8.5)
+        self.assertRaises(KeyError, ts.get_value, 7.0, time_tolerance=0.5)
+        self.assertEqual(ts.get_value(8.5, time_tolerance=1.0), 16.0)
+
+        ts.set_value(10, 0.0)
+        self.assertAlmostEqual(ts.get_value(9.0), 8.0)
+        ts.set_value(9, 1.0)
+        self.assertEqual(ts.get_value(9.0), 1.0)
+        self.assertAlmostEqual(ts.get_value(8.5), 8.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+from sp.core.geometry import GpsPoint, CartesianPoint
+from sp.core.mobility import TraceStore, TraceMobility
+from sp.core.mobility.time_series import TimeSeriesMobility
+from sp.core.mobility.trace_store import get_users_position
+from sp.core.model import User
+import os
+import random
+import tempfile
+import unittest
+
+
+class TraceStoreTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        random.seed(0)
+        users = []
+        for user_id in range(10):
+            user = User()
+            user.id = 10 - user_id
+            user.mobility = TimeSeriesMobility()
+            for _ in range(random.randint(1, 8)):
+                time = random.choice(range(0, 100, 5))
+                position = GpsPoint(-122.4 + random.uniform(-0.05, 0.05), 37.75 + random.uniform(-0.05, 0.05))
+                user.mobility.set_value(time, position)
+            users.append(user)
+        cls.users = users
+
+    def create_store_users(self, store):
+        store_users = []
+        for user in self.users:
+            store_user = User()
+            store_user.id = user.id
+            store_user.mobility = store.get_mobility(user.id)
+            store_users.append(store_user)
+        return store_users
+
+    def check_positions(self, store):
+        store_users = self.create_store_users(store)
+        times = [-10.0, 0.0, 2.5, 5.0, 31.0, 47.5, 99.0, 120.0]
+        for time in times:
+            for time_tolerance in [None, 0.0, 2.0, 10.0]:
+                positions = get_users_position(store_users, time, time_tolerance=time_tolerance)
+                for (user, store_user, position) in zip(self.users, store_users, positions):
+                    expected = user.get_position(time, time_tolerance=time_tolerance)
+                    self.assertIsInstance(store_user.mobility, TraceMobility)
+                    for value in [position, store_user.get_position(time, time_tolerance=time_tolerance)]:
+                        if expected is None:
+                            self.assertIsNone(value)
+                        else:
+                            self.assertIsInstance(value, GpsPoint)
+                            self.assertAlmostEqual(value.lon, expected.lon, places=9)
+                            self.assertAlmostEqual(value.lat, expected.lat, places=9)
+
+    def test_positions(self):
+        store = TraceStore.from_users(self.users)
+        self.assertEqual(len(store), len(self.users))
+        self.assertListEqual(list(store.users_id), sorted(user.id for user in self.users))
+        self.assertNotIn(0, store)
+        self.assertRaises(KeyError, store.get_mobility, 0)
+        self.check_positions(store)
+
+    def test_save_load(self):
+        store = TraceStore.from_users(self.users)
+        with tempfile.TemporaryDirectory() as path:
+            for filename in ["traces.npz", "traces"]:
+                filename = os.path.join(path, filename)
+                store.save(filename)
+                loaded_store = TraceStore.load(filename, mmap_mode="r")
+                self.assertEqual(loaded_store.coord, store.coord)
+                self.check_positions(loaded_store)
+
+    def test_from_arrays(self):
+        store = TraceStore.from_arrays(users_id=[1, 0, 1, 1], times=[10, 0, 0, 10],
+                                       values=[[1.0, 1.0], [5.0, 5.0], [0.0, 0.0], [2.0, 4.0]], coord="cartesian")
+        self.assertListEqual(list(store.offsets), [0, 1, 3])
+        position = store.get_position(1, 5.0)
+        self.assertIsInstance(position, CartesianPoint)
+        self.assertListEqual(list(position.values), [1.0, 2.0])
+        self.assertIsNone(store.get_position(0, 5.0, time_tolerance=1.0))
+        self.assertIsNone(store.get_position(0, 5.0))
+        self.assertListEqual(list(store.get_position(0, 5.0, time_tolerance=5.0).values), [5.0, 5.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
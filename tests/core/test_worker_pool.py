@@ -0,0 +1,45 @@
+from sp.core.util.worker_pool import WorkerPool
+import os
+import unittest
+
+
+def _scale(context, item):
+    return context * item
+
+
+def _pid(context, item):
+    return os.getpid()
+
+
+class WorkerPoolTestCase(unittest.TestCase):
+    def test_serial(self):
+        pool = WorkerPool(pool_size=0)
+        key = pool.set_context(2)
+        self.assertFalse(pool.is_parallel)
+        self.assertListEqual(pool.map(_scale, [1, 2, 3], key), [2, 4, 6])
+        pool.release_context(key)
+        pool.close()
+
+    def test_persistent_workers(self):
+        pool = WorkerPool(pool_size=2)
+        key_1 = pool.set_context(2)
+        if not pool.is_parallel:
+            self.skipTest("fork is not available")
+
+        items = list(range(20))
+        self.assertListEqual(pool.map(_scale, items, key_1), [2 * i for i in items])
+        pids = set(pool.map(_pid, items, key_1))
+        pool.release_context(key_1)
+
+        key_2 = pool.set_context(3)
+        self.assertNotEqual(key_1, key_2)
+        self.assertListEqual(pool.map(_scale, items, key_2), [3 * i for i in items])
+        self.assertTrue(set(pool.map(_pid, items, key_2)).issubset(pids))
+        self.assertNotIn(os.getpid(), pids)
+        pool.release_context(key_2)
+        pool.close()
+        self.assertFalse(pool.is_parallel)
+
+
+if __name__ == '__main__':
+    unittest.main()
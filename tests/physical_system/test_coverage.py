@@ -1,7 +1,9 @@
-from sp.core.model import Scenario, System, EnvironmentInput
+from sp.core.model import Scenario, System, EnvironmentInput, UserAttachments
 from sp.physical_system.coverage.circle import CircleCoverage
 from sp.physical_system.coverage.min_distance import MinDistanceCoverage
+import copy
 import json
+import pickle
 import unittest
 
 
@@ -83,6 +85,54 @@ class CoverageTestCase(unittest.TestCase):
         for app in self.system.apps:
             self.assertEqual(self.environment_input.get_nb_users(app_id=app.id), count[app.id])
 
+    def test_user_attachments(self):
+        cov = CircleCoverage(radius=1000)
+        attached_users = cov.update(self.system, self.environment_input)
+        self.assertIsInstance(attached_users, UserAttachments)
+
+        def count_users(users, app_id=None, node_id=None):
+            return sum(1 for u in users.values()
+                       if (app_id is None or u.app_id == app_id) and (node_id is None or u.node_id == node_id))
+
+        apps_id = [None] + [app.id for app in self.system.apps]
+        nodes_id = [None] + [node.id for node in self.system.nodes]
+        for users in [attached_users, copy.copy(attached_users), pickle.loads(pickle.dumps(attached_users))]:
+            self.assertEqual(len(users), len(self.system.users))
+            for app_id in apps_id:
+                for node_id in nodes_id:
+                    self.assertEqual(users.get_nb_users(app_id, node_id), count_users(users, app_id, node_id))
+
+        user = next(u for u in attached_users.values() if u.node_id is not None)
+        nb_users = attached_users.get_nb_users(user.app_id, user.node_id)
+        del attached_users[user.id]
+        self.assertEqual(attached_users.get_nb_users(user.app_id, user.node_id), nb_users - 1)
+        attached_users[user.id] = user
+        attached_users[user.id] = user
+        self.assertEqual(attached_users.get_nb_users(user.app_id, user.node_id), nb_users)
+
+        def check_counts(users):
+            for app_id in apps_id:
+                for node_id in nodes_id:
+                    self.assertEqual(users.get_nb_users(app_id, node_id), count_users(users, app_id, node_id))
+
+        users = list(attached_users.values())
+        self.assertIs(attached_users.pop(user.id), user)
+        self.assertIsNone(attached_users.pop(user.id, None))
+        self.assertRaises(KeyError, attached_users.pop, user.id)
+        check_counts(attached_users)
+        self.assertIs(attached_users.setdefault(user.id, user), user)
+        self.assertIs(attached_users.setdefault(user.id, None), user)
+        check_counts(attached_users)
+        attached_users.popitem()
+        check_counts(attached_users)
+        attached_users.clear()
+        self.assertEqual(attached_users.get_nb_users(), 0)
+        check_counts(attached_users)
+        attached_users.update({u.id: u for u in users[:3]})
+        attached_users.update([(u.id, u) for u in users[3:]])
+        self.assertEqual(len(attached_users), len(users))
+        check_counts(attached_users)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,4 +1,4 @@
-from sp.core.model import Scenario, System, EnvironmentInput
+from sp.core.model import Scenario, System, EnvironmentInput, ArrayEnvironmentInput, NetPathTable
 from sp.physical_system import EnvironmentController
 from sp.physical_system.routing.shortest_path import Routing, ShortestPathRouting
 from sp.physical_system.coverage import Coverage
@@ -78,6 +78,37 @@ class EnvControlTestCase(unittest.TestCase):
                             self.assertGreater(delay, 0.0)
                             self.assertGreater(len(path), 0.0)
 
+    def test_array_env(self):
+        control = EnvironmentController()
+        control.init_params()
+
+        self.system.time = 0
+        env_input = control.update(self.system)
+        self.assertIsInstance(env_input, ArrayEnvironmentInput)
+        self.assertIsInstance(env_input.net_path, NetPathTable)
+
+        paths = control.routing.get_all_paths()
+        distances = control.routing.get_all_paths_length()
+        for app in self.system.apps:
+            for src_node in self.system.nodes:
+                for dst_node in self.system.nodes:
+                    self.assertListEqual(env_input.get_net_path(app.id, src_node.id, dst_node.id),
+                                         paths[app.id][src_node.id][dst_node.id])
+                    self.assertListEqual(env_input.net_path[app.id][src_node.id][dst_node.id],
+                                         paths[app.id][src_node.id][dst_node.id])
+                    self.assertEqual(env_input.get_net_delay(app.id, src_node.id, dst_node.id),
+                                     distances[app.id][src_node.id][dst_node.id])
+
+        self.system.time = 1
+        next_env_input = control.update(self.system)
+        self.assertIs(next_env_input.net_path, env_input.net_path)
+        self.assertFalse(env_input.net_path.indices.flags.writeable)
+
+        array_env = ArrayEnvironmentInput.from_environment_input(env_input, self.system)
+        self.assertIs(array_env.net_path, env_input.net_path)
+        self.assertTrue((array_env.delay == env_input.delay).all())
+        self.assertTrue((array_env.load == env_input.load).all())
+
 
 if __name__ == '__main__':
     unittest.main()
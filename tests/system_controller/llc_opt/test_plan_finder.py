@@ -0,0 +1,192 @@
+from sp.core.model import Scenario, System
+from sp.system_controller.estimator.system import DefaultSystemEstimator
+from sp.physical_system.environment_controller import EnvironmentController
+from sp.system_controller.optimizer.llc.plan_finder import BeamPlanFinder, get_decoder
+from sp.system_controller.optimizer.llc.plan_finder.beam import BeamNode, _sort_beam_nodes
+from sp.system_controller.optimizer.moga import MOGAOperator, preferred_dominates
+from sp.system_controller.optimizer.soga import indiv_gen
+from sp.system_controller.metric import deadline, cost, migration
+import copy
+import json
+import unittest
+
+
+def load_system():
+    filename = "tests/system_controller/fixtures/test_llc_opt.json"
+    system = None
+    with open(filename) as json_file:
+        data = json.load(json_file)
+        system = System()
+        system.scenario = Scenario.from_json(data)
+
+    env_ctl = EnvironmentController()
+    env_ctl.init_params()
+    env_inputs = []
+    for time in range(3):
+        system.time = time
+        env_inputs.append(env_ctl.update(system))
+
+    system.time = 0
+    system.environment_input = env_inputs[0]
+    return system, env_inputs
+
+
+def create_control_inputs(system, environment_input):
+    ga_operator = MOGAOperator(objective=None, system=system, environment_input=environment_input)
+    return [
+        indiv_gen.create_individual_cloud(ga_operator),
+        indiv_gen.create_individual_net_delay(ga_operator),
+        indiv_gen.create_individual_deadline(ga_operator),
+        indiv_gen.create_individual_load(ga_operator)
+    ]
+
+
+class BeamPlanFinderTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.system, cls.environment_inputs = load_system()
+        cls.control_inputs = create_control_inputs(cls.system, cls.environment_inputs[0])
+        cls.objective = [
+            deadline.max_deadline_violation,
+            cost.overall_cost,
+            migration.overall_migration_cost
+        ]
+
+    def create_plan_finder(self, pool_size):
+        return BeamPlanFinder(system=self.system,
+                              environment_inputs=self.environment_inputs,
+                              objective=self.objective,
+                              objective_aggregator=sum,
+                              system_estimator=DefaultSystemEstimator(),
+                              dominance_func=preferred_dominates,
+                              pool_size=pool_size,
+                              beam_width=3,
+                              prune=True)
+
+    def solve_one_at_a_time(self, plan_finder):
+        beam_node = BeamNode()
+        beam_node.system = self.system
+        beam_nodes = [beam_node]
+        for seq_index in range(plan_finder.sequence_length):
+            next_beam_nodes = []
+            next_fingerprints = set()
+            for beam_node in beam_nodes:
+                for control_input in self.control_inputs:
+                    next_system, fitness, fingerprint = plan_finder.expand(beam_node.system, seq_index, control_input)
+                    if fingerprint in next_fingerprints:
+                        continue
+                    next_fingerprints.add(fingerprint)
+
+                    next_beam_node = BeamNode()
+                    next_beam_node.parent = beam_node
+                    next_beam_node.system = next_system
+                    next_beam_node.control_input = control_input
+                    next_beam_node.fitness = fitness
+                    next_beam_nodes.append(next_beam_node)
+
+            next_beam_nodes = _sort_beam_nodes(next_beam_nodes, sum, preferred_dominates)
+            beam_nodes = next_beam_nodes[:plan_finder.beam_width]
+        return [bn.create_plan(sum) for bn in beam_nodes]
+
+    def assert_plans_equal(self, plans_1, plans_2):
+        self.assertEqual(len(plans_1), len(plans_2))
+        for (plan_1, plan_2) in zip(plans_1, plans_2):
+            self.assertEqual(len(plan_1), len(plan_2))
+            for (control_1, control_2) in zip(plan_1, plan_2):
+                self.assertListEqual(list(control_1), list(control_2))
+            for (value_1, value_2) in zip(plan_1.fitness, plan_2.fitness):
+                self.assertAlmostEqual(value_1, value_2)
+
+    def test_solve(self):
+        plans = {}
+        for pool_size in [0, 2]:
+            plan_finder = self.create_plan_finder(pool_size)
+            plans[pool_size] = plan_finder.solve(self.control_inputs)
+            self.assertEqual(plan_finder._pool.is_parallel, pool_size > 0)
+            plan_finder.clear_params()
+
+        self.assertGreater(len(plans[0]), 0)
+        for plan in plans[0]:
+            self.assertEqual(len(plan), len(self.environment_inputs))
+            self.assertEqual(len(plan.fitness), len(self.objective))
+        self.assert_plans_equal(plans[0], plans[2])
+        self.assert_plans_equal(plans[0], self.solve_one_at_a_time(self.create_plan_finder(0)))
+
+
+class CountingSystemEstimator(DefaultSystemEstimator):
+    def __init__(self):
+        DefaultSystemEstimator.__init__(self)
+        self.nb_calls = 0
+
+    def calc(self, system, control_input, environment_input):
+        self.nb_calls += 1
+        return DefaultSystemEstimator.calc(self, system, control_input, environment_input)
+
+
+class PrefixCacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.system, cls.environment_inputs = load_system()
+        cls.control_inputs = create_control_inputs(cls.system, cls.environment_inputs[0])
+        cls.objective = [
+            deadline.max_deadline_violation,
+            cost.overall_cost,
+            migration.overall_migration_cost
+        ]
+
+    def create_plan_finder(self, prefix_cache_size):
+        return BeamPlanFinder(system=self.system,
+                              environment_inputs=self.environment_inputs,
+                              objective=self.objective,
+                              objective_aggregator=sum,
+                              system_estimator=CountingSystemEstimator(),
+                              dominance_func=preferred_dominates,
+                              prefix_cache_size=prefix_cache_size)
+
+    def test_create_plan(self):
+        cloud, net_delay, deadline_indiv, load = self.control_inputs
+        sequences = [
+            [cloud, net_delay, deadline_indiv],
+            [cloud, net_delay, load],
+            [cloud, load, load],
+        ]
+        plans = {}
+        for prefix_cache_size in [0, 100]:
+            plan_finder = self.create_plan_finder(prefix_cache_size)
+            plans[prefix_cache_size] = [plan_finder.create_plan(sequence) for sequence in sequences]
+            nb_stages = 3 + 3 + 3 if prefix_cache_size == 0 else 3 + 1 + 2
+            self.assertEqual(plan_finder.system_estimator.nb_calls, nb_stages)
+
+        for (plan, cached_plan) in zip(plans[0], plans[100]):
+            self.assertListEqual(plan.fitness, cached_plan.fitness)
+
+
+class DecoderCacheTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.system, cls.environment_inputs = load_system()
+
+    def test_get_decoder(self):
+        system = copy.copy(self.system)
+        env_input = self.environment_inputs[0]
+        decoder = get_decoder(system, env_input)
+        self.assertIs(decoder.system, system)
+        self.assertIs(decoder.environment_input, env_input)
+        self.assertIs(get_decoder(system, env_input), decoder)
+
+        self.assertIsNot(get_decoder(system, self.environment_inputs[1]), decoder)
+        self.assertIsNot(get_decoder(copy.copy(system), env_input), decoder)
+        self.assertIsNot(get_decoder(system, env_input, load_chunk_distribution=0.5), decoder)
+
+        system.time = 1
+        time_decoder = get_decoder(system, env_input)
+        self.assertIsNot(time_decoder, decoder)
+
+        system.control_input = decoder.decode(indiv_gen.create_individual_cloud(decoder))
+        control_decoder = get_decoder(system, env_input)
+        self.assertIsNot(control_decoder, time_decoder)
+        self.assertIs(get_decoder(system, env_input), control_decoder)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,4 @@
-from sp.core.model import Scenario, Node, System, EnvironmentInput
+from sp.core.model import Scenario, Node, System, EnvironmentInput, ArrayEnvironmentInput
 from sp.system_controller.estimator.system import DefaultSystemEstimator
 from sp.physical_system.environment_controller import EnvironmentController
 from sp.system_controller import util
@@ -81,6 +81,23 @@ class CalcUtilTestCase(unittest.TestCase):
                         else:
                             self.assertGreater(net_delay, 0.0)
 
+    def test_calc_network_delays(self):
+        for time in range(self.time_duration + 1):
+            system = self.systems[time]
+            env_input = self.environment_inputs[time]
+            array_env_input = ArrayEnvironmentInput.from_environment_input(env_input, system)
+            reversed_nodes = list(reversed(system.nodes))
+
+            for (apps, nodes) in [(None, None), (system.apps[:1], reversed_nodes)]:
+                net_delays = util.calc_network_delays(system, env_input, apps=apps, nodes=nodes)
+                array_net_delays = util.calc_network_delays(system, array_env_input, apps=apps, nodes=nodes)
+                for (a, app) in enumerate(apps or system.apps):
+                    for (s, src_node) in enumerate(nodes or system.nodes):
+                        for (d, dst_node) in enumerate(nodes or system.nodes):
+                            net_delay = env_input.get_net_delay(app.id, src_node.id, dst_node.id)
+                            self.assertEqual(net_delays[a, s, d], net_delay)
+                            self.assertEqual(array_net_delays[a, s, d], net_delay)
+
     def test_calc_initialization_delay(self):
         for time in range(self.time_duration + 1):
             system = self.systems[time]
@@ -131,6 +148,24 @@ class CalcUtilTestCase(unittest.TestCase):
                     elif curr_place and not prev_place:
                         self.assertGreater(mig_delay, 0.0)
 
+    def test_calc_min_migration_delays(self):
+        for time in range(self.time_duration + 1):
+            system = self.systems[time]
+            control_input = self.control_inputs[time]
+            env_input = self.environment_inputs[time]
+
+            for app in system.apps:
+                mig_delays, src_nodes_index = util.calc_min_migration_delays(app.id, system, control_input,
+                                                                             env_input, return_src_node_index=True)
+                self.assertEqual(len(mig_delays), len(system.nodes))
+                for dst_node in system.nodes:
+                    mig_delay, src_node_id = util.calc_min_migration_delay(app.id, dst_node.id, system,
+                                                                           control_input, env_input,
+                                                                           return_src_node_id=True)
+                    dst_index = system.nodes_index[dst_node.id]
+                    self.assertAlmostEqual(mig_delays[dst_index], mig_delay)
+                    self.assertEqual(src_nodes_index[dst_index], system.nodes_index[src_node_id])
+
     def test_calc_response_time(self):
         for time in range(self.time_duration + 1):
             system = self.systems[time]
@@ -0,0 +1,86 @@
+from sp.core.model import Scenario, System
+from sp.physical_system.environment_controller import EnvironmentController
+from sp.system_controller.optimizer.moga import MOGAOperator
+from sp.system_controller.metric import deadline, cost, migration
+from sp.system_controller.metric.engine import MetricEngine
+from sp.system_controller.util import calc_response_time, calc_load_after_distribution, calc_received_load
+from sp.system_controller.util import calc_app_size
+from sp.system_controller.estimator.processing import DefaultProcessingEstimator
+import json
+import math
+import unittest
+
+
+class MetricEngineTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        filename = "tests/system_controller/fixtures/test_dynamic_metric.json"
+        system = None
+        with open(filename) as json_file:
+            data = json.load(json_file)
+            system = System()
+            system.scenario = Scenario.from_json(data)
+
+        system.time = 0
+        env_ctl = EnvironmentController()
+        env_ctl.init_params()
+        environment_input = env_ctl.update(system)
+
+        ga_operator = MOGAOperator(objective=None, system=system, environment_input=environment_input,
+                                   use_heuristic=False)
+        system.control_input = ga_operator.decode(ga_operator.rand_individual())
+
+        cls.system = system
+        cls.environment_input = environment_input
+        cls.ga_operator = ga_operator
+
+    def test_flows(self):
+        solution = self.ga_operator.decode(self.ga_operator.rand_individual())
+        engine = MetricEngine(self.system, solution, self.environment_input)
+
+        for (a, app) in enumerate(self.system.apps):
+            for (d, dst_node) in enumerate(self.system.nodes):
+                load = calc_received_load(app.id, dst_node.id, self.system, solution, self.environment_input)
+                self.assertAlmostEqual(engine.received_load[a, d], load)
+                for (s, src_node) in enumerate(self.system.nodes):
+                    load = calc_load_after_distribution(app.id, src_node.id, dst_node.id,
+                                                        self.system, solution, self.environment_input)
+                    self.assertAlmostEqual(engine.flow_load[a, s, d], load)
+                    if not engine.flow_mask[a, s, d]:
+                        continue
+                    rt = calc_response_time(app.id, src_node.id, dst_node.id,
+                                            self.system, solution, self.environment_input)
+                    if math.isinf(rt):
+                        self.assertEqual(engine.response_time[a, s, d], rt)
+                    else:
+                        self.assertAlmostEqual(engine.response_time[a, s, d], rt)
+
+    def test_shared_results(self):
+        solution = self.ga_operator.decode(self.ga_operator.rand_individual())
+        engine = MetricEngine(self.system, solution, self.environment_input)
+        proc_estimator = DefaultProcessingEstimator()
+
+        for (a, app) in enumerate(self.system.apps):
+            for (n, node) in enumerate(self.system.nodes):
+                size = calc_app_size(app.id, node.id, self.system, solution, self.environment_input)
+                self.assertAlmostEqual(engine.app_size[a, n], size)
+
+                result = engine.get_processing_result(app.id, node.id)
+                expected = proc_estimator(app.id, node.id, self.system, solution, self.environment_input)
+                self.assertAlmostEqual(result.arrival_rate, expected.arrival_rate)
+                self.assertAlmostEqual(result.service_rate, expected.service_rate)
+                self.assertEqual(result.queue_size, expected.queue_size)
+
+    def test_evaluate(self):
+        objective = [deadline.weighted_avg_deadline_violation, cost.overall_cost, migration.weighted_migration_rate]
+        for _ in range(5):
+            solution = self.ga_operator.decode(self.ga_operator.rand_individual())
+            engine = MetricEngine(self.system, solution, self.environment_input)
+            values = engine.evaluate(objective)
+            expected = [f(self.system, solution, self.environment_input) for f in objective]
+            self.assertListEqual(values, expected)
+            self.assertIs(MetricEngine.create(self.system, solution, self.environment_input, engine=engine), engine)
+
+
+if __name__ == '__main__':
+    unittest.main()
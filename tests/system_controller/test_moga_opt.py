@@ -3,7 +3,7 @@ from sp.physical_system.environment_controller import EnvironmentController
 from sp.system_controller.model import OptSolution
 from sp.system_controller.metric import deadline, availability, power, cost
 from sp.system_controller.util import is_solution_valid
-from sp.system_controller.optimizer.moga import MOGAOptimizer
+from sp.system_controller.optimizer.moga import MOGAOptimizer, MOGAOperator
 from sp.system_controller.optimizer.cloud import CloudOptimizer
 import json
 import math
@@ -61,6 +61,38 @@ class MOGAOptTestCase(unittest.TestCase):
         cloud_value = deadline.max_deadline_violation(self.system, cloud_solution, self.environment_input)
         self.assertLessEqual(soga_value, cloud_value)
 
+    def test_decode(self):
+        ga_operator = MOGAOperator(objective=self.metrics, system=self.system,
+                                   environment_input=self.environment_input)
+        population = ga_operator.first_population() + [ga_operator.rand_individual() for _ in range(20)]
+        for indiv in population:
+            solution = ga_operator.decode(indiv)
+            self.assertTrue(is_solution_valid(self.system, solution, self.environment_input))
+            for node in self.system.nodes:
+                for resource in self.system.resources:
+                    usage = sum(solution.allocated_resource[app.id][node.id][resource.name]
+                                for app in self.system.apps)
+                    self.assertLessEqual(usage, node.capacity[resource.name])
+
+    def test_delay_tables(self):
+        ga_operator = MOGAOperator(objective=self.metrics, system=self.system,
+                                   environment_input=self.environment_input)
+        net_delay, init_delay = ga_operator.build_delay_tables()
+        nb_apps, nb_nodes = len(self.system.apps), len(self.system.nodes)
+        self.assertEqual(net_delay.shape, (nb_apps, nb_nodes, nb_nodes))
+        self.assertEqual(init_delay.shape, (nb_apps, nb_nodes))
+        self.assertFalse(net_delay.flags.writeable)
+
+        for app in self.system.apps:
+            a_index = self.system.apps_index[app.id]
+            for src_node in self.system.nodes:
+                s_index = self.system.nodes_index[src_node.id]
+                for dst_node in self.system.nodes:
+                    d_index = self.system.nodes_index[dst_node.id]
+                    delay = self.environment_input.get_net_delay(app.id, src_node.id, dst_node.id)
+                    self.assertEqual(net_delay[a_index, s_index, d_index], delay)
+        self.assertTrue((init_delay >= 0.0).all())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,169 @@
+from sp.core.model import Scenario, System, Resource
+from sp.physical_system.environment_controller import EnvironmentController
+from sp.system_controller.model import OptSolution, ArrayOptSolution
+from sp.system_controller.optimizer.moga import MOGAOperator
+from sp.system_controller import util
+import json
+import unittest
+
+
+class ArrayOptSolutionTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        filename = "tests/system_controller/fixtures/test_util.json"
+        system = None
+        with open(filename) as json_file:
+            data = json.load(json_file)
+            system = System()
+            system.scenario = Scenario.from_json(data)
+        system.time = 0
+        cls.system = system
+
+        env_ctl = EnvironmentController()
+        env_ctl.init_params()
+        cls.environment_input = env_ctl.update(system)
+
+    def test_create_empty(self):
+        solution = ArrayOptSolution.create_empty(self.system)
+        self.assertIsInstance(solution, OptSolution)
+
+        nb_apps = len(self.system.apps)
+        nb_nodes = len(self.system.nodes)
+        nb_resources = len(self.system.resources)
+        self.assertEqual(solution.placement.shape, (nb_apps, nb_nodes))
+        self.assertEqual(solution.alloc.shape, (nb_apps, nb_nodes, nb_resources))
+        self.assertEqual(solution.ld.shape, (nb_apps, nb_nodes, nb_nodes))
+        self.assertEqual(solution.rl.shape, (nb_apps, nb_nodes))
+
+        for app in self.system.apps:
+            for node in self.system.nodes:
+                self.assertFalse(solution.get_app_placement(app.id, node.id))
+                self.assertEqual(solution.get_received_load(app.id, node.id), 0.0)
+                for resource in self.system.resources:
+                    self.assertEqual(solution.get_allocated_resource(app.id, node.id, resource.name), 0.0)
+
+    def test_views(self):
+        solution = ArrayOptSolution.create_empty(self.system)
+        app = self.system.apps[0]
+        cloud_node = self.system.cloud_node
+        a_index = self.system.apps_index[app.id]
+        n_index = self.system.nodes_index[cloud_node.id]
+        r_index = self.system.resources_index[Resource.CPU]
+
+        solution.app_placement[app.id][cloud_node.id] = True
+        solution.allocated_resource[app.id][cloud_node.id][Resource.CPU] = 2.0
+        solution.received_load[app.id][cloud_node.id] += 1.5
+        for src_node in self.system.nodes:
+            solution.load_distribution[app.id][src_node.id][cloud_node.id] = 1.0
+
+        self.assertTrue(solution.placement[a_index, n_index])
+        self.assertEqual(solution.alloc[a_index, n_index, r_index], 2.0)
+        self.assertEqual(solution.rl[a_index, n_index], 1.5)
+        self.assertEqual(solution.ld[a_index, :, n_index].sum(), len(self.system.nodes))
+
+        self.assertIs(solution.get_app_placement(app.id, cloud_node.id), True)
+        self.assertEqual(solution.get_allocated_cpu(app.id, cloud_node.id), 2.0)
+        self.assertEqual(solution.get_received_load(app.id, cloud_node.id), 1.5)
+        self.assertEqual(set(solution.allocated_resource[app.id][cloud_node.id].keys()),
+                         set(self.system.resources_name))
+
+        with self.assertRaises(KeyError):
+            solution.app_placement[app.id][-1] = True
+
+    def test_feasibility(self):
+        solution = ArrayOptSolution.create_empty(self.system)
+        self.assertFalse(util.is_solution_valid(self.system, solution, self.environment_input))
+
+        cloud_node = self.system.cloud_node
+        for app in self.system.apps:
+            solution.app_placement[app.id][cloud_node.id] = True
+            for src_node in self.system.nodes:
+                solution.load_distribution[app.id][src_node.id][cloud_node.id] = 1.0
+        solution = util.alloc_demanded_resources(self.system, solution, self.environment_input)
+        self.assertTrue(util.is_solution_valid(self.system, solution, self.environment_input))
+
+    def test_make_feasible(self):
+        ga_operator = MOGAOperator(objective=None,
+                                   system=self.system,
+                                   environment_input=self.environment_input,
+                                   use_heuristic=False)
+        for remove_cloud in [False, True]:
+            solution = ga_operator.decode(ga_operator.rand_individual())
+            for app in self.system.apps:
+                for node in self.system.nodes:
+                    solution.app_placement[app.id][node.id] = not solution.app_placement[app.id][node.id]
+                if remove_cloud:
+                    solution.app_placement[app.id][self.system.cloud_node.id] = False
+            solution.ld *= 0.5
+
+            dict_solution = OptSolution.create_empty(self.system)
+            for app in self.system.apps:
+                for src_node in self.system.nodes:
+                    dict_solution.app_placement[app.id][src_node.id] = solution.get_app_placement(app.id, src_node.id)
+                    dict_solution.received_load[app.id][src_node.id] = solution.get_received_load(app.id, src_node.id)
+                    for resource in self.system.resources:
+                        value = solution.get_allocated_resource(app.id, src_node.id, resource.name)
+                        dict_solution.allocated_resource[app.id][src_node.id][resource.name] = value
+                    for dst_node in self.system.nodes:
+                        value = solution.get_load_distribution(app.id, src_node.id, dst_node.id)
+                        dict_solution.load_distribution[app.id][src_node.id][dst_node.id] = value
+
+            solution = util.make_solution_feasible(self.system, solution, self.environment_input)
+            dict_solution = util.make_solution_feasible(self.system, dict_solution, self.environment_input)
+            self.assertIsInstance(solution, ArrayOptSolution)
+            for app in self.system.apps:
+                for src_node in self.system.nodes:
+                    self.assertEqual(solution.get_app_placement(app.id, src_node.id),
+                                     dict_solution.get_app_placement(app.id, src_node.id))
+                    self.assertAlmostEqual(solution.get_received_load(app.id, src_node.id),
+                                           dict_solution.get_received_load(app.id, src_node.id))
+                    for dst_node in self.system.nodes:
+                        self.assertAlmostEqual(solution.get_load_distribution(app.id, src_node.id, dst_node.id),
+                                               dict_solution.get_load_distribution(app.id, src_node.id, dst_node.id))
+
+    def test_load_flows(self):
+        ga_operator = MOGAOperator(objective=None,
+                                   system=self.system,
+                                   environment_input=self.environment_input,
+                                   use_heuristic=False)
+        solution = ga_operator.decode(ga_operator.rand_individual())
+        dict_solution = OptSolution.create_empty(self.system)
+        for app in self.system.apps:
+            for src_node in self.system.nodes:
+                for dst_node in self.system.nodes:
+                    ld = solution.get_load_distribution(app.id, src_node.id, dst_node.id)
+                    dict_solution.load_distribution[app.id][src_node.id][dst_node.id] = ld
+
+        for app in self.system.apps:
+            flows = solution.get_load_flows(app.id)
+            self.assertListEqual(sorted(flows), sorted(dict_solution.get_load_flows(app.id)))
+            self.assertTrue(all(ld != 0.0 for (_, _, ld) in flows))
+            for src_node in self.system.nodes:
+                src_ld = sum(ld for (src_node_id, _, ld) in flows if src_node_id == src_node.id)
+                self.assertAlmostEqual(src_ld, 1.0)
+            for src_node in self.system.nodes:
+                stored = dict_solution.load_distribution[app.id][src_node.id]
+                self.assertTrue(all(ld != 0.0 for ld in stored.values()))
+            for node in self.system.nodes:
+                sources = solution.get_load_sources(app.id, node.id)
+                self.assertListEqual(sorted(sources), sorted(dict_solution.get_load_sources(app.id, node.id)))
+                self.assertListEqual(sorted(sources), sorted((src_node_id, ld) for (src_node_id, dst_node_id, ld)
+                                                             in flows if dst_node_id == node.id))
+                for control_input in [solution, dict_solution]:
+                    load = util.calc_received_load(app.id, node.id, self.system, control_input,
+                                                   self.environment_input, use_cache=False)
+                    self.assertAlmostEqual(load, solution.get_received_load(app.id, node.id))
+
+    def test_decode(self):
+        ga_operator = MOGAOperator(objective=None,
+                                   system=self.system,
+                                   environment_input=self.environment_input,
+                                   use_heuristic=False)
+        for _ in range(10):
+            solution = ga_operator.decode(ga_operator.rand_individual())
+            self.assertIsInstance(solution, ArrayOptSolution)
+            self.assertTrue(util.is_solution_valid(self.system, solution, self.environment_input))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -57,6 +57,18 @@ class ProcEstimatorTestCase(unittest.TestCase):
                 self.assertGreater(proc_result.service_rate, proc_result.arrival_rate)
                 self.assertLess(proc_result.service_rate, math.inf)
 
+    def test_calc_all(self):
+        estimator = DefaultProcessingEstimator()
+        delay, queue_size = estimator.calc_all(self.system, self.control_input, self.environment_input)
+        self.assertEqual(delay.shape, (len(self.system.apps), len(self.system.nodes)))
+        self.assertEqual(queue_size.shape, delay.shape)
+
+        for (a, app) in enumerate(self.system.apps):
+            for (n, node) in enumerate(self.system.nodes):
+                proc_result = estimator.calc(app.id, node.id, self.system, self.control_input, self.environment_input)
+                self.assertAlmostEqual(delay[a, n], proc_result.delay)
+                self.assertAlmostEqual(queue_size[a, n], proc_result.queue_size)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,56 @@
+from sp.core.model import Scenario, System
+from sp.physical_system.environment_controller import EnvironmentController
+from sp.system_controller.model import OptSolution
+from sp.system_controller.metric import deadline, availability, cost
+from sp.system_controller.util import is_solution_valid
+from sp.system_controller.optimizer.static import StaticOptimizer
+import copy
+import json
+import unittest
+
+
+class StaticOptTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        filename = "tests/system_controller/fixtures/test_moga_opt.json"
+        system = None
+        with open(filename) as json_file:
+            data = json.load(json_file)
+            system = System()
+            system.scenario = Scenario.from_json(data)
+        cls.system = system
+        cls.env_ctl = EnvironmentController()
+
+    def test_solver(self):
+        solver = StaticOptimizer()
+        solver.objective = [
+            deadline.max_deadline_violation,
+            availability.avg_availability,
+            cost.overall_cost
+        ]
+        solver.nb_generations = 10
+        solver.population_size = 20
+        solver.pool_size = 0
+        solver.init_params()
+        self.env_ctl.init_params()
+
+        system = copy.copy(self.system)
+        system.time = 0
+        for time in range(2):
+            system.time = time
+            environment_input = self.env_ctl.update(system)
+            solution = solver.solve(system, environment_input)
+
+            self.assertIsInstance(solution, OptSolution)
+            self.assertTrue(is_solution_valid(system, solution, environment_input))
+            for app in system.apps:
+                for node in system.nodes:
+                    if solver._init_solution.get_app_placement(app.id, node.id):
+                        self.assertTrue(solution.get_app_placement(app.id, node.id))
+
+            system = copy.copy(system)
+            system.control_input = solution
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -44,6 +44,23 @@ class UtilTestCase(unittest.TestCase):
         solution = OptSolution.create_empty(self.system)
         self.assertFalse(util.is_solution_valid(self.system, solution, self.environment_input))
 
+    def test_solution_violations(self):
+        opt = CloudOptimizer()
+        solution = opt.solve(self.system, self.environment_input)
+        self.assertListEqual(util.find_solution_violations(self.system, solution, self.environment_input), [])
+
+        app = self.system.apps[0]
+        cloud_node = self.system.cloud_node
+        bs_node = self.system.bs_nodes[0]
+        solution.load_distribution[app.id][bs_node.id][cloud_node.id] = 0.5
+        solution.allocated_resource[app.id][bs_node.id]["CPU"] = 1.0
+        violations = util.find_solution_violations(self.system, solution, self.environment_input)
+        self.assertTrue(any("aren't completely distributed" in v for v in violations))
+        self.assertTrue(any("Invalid resource allocation" in v for v in violations))
+        self.assertTrue(any("Invalid received load" in v for v in violations))
+        self.assertEqual(sum("Invalid allocated resource for" in v for v in violations), len(self.system.resources))
+        self.assertFalse(util.is_solution_valid(self.system, solution, self.environment_input))
+
     def test_alloc_resource(self):
         solution = OptSolution.create_empty(self.system)
         cloud_node = self.system.cloud_node